@@ -1,13 +1,23 @@
 import requests
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 import subprocess
+import argparse
+import gzip
+import hashlib
 import math
-import itertools
 import os
+import queue
 import re
+import time
+import shutil
+import sqlite3
+import threading
+import unicodedata
 import numpy as np
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 
 # 🔑 Récupération des clés depuis GitHub Secrets (variables d'environnement)
 API_KEY = os.getenv("API_FOOTBALL_KEY")
@@ -26,2155 +36,253 @@ api_headers = {
 REGION = "eu"
 MARKETS = "h2h,totals"
 
-# Alternateur pour Groq
-groq_key_index = 0
-
-team_name_mapping = {
-    "Bournemouth": "AFC Bournemouth",
-    "Rep. Of Ireland": "Republic Of Ireland",
-    "Sport Recife": "Sport",
-    "RB Bragantino": "Red Bull Bragantino",
-    "Fortaleza EC": "Fortaleza",
-    "Gremio":"Grêmio",
-    "Vitoria": "Vitória",
-    "Vasco DA Gama": "Vasco da Gama",
-    "Sao Paulo": "São Paulo",
-    "Atletico-MG": "Atlético-MG",
-    "Paris Saint Germain": "Paris Saint-Germain",
-    "Atletico Madrid": "Atlético Madrid",
-    "San Diego": "San Diego FC",
-    "Austin": "Austin FC",
-    "Seattle Sounders": "Seattle Sounders FC",
-    "Los Angeles FC": "LAFC",
-    "Santa Fe": "Independiente Santa Fe",
-    "Qingdao Youth Island": "Qingdao Hainiu",
-    "Atletico Nacional": "Atlético Nacional",
-    "Henan Jianye": "Henan Songshan Longmen",
-    "SHANGHAI SIPG": "Shanghai Port",
-    "Al-Hilal Saudi FC": "Al Hilal",
-    "Inter Miami": "Inter Miami CF",
-    "Portuguesa FC": "Portuguesa",
-    "2 de Mayo": "2 de Mayo",
-    "America de Cali": "América de Cali",
-    "Carabobo FC": "Carabobo",
-    "Rapid": "Rapid Bucuresti",
-    "Operario-PR": "Operario PR",
-    "Arges Pitesti": "Fc Arges",
-    "Libertad Asuncion": "Libertad",
-    "General Caballero": "General Caballero JLM",
-    "Real Esppor Club": "Deportivo La Guaira",
-    "UCV": "Universidad Central",
-    "Cuiaba": "Cuiabá",
-    "remo": "Remo",
+# Pool de clés Groq : débit par clé (requêtes/minute) avant lecture des en-têtes de rate-limit
+GROQ_REQUETES_PAR_MINUTE = float(os.getenv("GROQ_REQUETES_PAR_MINUTE", "30"))
+# Hedging : requête dupliquée sur une autre clé si la première dépasse le percentile de latence observé
+LLM_HEDGING = os.getenv("LLM_HEDGING", "0") == "1"
+LLM_HEDGING_PERCENTILE = float(os.getenv("LLM_HEDGING_PERCENTILE", "90"))
+LLM_HEDGING_DELAI_DEFAUT = float(os.getenv("LLM_HEDGING_DELAI_DEFAUT", "20"))  # secondes, avant assez de mesures
+# Cache des réponses LLM (clé = empreinte du modèle, prompt système, température et prompt)
+LLM_CACHE = os.getenv("LLM_CACHE", "1") == "1"
+LLM_CACHE_TTL_HEURES = float(os.getenv("LLM_CACHE_TTL_HEURES", "48"))
+LLM_CACHE_MAX_ENTREES = int(os.getenv("LLM_CACHE_MAX_ENTREES", "2000"))
+LLM_CACHE_MAX_MO = float(os.getenv("LLM_CACHE_MAX_MO", "20"))  # taille cumulée maximale des réponses en cache
+# Prompt : "detaille" (historique) ou "compact" (tableaux denses, borné par un budget de tokens)
+PROMPT_MODE = os.getenv("PROMPT_MODE", "detaille")
+PROMPT_BUDGET_TOKENS = int(os.getenv("PROMPT_BUDGET_TOKENS", "1500"))
+# Sortie structurée : l'IA répond en JSON (schéma imposé) au lieu d'un texte analysé par regex
+LLM_SORTIE_JSON = os.getenv("LLM_SORTIE_JSON", "0") == "1"
+# Streaming (SSE) : prédiction, confiance et scores publiés dès leur arrivée, avant la fin de la justification
+LLM_STREAMING = os.getenv("LLM_STREAMING", "0") == "1"
+# Fichier prédiction-YYYY-MM-DD-precoce.json poussé sur GitHub pendant l'exécution (au plus une fois par intervalle)
+PUBLICATION_PRECOCE_GIT = os.getenv("PUBLICATION_PRECOCE_GIT", "0") == "1"
+PUBLICATION_PRECOCE_INTERVALLE = float(os.getenv("PUBLICATION_PRECOCE_INTERVALLE", "300"))  # secondes
+# Sorties allégées pour la PWA : index résumé du jour + un fichier détail par match (+ variantes .gz)
+SORTIES_ALLEGEES = os.getenv("SORTIES_ALLEGEES", "1") == "1"
+DOSSIER_DETAILS = os.getenv("DOSSIER_DETAILS", "predictions")
+# Dossier d'exécution runs/YYYY-MM-DD/ : flux NDJSON des prédictions (une ligne par match terminé)
+# et points de contrôle par match (fixtures/<id API-Football>.json) pour la reprise (--reprendre).
+# Copies de travail non versionnées (.gitignore) : seul le fichier du jour est publié.
+DOSSIER_RUNS = os.getenv("DOSSIER_RUNS", "runs")
+RUNS_JOURS_CONSERVES = int(os.getenv("RUNS_JOURS_CONSERVES", "3"))
+
+# Registres des équipes et des ligues (teams_urls, team_name_mapping, classement_ligue_mapping, ligues autorisées)
+FICHIER_REGISTRES = os.getenv("FICHIER_REGISTRES", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "registres.json"))
+
+# Noms d'équipes : similarité minimale (trigrammes) pour le repli flou, et écart exigé avec le 2e candidat
+SEUIL_SIMILARITE_NOMS = float(os.getenv("SEUIL_SIMILARITE_NOMS", "0.88"))
+MARGE_SIMILARITE_NOMS = 0.08
+
+# ⚙️ Nombre de matchs analysés en parallèle (1 = mode séquentiel historique)
+MAX_WORKERS = max(1, int(os.getenv("ANALYSE_MAX_WORKERS", "1")))
+
+# 🎲 Moteur de probabilités : "montecarlo" (échantillonnage) ou "exact" (matrice de scores Poisson)
+SIMULATION_METHODE = os.getenv("SIMULATION_METHODE", "montecarlo")
+# Graine de l'exécution : chaque match tire dans son propre flux, dérivé de (graine, identifiant du match)
+MONTE_CARLO_SEED = int(os.getenv("MONTE_CARLO_SEED", "0"))
+# Nombre d'itérations (maximum en mode adaptatif) et arrêt par convergence
+MONTE_CARLO_ITERATIONS = int(os.getenv("MONTE_CARLO_ITERATIONS", "20000"))
+MONTE_CARLO_ADAPTATIF = os.getenv("MONTE_CARLO_ADAPTATIF", "0") == "1"
+MONTE_CARLO_PRECISION = float(os.getenv("MONTE_CARLO_PRECISION", "0.75"))  # demi-largeur IC 95 % visée, en points de %
+MONTE_CARLO_TAILLE_LOT = 1000
+MONTE_CARLO_LOTS_MIN = 5  # lots minimum avant d'estimer la précision par moyennes de lots
+# Échantillonnage : "standard", "antithetique" (paires u / 1-u) ou "quasi" (suite de Halton décalée)
+MONTE_CARLO_ECHANTILLONNAGE = os.getenv("MONTE_CARLO_ECHANTILLONNAGE", "standard")
+
+# 🌐 Couche HTTP partagée : une seule session keep-alive (pool de connexions par hôte)
+# pour ESPN, raw.githubusercontent, api-sports, the-odds-api et Groq
+HTTP_TIMEOUT = 20          # Timeout par défaut (secondes) de tous les appels réseau
+LLM_HTTP_TIMEOUT = 120     # Les complétions Groq peuvent être longues
+# En-têtes de navigateur réservés au scraping des pages HTML ESPN (les API gardent les en-têtes par défaut)
+HTTP_HEADERS_NAVIGATEUR = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/117.0.0.0 Safari/537.36",
+    "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7"
 }
 
-classement_ligue_mapping = {
-    "Colombia": {
-        "Primera A": {
-            "url": "https://www.espn.com/soccer/standings/_/league/col.1",
-            "odds_id": "none",
-            "data_json": "Colombia_Primera_A.json"
-        }
-    },
-    "France": {
-        "Ligue 1": {
-            "url": "https://www.espn.com/soccer/standings/_/league/fra.1",
-            "odds_id": "soccer_france_ligue_one",
-            "data_json": "France_Ligue_1.json"
-        }
-    },
-    "Belgium": {
-        "Jupiler Pro League": {
-            "url": "https://www.espn.com/soccer/standings/_/league/bel.1",
-            "odds_id": "soccer_belgium_first_div",
-            "data_json": "Belgium_Jupiler_Pro_League.json"
-        }
-    },
-    "England": {
-        "Premier League": {
-            "url": "https://www.espn.com/soccer/standings/_/league/eng.1",
-            "odds_id": "soccer_epl",
-            "data_json": "p_league.json"
-        },
-        "National League": {
-            "url": "https://www.espn.com/soccer/standings/_/league/eng.5",
-            "odds_id": "none",
-            "data_json": "England_National_League.json"
-        }
-    },
-    "Netherlands": {
-        "Eredivisie": {
-            "url": "https://www.espn.com/soccer/standings/_/league/ned.1",
-            "odds_id": "soccer_netherlands_eredivisie",
-            "data_json": "Netherlands_Eredivisie.json"
-        }
-    },
-    "Portugal": {
-        "Primeira Liga": {
-            "url": "https://www.espn.com/soccer/standings/_/league/por.1",
-            "odds_id": "soccer_portugal_primeira_liga",
-            "data_json": "Portugal_Primeira_Liga.json"
-        }
-    },
-    "Spain": {
-        "La Liga": {
-            "url": "https://www.espn.com/soccer/standings/_/league/esp.1",
-            "odds_id": "soccer_spain_la_liga",
-            "data_json": "laliga.json"
-        }
-    },
-    "Germany": {
-        "Bundesliga": {
-            "url": "https://www.espn.com/soccer/standings/_/league/ger.1",
-            "odds_id": "soccer_germany_bundesliga",
-            "data_json": "bundesliga.json"
-        }
-    },
-    "Austria": {
-        "Bundesliga": {
-            "url": "https://www.espn.com/soccer/standings/_/league/aut.1",
-            "odds_id": "soccer_austria_bundesliga",
-            "data_json": "Austria_Bundesliga.json"
-        }
-    },
-    "Italy": {
-        "Serie A": {
-            "url": "https://www.espn.com/soccer/standings/_/league/ita.1",
-            "odds_id": "soccer_italy_serie_a",
-            "data_json": "Italy_Serie_A.json"
-        }
-    },
-    "Brazil": {
-        "Serie A": {
-            "url": "https://www.espn.com/soccer/standings/_/league/bra.1",
-            "odds_id": "soccer_brazil_campeonato",
-            "data_json": "Brazil_Serie_A.json"
-        },
-        "Serie B": {
-            "url": "https://www.espn.com/soccer/standings/_/league/bra.2",
-            "odds_id": "soccer_brazil_serie_b",
-            "data_json": "Brazil_Serie_B.json"
-        }
-    },
-    "Turkey": {
-        "Süper Lig": {
-            "url": "https://www.espn.com/soccer/standings/_/league/tur.1",
-            "odds_id": "soccer_turkey_super_league",
-            "data_json": "Turkey_Super_Lig.json"
-        }
-    },
-    "Mexico": {
-        "Liga MX": {
-            "url": "https://www.espn.com/soccer/standings/_/league/mex.1",
-            "odds_id": "soccer_mexico_ligamx",
-            "data_json": "Mexico_Liga_MX.json"
-        }
-    },
-    "USA": {
-        "Major League Soccer": {
-            "url": "https://www.espn.com/soccer/standings/_/league/usa.1",
-            "odds_id": "soccer_usa_mls",
-            "data_json": "USA_Major_League_Soccer.json"
-        }
-    },
-    "Japan": {
-        "J1 League": {
-            "url": "https://www.espn.com/soccer/standings/_/league/jpn.1",
-            "odds_id": "soccer_japan_j_league",
-            "data_json": "Japan_J1_League.json"
-        }
-    },
-    "Saudi-Arabia": {
-        "Pro League": {
-            "url": "https://www.espn.com/soccer/standings/_/league/ksa.1",
-            "odds_id": "none",
-            "data_json": "Saudi_Arabia_Pro_League.json"
-        }
-    },
-    "Switzerland": {
-        "Super League": {
-            "url": "https://www.espn.com/soccer/standings/_/league/sui.1",
-            "odds_id": "soccer_switzerland_superleague",
-            "data_json": "Switzerland_Super_League.json"
-        }
-    },
-    "China": {
-        "Super League": {
-            "url": "https://www.espn.com/soccer/standings/_/league/chn.1",
-            "odds_id": "soccer_china_superleague",
-            "data_json": "China_Super_League.json"
-        }
-    },
-    "Russia": {
-        "Premier League": {
-            "url": "https://www.espn.com/soccer/standings/_/league/rus.1",
-            "odds_id": "none",
-            "data_json": "Russia_Premier_League.json"
-        }
-    },
-    "Greece": {
-        "Super League 1": {
-            "url": "https://www.espn.com/soccer/standings/_/league/gre.1",
-            "odds_id": "soccer_greece_super_league",
-            "data_json": "Greece_Super_League_1.json"
-        }
-    },
-    "Chile": {
-        "Primera División": {
-            "url": "https://www.espn.com/soccer/standings/_/league/chi.1",
-            "odds_id": "soccer_chile_campeonato",
-            "data_json": "Chile_Primera_Division.json"
-        }
-    },
-    "Peru": {
-        "Primera División": {
-            "url": "https://www.espn.com/soccer/standings/_/league/per.1",
-            "odds_id": "none",
-            "data_json": "Peru_Primera_Division.json"
-        }
-    },
-    "Sweden": {
-        "Allsvenskan": {
-            "url": "https://www.espn.com/soccer/standings/_/league/swe.1",
-            "odds_id": "soccer_sweden_allsvenskan",
-            "data_json": "Sweden_Allsvenskan.json"
-        }
-    },
-    "Argentina": {
-        "Primera Nacional": {
-            "url": "https://www.espn.com/soccer/standings/_/league/arg.2",
-            "odds_id": "soccer_argentina_primera_division",
-            "data_json": "Argentina_Primera_Nacional.json"
-        }
-    },
-    "Paraguay": {
-        "Division Profesional": {
-            "url": "https://www.espn.com/soccer/standings/_/league/par.1",
-            "odds_id": "none",
-            "data_json": "Paraguay_Division_Profesional.json"
-        }
-    },
-    "Venezuela": {
-        "Primera División": {
-            "url": "https://www.espn.com/soccer/standings/_/league/ven.1",
-            "odds_id": "none",
-            "data_json": "Venezuela_Primera_Division.json"
-        }
-    },
-    "Romania": {
-        "Liga I": {
-            "url": "https://www.espn.com/soccer/standings/_/league/rou.1",
-            "odds_id": "none",
-            "data_json": "Romania_Liga_I.json"
-        }
-    }
-}
-
-teams_urls = {
-    # Bloc Europe du dernier JSON
-    "Wales": {"results": "https://www.espn.com/soccer/team/results/_/id/578/wales"},
-    "Turkey": {"results": "https://www.espn.com/soccer/team/results/_/id/465/turkey"},
-    "Ukraine": {"results": "https://www.espn.com/soccer/team/results/_/id/457/ukraine"},
-    "Sweden": {"results": "https://www.espn.com/soccer/team/results/_/id/466/sweden"},
-    "Switzerland": {"results": "https://www.espn.com/soccer/team/results/_/id/475/switzerland"},
-    "Slovenia": {"results": "https://www.espn.com/soccer/team/results/_/id/472/slovenia"},
-    "Slovakia": {"results": "https://www.espn.com/soccer/team/results/_/id/468/slovakia"},
-    "Scotland": {"results": "https://www.espn.com/soccer/team/results/_/id/580/scotland"},
-    "Serbia": {"results": "https://www.espn.com/soccer/team/results/_/id/6757/serbia"},
-    "Romania": {"results": "https://www.espn.com/soccer/team/results/_/id/473/romania"},
-    "Norway": {"results": "https://www.espn.com/soccer/team/results/_/id/464/norway"},
-    "Poland": {"results": "https://www.espn.com/soccer/team/results/_/id/471/poland"},
-    "Northern Ireland": {"results": "https://www.espn.com/soccer/team/results/_/id/586/northern-ireland"},
-    "Netherlands": {"results": "https://www.espn.com/soccer/team/results/_/id/449/netherlands"},
-    "North Macedonia": {"results": "https://www.espn.com/soccer/team/results/_/id/463/north-macedonia"},
-    "Montenegro": {"results": "https://www.espn.com/soccer/team/results/_/id/6775/montenegro"},
-    "Moldova": {"results": "https://www.espn.com/soccer/team/results/_/id/483/moldova"},
-    "Latvia": {"results": "https://www.espn.com/soccer/team/results/_/id/456/latvia"},
-    "Kazakhstan": {"results": "https://www.espn.com/soccer/team/results/_/id/2619/kazakhstan"},
-    "Kosovo": {"results": "https://www.espn.com/soccer/team/results/_/id/18272/kosovo"},
-    "Italy": {"results": "https://www.espn.com/soccer/team/results/_/id/162/italy"},
-    "Israel": {"results": "https://www.espn.com/soccer/team/results/_/id/461/israel"},
-    "Malta": {"results": "https://www.espn.com/soccer/team/results/_/id/453/malta"},
-    "Luxembourg": {"results": "https://www.espn.com/soccer/team/results/_/id/582/luxembourg"},
-    "Lithuania": {"results": "https://www.espn.com/soccer/team/results/_/id/460/lithuania"},
-    "Iceland": {"results": "https://www.espn.com/soccer/team/results/_/id/470/iceland"},
-    "Hungary": {"results": "https://www.espn.com/soccer/team/results/_/id/480/hungary"},
-    "Greece": {"results": "https://www.espn.com/soccer/team/results/_/id/455/greece"},
-    "Gibraltar": {"results": "https://www.espn.com/soccer/team/results/_/id/16721/gibraltar"},
-    "Finland": {"results": "https://www.espn.com/soccer/team/results/_/id/458/finland"},
-    "Faroe Islands": {"results": "https://www.espn.com/soccer/team/results/_/id/447/faroe-islands"},
-    "Estonia": {"results": "https://www.espn.com/soccer/team/results/_/id/444/estonia"},
-    "England": {"results": "https://www.espn.com/soccer/team/results/_/id/448/england"},
-    "Denmark": {"results": "https://www.espn.com/soccer/team/results/_/id/479/denmark"},
-    "Czechia": {"results": "https://www.espn.com/soccer/team/results/_/id/450/czechia"},
-    "Cyprus": {"results": "https://www.espn.com/soccer/team/results/_/id/445/cyprus"},
-    "Croatia": {"results": "https://www.espn.com/soccer/team/results/_/id/477/croatia"},
-    "Bulgaria": {"results": "https://www.espn.com/soccer/team/results/_/id/462/bulgaria"},
-    "Bosnia and Herzegovina": {"results": "https://www.espn.com/soccer/team/results/_/id/452/bosnia-and-herzegovina"},
-    "Belgium": {"results": "https://www.espn.com/soccer/team/results/_/id/459/belgium"},
-    "Belarus": {"results": "https://www.espn.com/soccer/team/results/_/id/583/belarus"},
-    "Austria": {"results": "https://www.espn.com/soccer/team/results/_/id/474/austria"},
-    "Azerbaijan": {"results": "https://www.espn.com/soccer/team/results/_/id/581/azerbaijan"},
-    "Armenia": {"results": "https://www.espn.com/soccer/team/results/_/id/579/armenia"},
-    "Andorra": {"results": "https://www.espn.com/soccer/team/results/_/id/587/andorra"},
-    "Albania": {"results": "https://www.espn.com/soccer/team/results/_/id/585/albania"},
-    # Bloc Afrique, Asie, Caraïbes, etc. (et quelques doublons pour sécurité)
-    "Angola": {"results": "https://www.espn.com/soccer/team/results/_/id/653/angola"},
-    "Botswana": {"results": "https://www.espn.com/soccer/team/results/_/id/4245/botswana"},
-    "Comoros": {"results": "https://www.espn.com/soccer/team/results/_/id/8601/comoros"},
-    "Eswatini": {"results": "https://www.espn.com/soccer/team/results/_/id/6686/eswatini"},
-    "Lesotho": {"results": "https://www.espn.com/soccer/team/results/_/id/6640/lesotho"},
-    "Madagascar": {"results": "https://www.espn.com/soccer/team/results/_/id/5533/madagascar"},
-    "Malawi": {"results": "https://www.espn.com/soccer/team/results/_/id/4325/malawi"},
-    "Mauritius": {"results": "https://www.espn.com/soccer/team/results/_/id/5534/mauritius"},
-    "Mozambique": {"results": "https://www.espn.com/soccer/team/results/_/id/8939/mozambique"},
-    "Namibia": {"results": "https://www.espn.com/soccer/team/results/_/id/6725/namibia"},
-    "South Africa": {"results": "https://www.espn.com/soccer/team/results/_/id/467/south-africa"},
-    "Tanzania": {"results": "https://www.espn.com/soccer/team/results/_/id/5778/tanzania"},
-    "Zimbabwe": {"results": "https://www.espn.com/soccer/team/results/_/id/4214/zimbabwe"},
-    "Afghanistan": {"results": "https://www.espn.com/soccer/team/results/_/id/5780/afghanistan"},
-    "Algeria": {"results": "https://www.espn.com/soccer/team/results/_/id/624/algeria"},
-    "Anguilla": {"results": "https://www.espn.com/soccer/team/results/_/id/8942/anguilla"},
-    "Aruba": {"results": "https://www.espn.com/soccer/team/results/_/id/2642/aruba"},
-    "Barbados": {"results": "https://www.espn.com/soccer/team/results/_/id/2637/barbados"},
-    "Benin": {"results": "https://www.espn.com/soccer/team/results/_/id/2844/benin"},
-    "Bonaire": {"results": "https://www.espn.com/soccer/team/results/_/id/19314/bonaire"},
-    "British Virgin Islands": {"results": "https://www.espn.com/soccer/team/results/_/id/2644/british-virgin-islands"},
-    "Brunei Darussalam": {"results": "https://www.espn.com/soccer/team/results/_/id/10525/brunei-darussalam"},
-    "Burkina Faso": {"results": "https://www.espn.com/soccer/team/results/_/id/2845/burkina-faso"},
-    "Burundi": {"results": "https://www.espn.com/soccer/team/results/_/id/5779/burundi"},
-    "Cambodia": {"results": "https://www.espn.com/soccer/team/results/_/id/5518/cambodia"},
-    "Cameroon": {"results": "https://www.espn.com/soccer/team/results/_/id/656/cameroon"},
-    "Canada": {"results": "https://www.espn.com/soccer/team/results/_/id/206/canada"},
-    "Cape Verde Islands": {"results": "https://www.espn.com/soccer/team/results/_/id/2597/cape-verde-islands"},
-    "Central African Republic": {"results": "https://www.espn.com/soccer/team/results/_/id/10528/central-african-republic"},
-    "Chad": {"results": "https://www.espn.com/soccer/team/results/_/id/8941/chad"},
-    "Chile": {"results": "https://www.espn.com/soccer/team/results/_/id/207/chile"},
-    "Congo DR": {"results": "https://www.espn.com/soccer/team/results/_/id/2850/congo-dr"},
-    "Costa Rica": {"results": "https://www.espn.com/soccer/team/results/_/id/214/costa-rica"},
-    "Curacao": {"results": "https://www.espn.com/soccer/team/results/_/id/11678/curacao"},
-    "Dominica": {"results": "https://www.espn.com/soccer/team/results/_/id/13582/dominica"},
-    "Dominican Republic": {"results": "https://www.espn.com/soccer/team/results/_/id/2649/dominican-republic"},
-    "El Salvador": {"results": "https://www.espn.com/soccer/team/results/_/id/2650/el-salvador"},
-    "Equatorial Guinea": {"results": "https://www.espn.com/soccer/team/results/_/id/8938/equatorial-guinea"},
-    "Gabon": {"results": "https://www.espn.com/soccer/team/results/_/id/4231/gabon"},
-    "Gambia": {"results": "https://www.espn.com/soccer/team/results/_/id/7368/gambia"},
-    "Georgia": {"results": "https://www.espn.com/soccer/team/results/_/id/584/georgia"},
-    "Ghana": {"results": "https://www.espn.com/soccer/team/results/_/id/4469/ghana"},
-    "Guatemala": {"results": "https://www.espn.com/soccer/team/results/_/id/2652/guatemala"},
-    "Guinea-Bissau": {"results": "https://www.espn.com/soccer/team/results/_/id/8602/guinea-bissau"},
-    "Haiti": {"results": "https://www.espn.com/soccer/team/results/_/id/2654/haiti"},
-    "Honduras": {"results": "https://www.espn.com/soccer/team/results/_/id/215/honduras"},
-    "Hong Kong": {"results": "https://www.espn.com/soccer/team/results/_/id/1928/hong-kong"},
-    "India": {"results": "https://www.espn.com/soccer/team/results/_/id/4385/india"},
-    "Iran": {"results": "https://www.espn.com/soccer/team/results/_/id/469/iran"},
-    "Ivory Coast": {"results": "https://www.espn.com/soccer/team/results/_/id/4789/ivory-coast"},
-    "Jamaica": {"results": "https://www.espn.com/soccer/team/results/_/id/1038/jamaica"},
-    "Japan": {"results": "https://www.espn.com/soccer/team/results/_/id/627/japan"},
-    "Jordan": {"results": "https://www.espn.com/soccer/team/results/_/id/2917/jordan"},
-    "Kenya": {"results": "https://www.espn.com/soccer/team/results/_/id/2848/kenya"},
-    "Laos": {"results": "https://www.espn.com/soccer/team/results/_/id/7348/laos"},
-    "Lebanon": {"results": "https://www.espn.com/soccer/team/results/_/id/4388/lebanon"},
-    "Liberia": {"results": "https://www.espn.com/soccer/team/results/_/id/4205/liberia"},
-    "Liechtenstein": {"results": "https://www.espn.com/soccer/team/results/_/id/589/liechtenstein"},
-    "Lithuania": {"results": "https://www.espn.com/soccer/team/results/_/id/460/lithuania"},
-    "Luxembourg": {"results": "https://www.espn.com/soccer/team/results/_/id/582/luxembourg"},
-    "Macau": {"results": "https://www.espn.com/soccer/team/results/_/id/6722/macau"},
-    "Malaysia": {"results": "https://www.espn.com/soccer/team/results/_/id/2405/malaysia"},
-    "Maldives": {"results": "https://www.espn.com/soccer/team/results/_/id/4390/maldives"},
-    "Mali": {"results": "https://www.espn.com/soccer/team/results/_/id/2849/mali"},
-    "Malta": {"results": "https://www.espn.com/soccer/team/results/_/id/453/malta"},
-    "Mauritania": {"results": "https://www.espn.com/soccer/team/results/_/id/8940/mauritania"},
-    "Mexico": {"results": "https://www.espn.com/soccer/team/results/_/id/203/mexico"},
-    "Moldova": {"results": "https://www.espn.com/soccer/team/results/_/id/483/moldova"},
-    "Montenegro": {"results": "https://www.espn.com/soccer/team/results/_/id/6775/montenegro"},
-    "Morocco": {"results": "https://www.espn.com/soccer/team/results/_/id/2869/morocco"},
-    "Mozambique": {"results": "https://www.espn.com/soccer/team/results/_/id/8939/mozambique"},
-    "Nepal": {"results": "https://www.espn.com/soccer/team/results/_/id/5785/nepal"},
-    "New Zealand": {"results": "https://www.espn.com/soccer/team/results/_/id/2666/new-zealand"},
-    "Nicaragua": {"results": "https://www.espn.com/soccer/team/results/_/id/2658/nicaragua"},
-    "Niger": {"results": "https://www.espn.com/soccer/team/results/_/id/8937/niger"},
-    "Nigeria": {"results": "https://www.espn.com/soccer/team/results/_/id/657/nigeria"},
-    "North Korea": {"results": "https://www.espn.com/soccer/team/results/_/id/4860/north-korea"},
-    "Northern Ireland": {"results": "https://www.espn.com/soccer/team/results/_/id/586/northern-ireland"},
-    "Norway": {"results": "https://www.espn.com/soccer/team/results/_/id/464/norway"},
-    "Oman": {"results": "https://www.espn.com/soccer/team/results/_/id/2841/oman"},
-    "Poland": {"results": "https://www.espn.com/soccer/team/results/_/id/471/poland"},
-    "Panama": {"results": "https://www.espn.com/soccer/team/results/_/id/2659/panama"},
-    "Puerto Rico": {"results": "https://www.espn.com/soccer/team/results/_/id/11766/puerto-rico"},
-    "Republic Of Ireland": {"results": "https://www.espn.com/soccer/team/results/_/id/476/republic-of-ireland"},
-    "Russia": {"results": "https://www.espn.com/soccer/team/results/_/id/454/russia"},
-    "Rwanda": {"results": "https://www.espn.com/soccer/team/results/_/id/2851/rwanda"},
-    "Saudi Arabia": {"results": "https://www.espn.com/soccer/team/results/_/id/655/saudi-arabia"},
-    "Scotland": {"results": "https://www.espn.com/soccer/team/results/_/id/580/scotland"},
-    "Senegal": {"results": "https://www.espn.com/soccer/team/results/_/id/654/senegal"},
-    "Singapore": {"results": "https://www.espn.com/soccer/team/results/_/id/4384/singapore"},
-    "Slovakia": {"results": "https://www.espn.com/soccer/team/results/_/id/468/slovakia"},
-    "Slovenia": {"results": "https://www.espn.com/soccer/team/results/_/id/472/slovenia"},
-    "South Africa": {"results": "https://www.espn.com/soccer/team/results/_/id/467/south-africa"},
-    "South Korea": {"results": "https://www.espn.com/soccer/team/results/_/id/451/south-korea"},
-    "Sri Lanka": {"results": "https://www.espn.com/soccer/team/results/_/id/5782/sri-lanka"},
-    "St Kitts and Nevis": {"results": "https://www.espn.com/soccer/team/results/_/id/2662/st-kitts-and-nevis"},
-    "St Martin": {"results": "https://www.espn.com/soccer/team/results/_/id/10596/st-martin"},
-    "St Vincent and the Grenadines": {"results": "https://www.espn.com/soccer/team/results/_/id/13584/st-vincent-and-the-grenadines"},
-    "Sudan": {"results": "https://www.espn.com/soccer/team/results/_/id/4319/sudan"},
-    "Sweden": {"results": "https://www.espn.com/soccer/team/results/_/id/466/sweden"},
-    "Switzerland": {"results": "https://www.espn.com/soccer/team/results/_/id/475/switzerland"},
-    "Tajikistan": {"results": "https://www.espn.com/soccer/team/results/_/id/6723/tajikistan"},
-    "Tanzania": {"results": "https://www.espn.com/soccer/team/results/_/id/5778/tanzania"},
-    "Thailand": {"results": "https://www.espn.com/soccer/team/results/_/id/4396/thailand"},
-    "Timor-Leste": {"results": "https://www.espn.com/soccer/team/results/_/id/8664/timor-leste"},
-    "Trinidad and Tobago": {"results": "https://www.espn.com/soccer/team/results/_/id/2627/trinidad-and-tobago"},
-    "Tunisia": {"results": "https://www.espn.com/soccer/team/results/_/id/659/tunisia"},
-    "Turkey": {"results": "https://www.espn.com/soccer/team/results/_/id/465/turkey"},
-    "Uganda": {"results": "https://www.espn.com/soccer/team/results/_/id/4211/uganda"},
-    "Ukraine": {"results": "https://www.espn.com/soccer/team/results/_/id/457/ukraine"},
-    "United States": {"results": "https://www.espn.com/soccer/team/results/_/id/660/united-states"},
-    "Venezuela": {"results": "https://www.espn.com/soccer/team/results/_/id/213/venezuela"},
-    "Vietnam": {"results": "https://www.espn.com/soccer/team/results/_/id/7349/vietnam"},
-    "Wales": {"results": "https://www.espn.com/soccer/team/results/_/id/578/wales"},
-    "Zambia": {"results": "https://www.espn.com/soccer/team/results/_/id/4277/zambia"},
-    "Zanzibar": {"results": "https://www.espn.com/soccer/team/results/_/id/5815/zanzibar"},
-    "Zimbabwe": {"results": "https://www.espn.com/soccer/team/results/_/id/4214/zimbabwe"},
-    "Atlético-MG": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/7632/atletico-mg"
-  },
-  "Bahia": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/9967/bahia"
-  },
-  "Botafogo": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/6086/botafogo"
-  },
-  "Ceará": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/9969/ceara"
-  },
-  "Corinthians": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/874/corinthians"
-  },
-  "Cruzeiro": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/2022/cruzeiro"
-  },
-  "Flamengo": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/819/flamengo"
-  },
-  "Fluminense": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/3445/fluminense"
-  },
-  "Fortaleza": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/6272/fortaleza"
-  },
-  "Grêmio": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/6273/gremio"
-  },
-  "Internacional": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/1936/internacional"
-  },
-  "Juventude": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/6270/juventude"
-  },
-  "Mirassol": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/9169/mirassol"
-  },
-  "Palmeiras": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/2029/palmeiras"
-  },
-  "Red Bull Bragantino": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/6079/red-bull-bragantino"
-  },
-  "Santos": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/2674/santos"
-  },
-  "São Paulo": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/2026/sao-paulo"
-  },
-  "Vasco da Gama": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/3454/vasco-da-gama"
-  },
-  "Vitória": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/3457/vitoria"
-  },
-  "Sport": {
-    "results": "https://www.espn.com/soccer/team/results/_/id/7635/sport"
-  },
-  "AFC Bournemouth": {
-        "results": "https://www.espn.com/football/team/results/_/id/349/afc-bournemouth"
-    },
-    "Arsenal": {
-        "results": "https://www.espn.com/football/team/results/_/id/359/arsenal"
-    },
-    "Aston Villa": {
-        "results": "https://www.espn.com/football/team/results/_/id/362/aston-villa"
-    },
-    "Brentford": {
-        "results": "https://www.espn.com/football/team/results/_/id/337/brentford"
-    },
-    "Brighton & Hove Albion": {
-        "results": "https://www.espn.com/football/team/results/_/id/331/brighton-hove-albion"
-    },
-    "Chelsea": {
-        "results": "https://www.espn.com/football/team/results/_/id/363/chelsea"
-    },
-    "Crystal Palace": {
-        "results": "https://www.espn.com/football/team/results/_/id/384/crystal-palace"
-    },
-    "Everton": {
-        "results": "https://www.espn.com/football/team/results/_/id/368/everton"
-    },
-    "Fulham": {
-        "results": "https://www.espn.com/football/team/results/_/id/370/fulham"
-    },
-    "Ipswich Town": {
-        "results": "https://www.espn.com/football/team/results/_/id/373/ipswich-town"
-    },
-    "Leicester City": {
-        "results": "https://www.espn.com/football/team/results/_/id/375/leicester-city"
-    },
-    "Liverpool": {
-        "results": "https://www.espn.com/football/team/results/_/id/364/liverpool"
-    },
-    "Manchester City": {
-        "results": "https://www.espn.com/football/team/results/_/id/382/manchester-city"
-    },
-    "Manchester United": {
-        "results": "https://www.espn.com/football/team/results/_/id/360/manchester-united"
-    },
-    "Newcastle United": {
-        "results": "https://www.espn.com/football/team/results/_/id/361/newcastle-united"
-    },
-    "Nottingham Forest": {
-        "results": "https://www.espn.com/football/team/results/_/id/393/nottingham-forest"
-    },
-    "Southampton": {
-        "results": "https://www.espn.com/football/team/results/_/id/376/southampton"
-    },
-    "Tottenham Hotspur": {
-        "results": "https://www.espn.com/football/team/results/_/id/367/tottenham-hotspur"
-    },
-    "West Ham United": {
-        "results": "https://www.espn.com/football/team/results/_/id/371/west-ham-united"
-    },
-    "Wolverhampton Wanderers": {
-        "results": "https://www.espn.com/football/team/results/_/id/380/wolverhampton-wanderers"
-    },
-    "Alavés": {
-        "results": "https://www.espn.com/football/team/results/_/id/96/alaves"
-    },
-    "Athletic Club": {
-        "results": "https://www.espn.com/football/team/results/_/id/93/athletic-club"
-    },
-    "Atlético Madrid": {
-        "results": "https://www.espn.com/football/team/results/_/id/1068/atletico-madrid"
-    },
-    "Barcelona": {
-        "results": "https://www.espn.com/football/team/results/_/id/83/barcelona"
-    },
-    "Celta Vigo": {
-        "results": "https://www.espn.com/football/team/results/_/id/85/celta-vigo"
-    },
-    "Espanyol": {
-        "results": "https://www.espn.com/football/team/results/_/id/88/espanyol"
-    },
-    "Getafe": {
-        "results": "https://www.espn.com/football/team/results/_/id/2922/getafe"
-    },
-    "Girona": {
-        "results": "https://www.espn.com/football/team/results/_/id/9812/girona"
-    },
-    "Las Palmas": {
-        "results": "https://www.espn.com/football/team/results/_/id/98/las-palmas"
-    },
-    "Leganés": {
-        "results": "https://www.espn.com/football/team/results/_/id/17534/leganes"
-    },
-    "Mallorca": {
-        "results": "https://www.espn.com/football/team/results/_/id/84/mallorca"
-    },
-    "Osasuna": {
-        "results": "https://www.espn.com/football/team/results/_/id/97/osasuna"
-    },
-    "Rayo Vallecano": {
-        "results": "https://www.espn.com/football/team/results/_/id/101/rayo-vallecano"
-    },
-    "Real Betis": {
-        "results": "https://www.espn.com/football/team/results/_/id/244/real-betis"
-    },
-    "Real Madrid": {
-        "results": "https://www.espn.com/football/team/results/_/id/86/real-madrid"
-    },
-    "Real Sociedad": {
-        "results": "https://www.espn.com/football/team/results/_/id/89/real-sociedad"
-    },
-    "Real Valladolid": {
-        "results": "https://www.espn.com/football/team/results/_/id/95/real-valladolid"
-    },
-    "Sevilla": {
-        "results": "https://www.espn.com/football/team/results/_/id/243/sevilla"
-    },
-    "Valencia": {
-        "results": "https://www.espn.com/football/team/results/_/id/94/valencia"
-    },
-    "Villarreal": {
-        "results": "https://www.espn.com/football/team/results/_/id/102/villarreal"
-    },
-    "AC Milan": {
-        "results": "https://www.espn.com/football/team/results/_/id/103/ac-milan"
-    },
-    "AS Roma": {
-        "results": "https://www.espn.com/football/team/results/_/id/104/as-roma"
-    },
-    "Atalanta": {
-        "results": "https://www.espn.com/football/team/results/_/id/105/atalanta"
-    },
-    "Bologna": {
-        "results": "https://www.espn.com/football/team/results/_/id/107/bologna"
-    },
-    "Cagliari": {
-        "results": "https://www.espn.com/football/team/results/_/id/2925/cagliari"
-    },
-    "Como": {
-        "results": "https://www.espn.com/football/team/results/_/id/2572/como"
-    },
-    "Cremonese": {
-        "results": "https://www.espn.com/football/team/results/_/id/4050/cremonese"
-    },
-    "Fiorentina": {
-        "results": "https://www.espn.com/football/team/results/_/id/109/fiorentina"
-    },
-    "Genoa": {
-        "results": "https://www.espn.com/football/team/results/_/id/3263/genoa"
-    },
-    "Hellas Verona": {
-        "results": "https://www.espn.com/football/team/results/_/id/119/hellas-verona"
-    },
-    "Internazionale": {
-        "results": "https://www.espn.com/football/team/results/_/id/110/internazionale"
-    },
-    "Juventus": {
-        "results": "https://www.espn.com/football/team/results/_/id/111/juventus"
-    },
-    "Lazio": {
-        "results": "https://www.espn.com/football/team/results/_/id/112/lazio"
-    },
-    "Lecce": {
-        "results": "https://www.espn.com/football/team/results/_/id/113/lecce"
-    },
-    "Napoli": {
-        "results": "https://www.espn.com/football/team/results/_/id/114/napoli"
-    },
-    "Parma": {
-        "results": "https://www.espn.com/football/team/results/_/id/115/parma"
-    },
-    "Pisa": {
-        "results": "https://www.espn.com/football/team/results/_/id/3956/pisa"
-    },
-    "Sassuolo": {
-        "results": "https://www.espn.com/football/team/results/_/id/3997/sassuolo"
-    },
-    "Torino": {
-        "results": "https://www.espn.com/football/team/results/_/id/239/torino"
-    },
-    "Udinese": {
-        "results": "https://www.espn.com/football/team/results/_/id/118/udinese"
-    },
-    "1. FC Heidenheim 1846": {
-        "results": "https://www.espn.com/football/team/results/_/id/6418/1-fc-heidenheim-1846"
-    },
-    "1. FC Union Berlin": {
-        "results": "https://www.espn.com/football/team/results/_/id/598/1-fc-union-berlin"
-    },
-    "Bayer Leverkusen": {
-        "results": "https://www.espn.com/football/team/results/_/id/131/bayer-leverkusen"
-    },
-    "Bayern Munich": {
-        "results": "https://www.espn.com/football/team/results/_/id/132/bayern-munich"
-    },
-    "Borussia Dortmund": {
-        "results": "https://www.espn.com/football/team/results/_/id/124/borussia-dortmund"
-    },
-    "Borussia Mönchengladbach": {
-        "results": "https://www.espn.com/football/team/results/_/id/268/borussia-monchengladbach"
-    },
-    "Eintracht Frankfurt": {
-        "results": "https://www.espn.com/football/team/results/_/id/125/eintracht-frankfurt"
-    },
-    "FC Augsburg": {
-        "results": "https://www.espn.com/football/team/results/_/id/3841/fc-augsburg"
-    },
-    "Holstein Kiel": {
-        "results": "https://www.espn.com/football/team/results/_/id/7884/holstein-kiel"
-    },
-    "Mainz": {
-        "results": "https://www.espn.com/football/team/results/_/id/2950/mainz"
-    },
-    "RB Leipzig": {
-        "results": "https://www.espn.com/football/team/results/_/id/11420/rb-leipzig"
-    },
-    "SC Freiburg": {
-        "results": "https://www.espn.com/football/team/results/_/id/126/sc-freiburg"
-    },
-    "St. Pauli": {
-        "results": "https://www.espn.com/football/team/results/_/id/270/st-pauli"
-    },
-    "TSG Hoffenheim": {
-        "results": "https://www.espn.com/football/team/results/_/id/7911/tsg-hoffenheim"
-    },
-    "VfB Stuttgart": {
-        "results": "https://www.espn.com/football/team/results/_/id/134/vfb-stuttgart"
-    },
-    "VfL Bochum": {
-        "results": "https://www.espn.com/football/team/results/_/id/121/vfl-bochum"
-    },
-    "VfL Wolfsburg": {
-        "results": "https://www.espn.com/football/team/results/_/id/138/vfl-wolfsburg"
-    },
-    "Werder Bremen": {
-        "results": "https://www.espn.com/football/team/results/_/id/137/werder-bremen"
-    },
-    "AJ Auxerre": {
-        "results": "https://www.espn.com/football/team/results/_/id/172/aj-auxerre"
-    },
-    "AS Monaco": {
-        "results": "https://www.espn.com/football/team/results/_/id/174/as-monaco"
-    },
-    "Angers": {
-        "results": "https://www.espn.com/football/team/results/_/id/7868/angers"
-    },
-    "Brest": {
-        "results": "https://www.espn.com/football/team/results/_/id/6997/brest"
-    },
-    "Le Havre AC": {
-        "results": "https://www.espn.com/football/team/results/_/id/3236/le-havre-ac"
-    },
-    "Lens": {
-        "results": "https://www.espn.com/football/team/results/_/id/175/lens"
-    },
-    "Lille": {
-        "results": "https://www.espn.com/football/team/results/_/id/166/lille"
-    },
-    "Lyon": {
-        "results": "https://www.espn.com/football/team/results/_/id/167/lyon"
-    },
-    "Marseille": {
-        "results": "https://www.espn.com/football/team/results/_/id/176/marseille"
-    },
-    "Montpellier": {
-        "results": "https://www.espn.com/football/team/results/_/id/274/montpellier"
-    },
-    "Nantes": {
-        "results": "https://www.espn.com/football/team/results/_/id/165/nantes"
-    },
-    "Nice": {
-        "results": "https://www.espn.com/football/team/results/_/id/2502/nice"
-    },
-    "Paris Saint-Germain": {
-        "results": "https://www.espn.com/football/team/results/_/id/160/paris-saint-germain"
-    },
-    "Saint-Étienne": {
-        "results": "https://www.espn.com/football/team/results/_/id/178/saint-etienne"
-    },
-    "Stade Rennais": {
-        "results": "https://www.espn.com/football/team/results/_/id/169/stade-rennais"
-    },
-    "Stade de Reims": {
-        "results": "https://www.espn.com/football/team/results/_/id/3243/stade-de-reims"
-    },
-    "Strasbourg": {
-        "results": "https://www.espn.com/football/team/results/_/id/180/strasbourg"
-    },
-    "Toulouse": {
-        "results": "https://www.espn.com/football/team/results/_/id/179/toulouse"
-    },
-    "Atlanta United FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/18418/atlanta-united-fc"
-    },
-    "Austin FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/20906/austin-fc"
-    },
-    "CF Montréal": {
-        "results": "https://www.espn.com/football/team/results/_/id/9720/cf-montreal"
-    },
-    "Charlotte FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/21300/charlotte-fc"
-    },
-    "Chicago Fire FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/182/chicago-fire-fc"
-    },
-    "Colorado Rapids": {
-        "results": "https://www.espn.com/football/team/results/_/id/184/colorado-rapids"
-    },
-    "Columbus Crew": {
-        "results": "https://www.espn.com/football/team/results/_/id/183/columbus-crew"
-    },
-    "D.C. United": {
-        "results": "https://www.espn.com/football/team/results/_/id/193/dc-united"
-    },
-    "FC Cincinnati": {
-        "results": "https://www.espn.com/football/team/results/_/id/18267/fc-cincinnati"
-    },
-    "FC Dallas": {
-        "results": "https://www.espn.com/football/team/results/_/id/185/fc-dallas"
-    },
-    "Houston Dynamo FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/6077/houston-dynamo-fc"
-    },
-    "Inter Miami CF": {
-        "results": "https://www.espn.com/football/team/results/_/id/20232/inter-miami-cf"
-    },
-    "LA Galaxy": {
-        "results": "https://www.espn.com/football/team/results/_/id/187/la-galaxy"
-    },
-    "LAFC": {
-        "results": "https://www.espn.com/football/team/results/_/id/18966/lafc"
-    },
-    "Minnesota United FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/17362/minnesota-united-fc"
-    },
-    "Nashville SC": {
-        "results": "https://www.espn.com/football/team/results/_/id/18986/nashville-sc"
-    },
-    "New England Revolution": {
-        "results": "https://www.espn.com/football/team/results/_/id/189/new-england-revolution"
-    },
-    "New York City FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/17606/new-york-city-fc"
-    },
-    "New York Red Bulls": {
-        "results": "https://www.espn.com/football/team/results/_/id/190/new-york-red-bulls"
-    },
-    "Orlando City SC": {
-        "results": "https://www.espn.com/football/team/results/_/id/12011/orlando-city-sc"
-    },
-    "Philadelphia Union": {
-        "results": "https://www.espn.com/football/team/results/_/id/10739/philadelphia-union"
-    },
-    "Portland Timbers": {
-        "results": "https://www.espn.com/football/team/results/_/id/9723/portland-timbers"
-    },
-    "Real Salt Lake": {
-        "results": "https://www.espn.com/football/team/results/_/id/4771/real-salt-lake"
-    },
-    "San Diego FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/22529/san-diego-fc"
-    },
-    "San Jose Earthquakes": {
-        "results": "https://www.espn.com/football/team/results/_/id/191/san-jose-earthquakes"
-    },
-    "Seattle Sounders FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/9726/seattle-sounders-fc"
-    },
-    "Sporting Kansas City": {
-        "results": "https://www.espn.com/football/team/results/_/id/186/sporting-kansas-city"
-    },
-    "St. Louis CITY SC": {
-        "results": "https://www.espn.com/football/team/results/_/id/21812/st-louis-city-sc"
-    },
-    "Toronto FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/7318/toronto-fc"
-    },
-    "Vancouver Whitecaps": {
-        "results": "https://www.espn.com/football/team/results/_/id/9727/vancouver-whitecaps"
-    },
-    "América": {
-        "results": "https://www.espn.com/football/team/results/_/id/227/america"
-    },
-    "Atlas": {
-        "results": "https://www.espn.com/football/team/results/_/id/216/atlas"
-    },
-    "Atlético de San Luis": {
-        "results": "https://www.espn.com/football/team/results/_/id/15720/atletico-de-san-luis"
-    },
-    "Cruz Azul": {
-        "results": "https://www.espn.com/football/team/results/_/id/218/cruz-azul"
-    },
-    "FC Juarez": {
-        "results": "https://www.espn.com/football/team/results/_/id/17851/fc-juarez"
-    },
-    "Guadalajara": {
-        "results": "https://www.espn.com/football/team/results/_/id/219/guadalajara"
-    },
-    "León": {
-        "results": "https://www.espn.com/football/team/results/_/id/228/leon"
-    },
-    "Mazatlán FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/20702/mazatlan-fc"
-    },
-    "Monterrey": {
-        "results": "https://www.espn.com/football/team/results/_/id/220/monterrey"
-    },
-    "Necaxa": {
-        "results": "https://www.espn.com/football/team/results/_/id/229/necaxa"
-    },
-    "Pachuca": {
-        "results": "https://www.espn.com/football/team/results/_/id/234/pachuca"
-    },
-    "Puebla": {
-        "results": "https://www.espn.com/football/team/results/_/id/231/puebla"
-    },
-    "Pumas UNAM": {
-        "results": "https://www.espn.com/football/team/results/_/id/233/pumas-unam"
-    },
-    "Querétaro": {
-        "results": "https://www.espn.com/football/team/results/_/id/222/queretaro"
-    },
-    "Santos": {
-        "results": "https://www.espn.com/football/team/results/_/id/225/santos"
-    },
-    "Tigres UANL": {
-        "results": "https://www.espn.com/football/team/results/_/id/232/tigres-uanl"
-    },
-    "Tijuana": {
-        "results": "https://www.espn.com/football/team/results/_/id/10125/tijuana"
-    },
-    "Toluca": {
-        "results": "https://www.espn.com/football/team/results/_/id/223/toluca"
-    },
-    "AZ Alkmaar": {
-        "results": "https://www.espn.com/football/team/results/_/id/140/az-alkmaar"
-    },
-    "Ajax Amsterdam": {
-        "results": "https://www.espn.com/football/team/results/_/id/139/ajax-amsterdam"
-    },
-    "Almere City": {
-        "results": "https://www.espn.com/football/team/results/_/id/5291/almere-city"
-    },
-    "FC Groningen": {
-        "results": "https://www.espn.com/football/team/results/_/id/145/fc-groningen"
-    },
-    "FC Twente": {
-        "results": "https://www.espn.com/football/team/results/_/id/152/fc-twente"
-    },
-    "FC Utrecht": {
-        "results": "https://www.espn.com/football/team/results/_/id/153/fc-utrecht"
-    },
-    "Feyenoord Rotterdam": {
-        "results": "https://www.espn.com/football/team/results/_/id/142/feyenoord-rotterdam"
-    },
-    "Fortuna Sittard": {
-        "results": "https://www.espn.com/football/team/results/_/id/143/fortuna-sittard"
-    },
-    "Go Ahead Eagles": {
-        "results": "https://www.espn.com/football/team/results/_/id/3706/go-ahead-eagles"
-    },
-    "Heerenveen": {
-        "results": "https://www.espn.com/football/team/results/_/id/146/heerenveen"
-    },
-    "Heracles Almelo": {
-        "results": "https://www.espn.com/football/team/results/_/id/3708/heracles-almelo"
-    },
-    "NAC Breda": {
-        "results": "https://www.espn.com/football/team/results/_/id/141/nac-breda"
-    },
-    "NEC Nijmegen": {
-        "results": "https://www.espn.com/football/team/results/_/id/147/nec-nijmegen"
-    },
-    "PEC Zwolle": {
-        "results": "https://www.espn.com/football/team/results/_/id/2565/pec-zwolle"
-    },
-    "PSV Eindhoven": {
-        "results": "https://www.espn.com/football/team/results/_/id/148/psv-eindhoven"
-    },
-    "RKC Waalwijk": {
-        "results": "https://www.espn.com/football/team/results/_/id/155/rkc-waalwijk"
-    },
-    "Sparta Rotterdam": {
-        "results": "https://www.espn.com/football/team/results/_/id/151/sparta-rotterdam"
-    },
-    "Willem II": {
-        "results": "https://www.espn.com/football/team/results/_/id/156/willem-ii"
-    },
-    "AVS": {
-        "results": "https://www.espn.com/football/team/results/_/id/22064/avs"
-    },
-    "Arouca": {
-        "results": "https://www.espn.com/football/team/results/_/id/15784/arouca"
-    },
-    "Benfica": {
-        "results": "https://www.espn.com/football/team/results/_/id/1929/benfica"
-    },
-    "Boavista": {
-        "results": "https://www.espn.com/football/team/results/_/id/2256/boavista"
-    },
-    "Braga": {
-        "results": "https://www.espn.com/football/team/results/_/id/2994/braga"
-    },
-    "C.D. Nacional": {
-        "results": "https://www.espn.com/football/team/results/_/id/3472/cd-nacional"
-    },
-    "Casa Pia": {
-        "results": "https://www.espn.com/football/team/results/_/id/21581/casa-pia"
-    },
-    "Estoril": {
-        "results": "https://www.espn.com/football/team/results/_/id/12216/estoril"
-    },
-    "Estrela": {
-        "results": "https://www.espn.com/football/team/results/_/id/21610/estrela"
-    },
-    "FC Famalicao": {
-        "results": "https://www.espn.com/football/team/results/_/id/12698/fc-famalicao"
-    },
-    "FC Porto": {
-        "results": "https://www.espn.com/football/team/results/_/id/437/fc-porto"
-    },
-    "Gil Vicente": {
-        "results": "https://www.espn.com/football/team/results/_/id/3699/gil-vicente"
-    },
-    "Guimaraes": {
-        "results": "https://www.espn.com/football/team/results/_/id/5309/guimaraes"
-    },
-    "Moreirense": {
-        "results": "https://www.espn.com/football/team/results/_/id/3696/moreirense"
-    },
-    "Rio Ave": {
-        "results": "https://www.espn.com/football/team/results/_/id/3822/rio-ave"
-    },
-    "SC Farense": {
-        "results": "https://www.espn.com/football/team/results/_/id/20740/sc-farense"
-    },
-    "Santa Clara": {
-        "results": "https://www.espn.com/football/team/results/_/id/12215/santa-clara"
-    },
-    "Sporting CP": {
-        "results": "https://www.espn.com/football/team/results/_/id/2250/sporting-cp"
-    },
-    "Al Ahli": {
-        "results": "https://www.espn.com/football/team/results/_/id/8346/al-ahli"
-    },
-    "Al Ettifaq": {
-        "results": "https://www.espn.com/football/team/results/_/id/8363/al-ettifaq"
-    },
-    "Al Fateh": {
-        "results": "https://www.espn.com/football/team/results/_/id/13033/al-fateh"
-    },
-    "Al Fayha": {
-        "results": "https://www.espn.com/football/team/results/_/id/21827/al-fayha"
-    },
-    "Al Hilal": {
-        "results": "https://www.espn.com/football/team/results/_/id/929/al-hilal"
-    },
-    "Al Ittihad": {
-        "results": "https://www.espn.com/football/team/results/_/id/2276/al-ittihad"
-    },
-    "Al Khaleej": {
-        "results": "https://www.espn.com/football/team/results/_/id/21829/al-khaleej"
-    },
-    "Al Kholood": {
-        "results": "https://www.espn.com/football/team/results/_/id/22028/al-kholood"
-    },
-    "Al Nassr": {
-        "results": "https://www.espn.com/football/team/results/_/id/817/al-nassr"
-    },
-    "Al Okhdood": {
-        "results": "https://www.espn.com/football/team/results/_/id/21966/al-okhdood"
-    },
-    "Al Orobah": {
-        "results": "https://www.espn.com/football/team/results/_/id/22029/al-orobah"
-    },
-    "Al Qadsiah": {
-        "results": "https://www.espn.com/football/team/results/_/id/22022/al-qadsiah"
-    },
-    "Al Raed": {
-        "results": "https://www.espn.com/football/team/results/_/id/21834/al-raed"
-    },
-    "Al Riyadh": {
-        "results": "https://www.espn.com/football/team/results/_/id/21965/al-riyadh"
-    },
-    "Al Shabab": {
-        "results": "https://www.espn.com/football/team/results/_/id/793/al-shabab"
-    },
-    "Al Taawoun": {
-        "results": "https://www.espn.com/football/team/results/_/id/18459/al-taawoun"
-    },
-    "Al Wehda": {
-        "results": "https://www.espn.com/football/team/results/_/id/21835/al-wehda"
-    },
-    "Damac": {
-        "results": "https://www.espn.com/football/team/results/_/id/21828/damac"
-    },
-    "Beijing Guoan": {
-        "results": "https://www.espn.com/football/team/results/_/id/2052/beijing-guoan"
-    },
-    "Changchun Yatai": {
-        "results": "https://www.espn.com/football/team/results/_/id/8225/changchun-yatai"
-    },
-    "Chengdu Rongcheng": {
-        "results": "https://www.espn.com/football/team/results/_/id/21355/chengdu-rongcheng"
-    },
-    "Dalian Yingbo": {
-        "results": "https://www.espn.com/football/team/results/_/id/22537/dalian-yingbo"
-    },
-    "Henan Songshan Longmen": {
-        "results": "https://www.espn.com/football/team/results/_/id/8240/henan-songshan-longmen"
-    },
-    "Meizhou Hakka": {
-        "results": "https://www.espn.com/football/team/results/_/id/21507/meizhou-hakka"
-    },
-    "Qingdao Hainiu": {
-        "results": "https://www.espn.com/football/team/results/_/id/21910/qingdao-hainiu"
-    },
-    "Qingdao West Coast": {
-        "results": "https://www.espn.com/football/team/results/_/id/22198/qingdao-west-coast"
-    },
-    "Shandong Taishan": {
-        "results": "https://www.espn.com/football/team/results/_/id/7521/shandong-taishan"
-    },
-    "Shanghai Port": {
-        "results": "https://www.espn.com/football/team/results/_/id/15515/shanghai-port"
-    },
-    "Shanghai Shenhua": {
-        "results": "https://www.espn.com/football/team/results/_/id/977/shanghai-shenhua"
-    },
-    "Shenzhen Xinpengcheng": {
-        "results": "https://www.espn.com/football/team/results/_/id/22199/shenzhen-xinpengcheng"
-    },
-    "Tianjin Jinmen Tiger": {
-        "results": "https://www.espn.com/football/team/results/_/id/8239/tianjin-jinmen-tiger"
-    },
-    "Wuhan Three Towns": {
-        "results": "https://www.espn.com/football/team/results/_/id/21506/wuhan-three-towns"
-    },
-    "Yunnan Yukun": {
-        "results": "https://www.espn.com/football/team/results/_/id/22536/yunnan-yukun"
-    },
-    "Zhejiang Professional FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/18203/zhejiang-professional-fc"
-    },
-    "Albirex Niigata": {
-        "results": "https://www.espn.com/football/team/results/_/id/7113/albirex-niigata"
-    },
-    "Avispa Fukuoka": {
-        "results": "https://www.espn.com/football/team/results/_/id/7107/avispa-fukuoka"
-    },
-    "Cerezo Osaka": {
-        "results": "https://www.espn.com/football/team/results/_/id/7109/cerezo-osaka"
-    },
-    "FC Tokyo": {
-        "results": "https://www.espn.com/football/team/results/_/id/3384/fc-tokyo"
-    },
-    "Fagiano Okayama": {
-        "results": "https://www.espn.com/football/team/results/_/id/22522/fagiano-okayama"
-    },
-    "Gamba Osaka": {
-        "results": "https://www.espn.com/football/team/results/_/id/7102/gamba-osaka"
-    },
-    "Kashima Antlers": {
-        "results": "https://www.espn.com/football/team/results/_/id/7115/kashima-antlers"
-    },
-    "Kashiwa Reysol": {
-        "results": "https://www.espn.com/football/team/results/_/id/7476/kashiwa-reysol"
-    },
-    "Kawasaki Frontale": {
-        "results": "https://www.espn.com/football/team/results/_/id/7112/kawasaki-frontale"
-    },
-    "Kyoto Sanga": {
-        "results": "https://www.espn.com/football/team/results/_/id/21361/kyoto-sanga"
-    },
-    "Machida Zelvia": {
-        "results": "https://www.espn.com/football/team/results/_/id/22167/machida-zelvia"
-    },
-    "Nagoya Grampus": {
-        "results": "https://www.espn.com/football/team/results/_/id/7108/nagoya-grampus"
-    },
-    "Sanfrecce Hiroshima": {
-        "results": "https://www.espn.com/football/team/results/_/id/7114/sanfrecce-hiroshima"
-    },
-    "Shimizu S-Pulse": {
-        "results": "https://www.espn.com/football/team/results/_/id/7104/shimizu-s-pulse"
-    },
-    "Shonan Bellmare": {
-        "results": "https://www.espn.com/football/team/results/_/id/6902/shonan-bellmare"
-    },
-    "Tokyo Verdy 1969": {
-        "results": "https://www.espn.com/football/team/results/_/id/3393/tokyo-verdy-1969"
-    },
-    "Urawa Red Diamonds": {
-        "results": "https://www.espn.com/football/team/results/_/id/3385/urawa-red-diamonds"
-    },
-    "Vissel Kobe": {
-        "results": "https://www.espn.com/football/team/results/_/id/7477/vissel-kobe"
-    },
-    "Yokohama F. Marinos": {
-        "results": "https://www.espn.com/football/team/results/_/id/7116/yokohama-f-marinos"
-    },
-    "Yokohama FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/7145/yokohama-fc"
-    },
-    "Beitar Jerusalem": {
-        "results": "https://www.espn.com/football/team/results/_/id/5218/beitar-jerusalem"
-    },
-    "Bnei Sakhnin": {
-        "results": "https://www.espn.com/football/team/results/_/id/8329/bnei-sakhnin"
-    },
-    "Hapoel Be'er": {
-        "results": "https://www.espn.com/football/team/results/_/id/13083/hapoel-beer"
-    },
-    "Hapoel Hadera": {
-        "results": "https://www.espn.com/football/team/results/_/id/19255/hapoel-hadera"
-    },
-    "Hapoel Haifa": {
-        "results": "https://www.espn.com/football/team/results/_/id/9577/hapoel-haifa"
-    },
-    "Hapoel Jerusalem": {
-        "results": "https://www.espn.com/football/team/results/_/id/20970/hapoel-jerusalem"
-    },
-    "Hapoel Kiryat Shmona": {
-        "results": "https://www.espn.com/football/team/results/_/id/8327/hapoel-kiryat-shmona"
-    },
-    "Ironi Tiberias": {
-        "results": "https://www.espn.com/football/team/results/_/id/22311/ironi-tiberias"
-    },
-    "Maccabi Haifa": {
-        "results": "https://www.espn.com/football/team/results/_/id/611/maccabi-haifa"
-    },
-    "Maccabi Netanya": {
-        "results": "https://www.espn.com/football/team/results/_/id/5945/maccabi-netanya"
-    },
-    "Maccabi Petah-Tikva": {
-        "results": "https://www.espn.com/football/team/results/_/id/2983/maccabi-petah-tikva"
-    },
-    "Maccabi Raina": {
-        "results": "https://www.espn.com/football/team/results/_/id/21517/maccabi-raina"
-    },
-    "Maccabi Tel-Aviv": {
-        "results": "https://www.espn.com/football/team/results/_/id/524/maccabi-tel-aviv"
-    },
-    "Moadon Sport Ashdod": {
-        "results": "https://www.espn.com/football/team/results/_/id/5269/moadon-sport-ashdod"
-    },
-    "AEK Athens": {
-        "results": "https://www.espn.com/football/team/results/_/id/887/aek-athens"
-    },
-    "Aris": {
-        "results": "https://www.espn.com/football/team/results/_/id/11553/aris"
-    },
-    "Asteras Tripoli": {
-        "results": "https://www.espn.com/football/team/results/_/id/8354/asteras-tripoli"
-    },
-    "Athens Kallithea": {
-        "results": "https://www.espn.com/football/team/results/_/id/22325/athens-kallithea"
-    },
-    "Atromitos": {
-        "results": "https://www.espn.com/football/team/results/_/id/6790/atromitos"
-    },
-    "Lamia": {
-        "results": "https://www.espn.com/football/team/results/_/id/18814/lamia"
-    },
-    "Levadiakos": {
-        "results": "https://www.espn.com/football/team/results/_/id/5276/levadiakos"
-    },
-    "OFI Crete": {
-        "results": "https://www.espn.com/football/team/results/_/id/1010/ofi-crete"
-    },
-    "Olympiacos": {
-        "results": "https://www.espn.com/football/team/results/_/id/435/olympiacos"
-    },
-    "PAOK Salonika": {
-        "results": "https://www.espn.com/football/team/results/_/id/605/paok-salonika"
-    },
-    "Panathinaikos": {
-        "results": "https://www.espn.com/football/team/results/_/id/443/panathinaikos"
-    },
-    "Panetolikos": {
-        "results": "https://www.espn.com/football/team/results/_/id/11431/panetolikos"
-    },
-    "Panserraikos FC": {
-        "results": "https://www.espn.com/football/team/results/_/id/21970/panserraikos-fc"
-    },
-    "Volos NFC": {
-        "results": "https://www.espn.com/football/team/results/_/id/20043/volos-nfc"
-    },
-    "Anderlecht": {
-        "results": "https://www.espn.com/football/team/results/_/id/441/anderlecht"
-    },
-    "Antwerp": {
-        "results": "https://www.espn.com/football/team/results/_/id/17544/antwerp"
-    },
-    "Beerschot": {
-        "results": "https://www.espn.com/football/team/results/_/id/991/beerschot"
-    },
-    "Cercle Brugge KSV": {
-        "results": "https://www.espn.com/football/team/results/_/id/3610/cercle-brugge-ksv"
-    },
-    "Club Brugge": {
-        "results": "https://www.espn.com/football/team/results/_/id/570/club-brugge"
-    },
-    "Dender": {
-        "results": "https://www.espn.com/football/team/results/_/id/7878/dender"
-    },
-    "KAA Gent": {
-        "results": "https://www.espn.com/football/team/results/_/id/3611/kaa-gent"
-    },
-    "KV Kortrijk": {
-        "results": "https://www.espn.com/football/team/results/_/id/5786/kv-kortrijk"
-    },
-    "KV Mechelen": {
-        "results": "https://www.espn.com/football/team/results/_/id/7879/kv-mechelen"
-    },
-    "KVC Westerlo": {
-        "results": "https://www.espn.com/football/team/results/_/id/606/kvc-westerlo"
-    },
-    "Oud-Heverlee Leuven": {
-        "results": "https://www.espn.com/football/team/results/_/id/5579/oud-heverlee-leuven"
-    },
-    "Racing Genk": {
-        "results": "https://www.espn.com/football/team/results/_/id/938/racing-genk"
-    },
-    "Royal Charleroi SC": {
-        "results": "https://www.espn.com/football/team/results/_/id/3616/royal-charleroi-sc"
-    },
-    "Sint-Truidense": {
-        "results": "https://www.espn.com/football/team/results/_/id/936/sint-truidense"
-    },
-    "Standard Liege": {
-        "results": "https://www.espn.com/football/team/results/_/id/559/standard-liege"
-    },
-    "Union St.-Gilloise": {
-        "results": "https://www.espn.com/football/team/results/_/id/5807/union-st-gilloise"
-    },
-    "Akhmat Grozny": {
-        "results": "https://www.espn.com/football/team/results/_/id/2991/akhmat-grozny"
-    },
-    "Akron Tolyatti": {
-        "results": "https://www.espn.com/football/team/results/_/id/22271/akron-tolyatti"
-    },
-    "CSKA Moscow": {
-        "results": "https://www.espn.com/football/team/results/_/id/1963/cska-moscow"
-    },
-    "Dinamo Moscow": {
-        "results": "https://www.espn.com/football/team/results/_/id/596/dinamo-moscow"
-    },
-    "Dynamo Makhachkala": {
-        "results": "https://www.espn.com/football/team/results/_/id/22300/dynamo-makhachkala"
-    },
-    "FC Khimki": {
-        "results": "https://www.espn.com/football/team/results/_/id/7424/fc-khimki"
-    },
-    "Fakel Voronezh": {
-        "results": "https://www.espn.com/football/team/results/_/id/21539/fakel-voronezh"
-    },
-    "Gazovik Orenburg": {
-        "results": "https://www.espn.com/football/team/results/_/id/18285/gazovik-orenburg"
-    },
-    "Krasnodar": {
-        "results": "https://www.espn.com/football/team/results/_/id/11336/krasnodar"
-    },
-    "Krylia Sovetov": {
-        "results": "https://www.espn.com/football/team/results/_/id/3850/krylia-sovetov"
-    },
-    "Lokomotiv Moscow": {
-        "results": "https://www.espn.com/football/team/results/_/id/442/lokomotiv-moscow"
-    },
-    "Nizhny Novgorod": {
-        "results": "https://www.espn.com/football/team/results/_/id/13150/nizhny-novgorod"
-    },
-    "Rostov": {
-        "results": "https://www.espn.com/football/team/results/_/id/3852/rostov"
-    },
-    "Rubin Kazan": {
-        "results": "https://www.espn.com/football/team/results/_/id/3851/rubin-kazan"
-    },
-    "Spartak Moscow": {
-        "results": "https://www.espn.com/football/team/results/_/id/1941/spartak-moscow"
-    },
-    "Zenit St Petersburg": {
-        "results": "https://www.espn.com/football/team/results/_/id/2533/zenit-st-petersburg"
-    },
-    "FC Basel": {
-        "results": "https://www.espn.com/football/team/results/_/id/989/fc-basel"
-    },
-    "FC Lugano": {
-        "results": "https://www.espn.com/football/team/results/_/id/7672/fc-lugano"
-    },
-    "FC Luzern": {
-        "results": "https://www.espn.com/football/team/results/_/id/7640/fc-luzern"
-    },
-    "FC Sion": {
-        "results": "https://www.espn.com/football/team/results/_/id/3076/fc-sion"
-    },
-    "FC Zürich": {
-        "results": "https://www.espn.com/football/team/results/_/id/3019/fc-zurich"
-    },
-    "Grasshoppers": {
-        "results": "https://www.espn.com/football/team/results/_/id/492/grasshoppers"
-    },
-    "Lausanne Sports": {
-        "results": "https://www.espn.com/football/team/results/_/id/11551/lausanne-sports"
-    },
-    "Servette": {
-        "results": "https://www.espn.com/football/team/results/_/id/20032/servette"
-    },
-    "St. Gallen": {
-        "results": "https://www.espn.com/football/team/results/_/id/557/st-gallen"
-    },
-    "Winterthur": {
-        "results": "https://www.espn.com/football/team/results/_/id/20996/winterthur"
-    },
-    "Young Boys": {
-        "results": "https://www.espn.com/football/team/results/_/id/2722/young-boys"
-    },
-    "Yverdon": {
-        "results": "https://www.espn.com/football/team/results/_/id/21538/yverdon"
-    },
-    "Adana Demirspor": {
-        "results": "https://www.espn.com/football/team/results/_/id/20765/adana-demirspor"
-    },
-    "Alanyaspor": {
-        "results": "https://www.espn.com/football/team/results/_/id/9078/alanyaspor"
-    },
-    "Antalyaspor": {
-        "results": "https://www.espn.com/football/team/results/_/id/3794/antalyaspor"
-    },
-    "Besiktas": {
-        "results": "https://www.espn.com/football/team/results/_/id/1895/besiktas"
-    },
-    "Bodrum FK": {
-        "results": "https://www.espn.com/football/team/results/_/id/22321/bodrum-fk"
-    },
-    "Caykur Rizespor": {
-        "results": "https://www.espn.com/football/team/results/_/id/7656/caykur-rizespor"
-    },
-    "Eyupspor": {
-        "results": "https://www.espn.com/football/team/results/_/id/20729/eyupspor"
-    },
-    "Fenerbahce": {
-        "results": "https://www.espn.com/football/team/results/_/id/436/fenerbahce"
-    },
-    "Galatasaray": {
-        "results": "https://www.espn.com/football/team/results/_/id/432/galatasaray"
-    },
-    "Gaziantep FK": {
-        "results": "https://www.espn.com/football/team/results/_/id/20070/gaziantep-fk"
-    },
-    "Goztepe": {
-        "results": "https://www.espn.com/football/team/results/_/id/789/goztepe"
-    },
-    "Hatayspor": {
-        "results": "https://www.espn.com/football/team/results/_/id/20737/hatayspor"
-    },
-    "Istanbul Basaksehir": {
-        "results": "https://www.espn.com/football/team/results/_/id/7914/istanbul-basaksehir"
-    },
-    "Kasimpasa": {
-        "results": "https://www.espn.com/football/team/results/_/id/6870/kasimpasa"
-    },
-    "Kayserispor": {
-        "results": "https://www.espn.com/football/team/results/_/id/3643/kayserispor"
-    },
-    "Konyaspor": {
-        "results": "https://www.espn.com/football/team/results/_/id/7648/konyaspor"
-    },
-    "Samsunspor": {
-        "results": "https://www.espn.com/football/team/results/_/id/11429/samsunspor"
-    },
-    "Sivasspor": {
-        "results": "https://www.espn.com/football/team/results/_/id/3691/sivasspor"
-    },
-    "Trabzonspor": {
-        "results": "https://www.espn.com/football/team/results/_/id/997/trabzonspor"
-    },
-    "Alianza FC": {
-            "results": "https://www.espn.com/football/team/results/_/id/9761/alianza-fc"
-        },
-        "América de Cali": {
-            "results": "https://www.espn.com/football/team/results/_/id/8109/america-de-cali"
-        },
-        "Atlético Junior": {
-            "results": "https://www.espn.com/football/team/results/_/id/4815/atletico-junior"
-        },
-        "Atlético Nacional": {
-            "results": "https://www.espn.com/football/team/results/_/id/5264/atletico-nacional"
-        },
-        "Boyacá Chicó": {
-            "results": "https://www.espn.com/football/team/results/_/id/5480/boyaca-chico"
-        },
-        "Bucaramanga": {
-            "results": "https://www.espn.com/football/team/results/_/id/6137/bucaramanga"
-        },
-        "Deportes Tolima": {
-            "results": "https://www.espn.com/football/team/results/_/id/5489/deportes-tolima"
-        },
-        "Deportivo Cali": {
-            "results": "https://www.espn.com/football/team/results/_/id/2672/deportivo-cali"
-        },
-        "Deportivo Pasto": {
-            "results": "https://www.espn.com/football/team/results/_/id/5485/deportivo-pasto"
-        },
-        "Deportivo Pereira": {
-            "results": "https://www.espn.com/football/team/results/_/id/5486/deportivo-pereira"
-        },
-        "Envigado": {
-            "results": "https://www.espn.com/football/team/results/_/id/5481/envigado"
-        },
-        "Fortaleza CEIF": {
-            "results": "https://www.espn.com/football/team/results/_/id/4928/fortaleza-ceif"
-        },
-        "Independiente Medellín": {
-            "results": "https://www.espn.com/football/team/results/_/id/2690/independiente-medellin"
-        },
-        "Independiente Santa Fe": {
-            "results": "https://www.espn.com/football/team/results/_/id/5488/independiente-santa-fe"
-        },
-        "La Equidad": {
-            "results": "https://www.espn.com/football/team/results/_/id/7445/la-equidad"
-        },
-        "Llaneros": {
-            "results": "https://www.espn.com/football/team/results/_/id/7915/llaneros"
-        },
-        "Millonarios": {
-            "results": "https://www.espn.com/football/team/results/_/id/5484/millonarios"
-        },
-        "Once Caldas": {
-            "results": "https://www.espn.com/football/team/results/_/id/2919/once-caldas"
-        },
-        "Unión Magdalena": {
-            "results": "https://www.espn.com/football/team/results/_/id/17374/union-magdalena"
-        },
-        "Águilas Doradas": {
-            "results": "https://www.espn.com/football/team/results/_/id/9762/aguilas-doradas"
-        },
-        "Amazonas": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21888/amazonas"
-        },
-        "America Mineiro": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6154/america-mineiro"
-        },
-        "Athletic": {
-            "results": "https://africa.espn.com/football/team/results/_/id/20851/athletic"
-        },
-        "Athletico Paranaense": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3458/athletico-paranaense"
-        },
-        "Atletico Goianiense": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10357/atletico-goianiense"
-        },
-        "Avai": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9966/avai"
-        },
-        "Botafogo Sp": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10281/botafogo-sp"
-        },
-        "Crb": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9970/crb"
-        },
-        "Chapecoense": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9318/chapecoense"
-        },
-        "Coritiba": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3456/coritiba"
-        },
-        "Criciuma": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9971/criciuma"
-        },
-        "Cuiabá": {
-            "results": "https://africa.espn.com/football/team/results/_/id/17313/cuiaba"
-        },
-        "Ferroviária": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18126/ferroviaria"
-        },
-        "Goiás": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3395/goias"
-        },
-        "Novorizontino": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18127/novorizontino"
-        },
-        "Operario PR": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18187/operario-pr"
-        },
-        "Paysandu": {
-            "results": "https://africa.espn.com/football/team/results/_/id/15424/paysandu"
-        },
-        "Remo": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4936/remo"
-        },
-        "Vila Nova": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9973/vila-nova"
-        },
-        "Volta Redonda": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4806/volta-redonda"
-        },
-        "Audax Italiano": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4138/audax-italiano"
-        },
-        "Cobresal": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4133/cobresal"
-        },
-        "Colo Colo": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2688/colo-colo"
-        },
-        "Coquimbo Unido": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8186/coquimbo-unido"
-        },
-        "Deportes Iquique": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10142/deportes-iquique"
-        },
-        "Deportes Limache": {
-            "results": "https://africa.espn.com/football/team/results/_/id/19195/deportes-limache"
-        },
-        "Everton Cd": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4129/everton-cd"
-        },
-        "Huachipato": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4134/huachipato"
-        },
-        "La Serena": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4137/la-serena"
-        },
-        "Ohiggins": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6072/ohiggins"
-        },
-        "Palestino": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4422/palestino"
-        },
-        "Universidad Catolica": {
-            "results": "https://africa.espn.com/football/team/results/_/id/885/universidad-catolica"
-        },
-        "Universidad De Chile": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4139/universidad-de-chile"
-        },
-        "Union Espanola": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4132/union-espanola"
-        },
-        "Union La Calera": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10144/union-la-calera"
-        },
-        "Nublense": {
-            "results": "https://africa.espn.com/football/team/results/_/id/7427/nublense"
-        },
-        "ADT": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21314/adt"
-        },
-        "Alianza Atletico": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5267/alianza-atletico"
-        },
-        "Alianza Lima": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2680/alianza-lima"
-        },
-        "Alianza Universidad": {
-            "results": "https://africa.espn.com/football/team/results/_/id/19432/alianza-universidad"
-        },
-        "Atletico Grau": {
-            "results": "https://africa.espn.com/football/team/results/_/id/20293/atletico-grau"
-        },
-        "Ayacucho Fc": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10116/ayacucho-fc"
-        },
-        "Cienciano Del Cusco": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3372/cienciano-del-cusco"
-        },
-        "Comerciantes Unidos": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18153/comerciantes-unidos"
-        },
-        "Cusco Fc": {
-            "results": "https://africa.espn.com/football/team/results/_/id/11995/cusco-fc"
-        },
-        "Deportivo Binacional": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18985/deportivo-binacional"
-        },
-        "Deportivo Garcilaso": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21819/deportivo-garcilaso"
-        },
-        "Juan Pablo Ii": {
-            "results": "https://africa.espn.com/football/team/results/_/id/22534/juan-pablo-ii"
-        },
-        "Los Chankas": {
-            "results": "https://africa.espn.com/football/team/results/_/id/22168/los-chankas"
-        },
-        "Melgar": {
-            "results": "https://africa.espn.com/football/team/results/_/id/7312/melgar"
-        },
-        "Sport Boys": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5570/sport-boys"
-        },
-        "Sport Huancayo": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10318/sport-huancayo"
-        },
-        "Sporting Cristal": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2673/sporting-cristal"
-        },
-        "Utc": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10122/utc"
-        },
-        "Universitario": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2685/universitario"
-        },
-        "Austria Vienna": {
-            "results": "https://africa.espn.com/football/team/results/_/id/1382/austria-vienna"
-        },
-        "Fc Blau Weiß Linz": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21950/fc-blau-weiß-linz"
-        },
-        "Grazer Ak": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21846/grazer-ak"
-        },
-        "Lask Linz": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4411/lask-linz"
-        },
-        "Rb Salzburg": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2790/rb-salzburg"
-        },
-        "Rapid Vienna": {
-            "results": "https://africa.espn.com/football/team/results/_/id/519/rapid-vienna"
-        },
-        "Sc Rheindorf Altach": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4405/sc-rheindorf-altach"
-        },
-        "Sk Sturm Graz": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3746/sk-sturm-graz"
-        },
-        "Sv Josko Ried": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3759/sv-josko-ried"
-        },
-        "Tsv Hartberg": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6907/tsv-hartberg"
-        },
-        "Wsg Swarovski Tirol": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18794/wsg-swarovski-tirol"
-        },
-        "Wolfsberger": {
-            "results": "https://africa.espn.com/football/team/results/_/id/13294/wolfsberger"
-        },
-        "Aik": {
-            "results": "https://africa.espn.com/football/team/results/_/id/994/aik"
-        },
-        "Bk Hacken": {
-            "results": "https://africa.espn.com/football/team/results/_/id/7834/bk-hacken"
-        },
-        "Degerfors If": {
-            "results": "https://africa.espn.com/football/team/results/_/id/20856/degerfors-if"
-        },
-        "Djurgarden": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2339/djurgarden"
-        },
-        "Gais": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8222/gais"
-        },
-        "Halmstads Bk": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3017/halmstads-bk"
-        },
-        "Hammarby If": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2495/hammarby-if"
-        },
-        "If Brommapojkarna": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8221/if-brommapojkarna"
-        },
-        "If Elfsborg": {
-            "results": "https://africa.espn.com/football/team/results/_/id/529/if-elfsborg"
-        },
-        "Ifk Goteborg": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2556/ifk-goteborg"
-        },
-        "Ifk Norrkoping": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8544/ifk-norrkoping"
-        },
-        "Ifk Varnamo": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21382/ifk-varnamo"
-        },
-        "Ik Sirius": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8547/ik-sirius"
-        },
-        "Malmo Ff": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2720/malmo-ff"
-        },
-        "Mjallby Aif": {
-            "results": "https://africa.espn.com/football/team/results/_/id/20301/mjallby-aif"
-        },
-        "Osters If": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2936/osters-if"
-        },
-        "Agropecuario": {
-            "results": "https://africa.espn.com/football/team/results/_/id/13913/agropecuario"
-        },
-        "All Boys": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9786/all-boys"
-        },
-        "Almagro": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2/almagro"
-        },
-        "Almirante Brown": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9740/almirante-brown"
-        },
-        "Alvarado Mar Del Plata": {
-            "results": "https://africa.espn.com/football/team/results/_/id/19143/alvarado-mar-del-plata"
-        },
-        "Arsenal Sarandi": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2635/arsenal-sarandi"
-        },
-        "Atlanta": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10146/atlanta"
-        },
-        "Central Norte": {
-            "results": "https://africa.espn.com/football/team/results/_/id/11993/central-norte"
-        },
-        "Chacarita Juniors": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6/chacarita-juniors"
-        },
-        "Chaco For Ever": {
-            "results": "https://africa.espn.com/football/team/results/_/id/11963/chaco-for-ever"
-        },
-        "Colegiales": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10149/colegiales"
-        },
-        "Colon Santa Fe": {
-            "results": "https://africa.espn.com/football/team/results/_/id/7/colon-santa-fe"
-        },
-        "Defensores Unidos": {
-            "results": "https://africa.espn.com/football/team/results/_/id/17697/defensores-unidos"
-        },
-        "Defensores De Belgrano": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10151/defensores-de-belgrano"
-        },
-        "Deportivo Madryn": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18260/deportivo-madryn"
-        },
-        "Deportivo Maipu": {
-            "results": "https://africa.espn.com/football/team/results/_/id/11978/deportivo-maipu"
-        },
-        "Deportivo Moron": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10154/deportivo-moron"
-        },
-        "Estudiantes Buenos Aires": {
-            "results": "https://africa.espn.com/football/team/results/_/id/17352/estudiantes-buenos-aires"
-        },
-        "Estudiantes De Rio Cuarto": {
-            "results": "https://africa.espn.com/football/team/results/_/id/19685/estudiantes-de-rio-cuarto"
-        },
-        "Ferro Carril Oeste": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9743/ferro-carril-oeste"
-        },
-        "Gimnasia Mendoza": {
-            "results": "https://africa.espn.com/football/team/results/_/id/11972/gimnasia-mendoza"
-        },
-        "Gimnasia Y Esgrima Jujuy": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5263/gimnasia-y-esgrima-jujuy"
-        },
-        "Gimnasia Y Tiro Salta": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10743/gimnasia-y-tiro-salta"
-        },
-        "Guemes": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18284/guemes"
-        },
-        "Los Andes": {
-            "results": "https://africa.espn.com/football/team/results/_/id/13/los-andes"
-        },
-        "Mitre Santiago Del Estero": {
-            "results": "https://africa.espn.com/football/team/results/_/id/11990/mitre-santiago-del-estero"
-        },
-        "Nueva Chicago": {
-            "results": "https://africa.espn.com/football/team/results/_/id/236/nueva-chicago"
-        },
-        "Patronato": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10374/patronato"
-        },
-        "Quilmes": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2741/quilmes"
-        },
-        "Racing Cordoba": {
-            "results": "https://africa.espn.com/football/team/results/_/id/19145/racing-cordoba"
-        },
-        "San Martin Tucuman": {
-            "results": "https://africa.espn.com/football/team/results/_/id/17814/san-martin-tucuman"
-        },
-        "San Miguel": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10058/san-miguel"
-        },
-        "San Telmo": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10157/san-telmo"
-        },
-        "Talleres": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10161/talleres"
-        },
-        "Temperley": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10162/temperley"
-        },
-        "Tristan Suarez": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10163/tristan-suarez"
-        },
-        "2 de Mayo": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6097/2-de-mayo"
-        },
-        "Cerro Porteno": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2671/cerro-porteno"
-        },
-        "Club Atletico Tembetary": {
-            "results": "https://africa.espn.com/football/team/results/_/id/22518/club-atletico-tembetary"
-        },
-        "Deportivo Recoleta": {
-            "results": "https://africa.espn.com/football/team/results/_/id/22517/deportivo-recoleta"
-        },
-        "General Caballero JLM": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21316/general-caballero-jlm"
-        },
-        "Guarani": {
-            "results": "https://africa.espn.com/football/team/results/_/id/7385/guarani"
-        },
-        "Libertad": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2670/libertad"
-        },
-        "Nacional": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5584/nacional"
-        },
-        "Olimpia": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2675/olimpia"
-        },
-        "Sportivo Ameliano": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21313/sportivo-ameliano"
-        },
-        "Sportivo Luqueño": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5583/sportivo-luqueno"
-        },
-        "Trinidense": {
-            "results": "https://africa.espn.com/football/team/results/_/id/7466/trinidense"
-        },
-        "Academia Anzoategui": {
-            "results": "https://africa.espn.com/football/team/results/_/id/13783/academia-anzoategui"
-        },
-        "Academia Puerto Cabello": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18995/academia-puerto-cabello"
-        },
-        "Carabobo": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6037/carabobo"
-        },
-        "Caracas FC": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4811/caracas-fc"
-        },
-        "Deportivo La Guaira": {
-            "results": "https://africa.espn.com/football/team/results/_/id/17090/deportivo-la-guaira"
-        },
-        "Deportivo Rayo Zuliano": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21850/deportivo-rayo-zuliano"
-        },
-        "Deportivo Tachira": {
-            "results": "https://africa.espn.com/football/team/results/_/id/4818/deportivo-tachira"
-        },
-        "Estudiantes de Merida": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6038/estudiantes-de-merida"
-        },
-        "Metropolitanos Fc": {
-            "results": "https://africa.espn.com/football/team/results/_/id/13481/metropolitanos-fc"
-        },
-        "Monagas Sc": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6041/monagas-sc"
-        },
-        "Portuguesa": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6762/portuguesa"
-        },
-        "Universidad Central": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10094/universidad-central"
-        },
-        "Yaracuyanos": {
-            "results": "https://africa.espn.com/football/team/results/_/id/10096/yaracuyanos"
-        },
-        "Zamora": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6763/zamora"
-        },
-        "Cfr Cluj Napoca": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5260/cfr-cluj-napoca"
-        },
-        "Csu Craiova": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8089/csu-craiova"
-        },
-        "Csikszereda": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21032/csikszereda"
-        },
-        "Dinamo Bucuresti": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2496/dinamo-bucuresti"
-        },
-        "Fc Arges": {
-            "results": "https://africa.espn.com/football/team/results/_/id/20725/fc-arges"
-        },
-        "Fc Botosani": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9682/fc-botosani"
-        },
-        "Fc Farul Constanta": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6731/fc-farul-constanta"
-        },
-        "Fcsb": {
-            "results": "https://africa.espn.com/football/team/results/_/id/484/fcsb"
-        },
-        "Hermannstadt": {
-            "results": "https://africa.espn.com/football/team/results/_/id/19265/hermannstadt"
-        },
-        "Metaloglobus": {
-            "results": "https://africa.espn.com/football/team/results/_/id/130880/metaloglobus"
-        },
-        "Otelul Galati": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2942/otelul-galati"
-        },
-        "Petrolul Ploiesti": {
-            "results": "https://africa.espn.com/football/team/results/_/id/12603/petrolul-ploiesti"
-        },
-        "Rapid Bucuresti": {
-            "results": "https://africa.espn.com/football/team/results/_/id/545/rapid-bucuresti"
-        },
-        "Uta Arad": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6912/uta-arad"
-        },
-        "Unirea Slobozia": {
-            "results": "https://africa.espn.com/football/team/results/_/id/22314/unirea-slobozia"
-        },
-        "Universitatea Cluj": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8091/universitatea-cluj"
-        },
-        "Beitar Jerusalem": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5218/beitar-jerusalem"
-        },
-        "Bnei Sakhnin": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8329/bnei-sakhnin"
-        },
-        "Hapoel Beer": {
-            "results": "https://africa.espn.com/football/team/results/_/id/13083/hapoel-beer"
-        },
-        "Hapoel Hadera": {
-            "results": "https://africa.espn.com/football/team/results/_/id/19255/hapoel-hadera"
-        },
-        "Hapoel Haifa": {
-            "results": "https://africa.espn.com/football/team/results/_/id/9577/hapoel-haifa"
-        },
-        "Hapoel Jerusalem": {
-            "results": "https://africa.espn.com/football/team/results/_/id/20970/hapoel-jerusalem"
-        },
-        "Hapoel Kiryat Shmona": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8327/hapoel-kiryat-shmona"
-        },
-        "Ironi Tiberias": {
-            "results": "https://africa.espn.com/football/team/results/_/id/22311/ironi-tiberias"
-        },
-        "Maccabi Haifa": {
-            "results": "https://africa.espn.com/football/team/results/_/id/611/maccabi-haifa"
-        },
-        "Maccabi Netanya": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5945/maccabi-netanya"
-        },
-        "Maccabi Petah Tikva": {
-            "results": "https://africa.espn.com/football/team/results/_/id/2983/maccabi-petah-tikva"
-        },
-        "Maccabi Raina": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21517/maccabi-raina"
-        },
-        "Maccabi Tel Aviv": {
-            "results": "https://africa.espn.com/football/team/results/_/id/524/maccabi-tel-aviv"
-        },
-        "Moadon Sport Ashdod": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5269/moadon-sport-ashdod"
-        },
-        "Afc Fylde": {
-            "results": "https://africa.espn.com/football/team/results/_/id/13884/afc-fylde"
-        },
-        "Aldershot Town": {
-            "results": "https://africa.espn.com/football/team/results/_/id/632/aldershot-town"
-        },
-        "Altrincham": {
-            "results": "https://africa.espn.com/football/team/results/_/id/633/altrincham"
-        },
-        "Barnet": {
-            "results": "https://africa.espn.com/football/team/results/_/id/280/barnet"
-        },
-        "Boston United": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3256/boston-united"
-        },
-        "Braintree Town": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3828/braintree-town"
-        },
-        "Dagenham Redbridge": {
-            "results": "https://africa.espn.com/football/team/results/_/id/275/dagenham-redbridge"
-        },
-        "Eastleigh": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3897/eastleigh"
-        },
-        "Ebbsfleet United": {
-            "results": "https://africa.espn.com/football/team/results/_/id/640/ebbsfleet-united"
-        },
-        "Fc Halifax Town": {
-            "results": "https://africa.espn.com/football/team/results/_/id/312/fc-halifax-town"
-        },
-        "Forest Green Rovers": {
-            "results": "https://africa.espn.com/football/team/results/_/id/282/forest-green-rovers"
-        },
-        "Gateshead": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3138/gateshead"
-        },
-        "Hartlepool United": {
-            "results": "https://africa.espn.com/football/team/results/_/id/323/hartlepool-united"
-        },
-        "Maidenhead United": {
-            "results": "https://africa.espn.com/football/team/results/_/id/7156/maidenhead-united"
-        },
-        "Oldham Athletic": {
-            "results": "https://africa.espn.com/football/team/results/_/id/332/oldham-athletic"
-        },
-        "Rochdale": {
-            "results": "https://africa.espn.com/football/team/results/_/id/303/rochdale"
-        },
-        "Solihull Moors": {
-            "results": "https://africa.espn.com/football/team/results/_/id/13061/solihull-moors"
-        },
-        "Southend United": {
-            "results": "https://africa.espn.com/football/team/results/_/id/310/southend-united"
-        },
-        "Sutton United": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3231/sutton-united"
-        },
-        "Tamworth": {
-            "results": "https://africa.espn.com/football/team/results/_/id/645/tamworth"
-        },
-        "Wealdstone": {
-            "results": "https://africa.espn.com/football/team/results/_/id/3887/wealdstone"
-        },
-        "Woking": {
-            "results": "https://africa.espn.com/football/team/results/_/id/290/woking"
-        },
-        "Yeovil Town": {
-            "results": "https://africa.espn.com/football/team/results/_/id/284/yeovil-town"
-        },
-        "York City": {
-            "results": "https://africa.espn.com/football/team/results/_/id/315/york-city"
-        },
-        "Aek Athens": {
-            "results": "https://africa.espn.com/football/team/results/_/id/887/aek-athens"
-        },
-        "Aris": {
-            "results": "https://africa.espn.com/football/team/results/_/id/11553/aris"
-        },
-        "Asteras Tripoli": {
-            "results": "https://africa.espn.com/football/team/results/_/id/8354/asteras-tripoli"
-        },
-        "Athens Kallithea": {
-            "results": "https://africa.espn.com/football/team/results/_/id/22325/athens-kallithea"
-        },
-        "Atromitos": {
-            "results": "https://africa.espn.com/football/team/results/_/id/6790/atromitos"
-        },
-        "Lamia": {
-            "results": "https://africa.espn.com/football/team/results/_/id/18814/lamia"
-        },
-        "Levadiakos": {
-            "results": "https://africa.espn.com/football/team/results/_/id/5276/levadiakos"
-        },
-        "Ofi Crete": {
-            "results": "https://africa.espn.com/football/team/results/_/id/1010/ofi-crete"
-        },
-        "Olympiacos": {
-            "results": "https://africa.espn.com/football/team/results/_/id/435/olympiacos"
-        },
-        "Paok Salonika": {
-            "results": "https://africa.espn.com/football/team/results/_/id/605/paok-salonika"
-        },
-        "Panathinaikos": {
-            "results": "https://africa.espn.com/football/team/results/_/id/443/panathinaikos"
-        },
-        "Panetolikos": {
-            "results": "https://africa.espn.com/football/team/results/_/id/11431/panetolikos"
-        },
-        "Panserraikos Fc": {
-            "results": "https://africa.espn.com/football/team/results/_/id/21970/panserraikos-fc"
-        },
-        "Volos Nfc": {
-            "results": "https://africa.espn.com/football/team/results/_/id/20043/volos-nfc"
-        }
-    # Ajoutez d'autres équipes si besoin
-}
-headers = {'User-Agent': 'Mozilla/5.0'}
+def creer_session_http():
+    """
+    Crée la session HTTP partagée : pools keep-alive par hôte, dimensionnés pour le nombre
+    de workers (évite de refaire le handshake TLS à chaque requête).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(10, MAX_WORKERS * 2))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+HTTP_SESSION = creer_session_http()
+
+def http_get(url, **kwargs):
+    """GET via la session partagée, avec timeout par défaut."""
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    return HTTP_SESSION.get(url, **kwargs)
+
+def http_get_page(url, **kwargs):
+    """GET d'une page HTML à scraper : comme http_get, avec les en-têtes de navigateur."""
+    kwargs["headers"] = {**HTTP_HEADERS_NAVIGATEUR, **(kwargs.get("headers") or {})}
+    return http_get(url, **kwargs)
+
+def http_post(url, **kwargs):
+    """POST via la session partagée, avec timeout par défaut."""
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    return HTTP_SESSION.post(url, **kwargs)
+
+# 🗃️ Caches par exécution (partagés entre workers)
+_VERROU_CACHES = threading.Lock()
+
+def obtenir_ou_calculer(cache, cle, fabrique):
+    """
+    Retourne cache[cle] en ne calculant la valeur (fabrique()) qu'une seule fois par exécution,
+    même si plusieurs workers la demandent simultanément (verrou par clé).
+    """
+    with _VERROU_CACHES:
+        entree = cache.get(cle)
+        if entree is None:
+            entree = cache[cle] = {"verrou": threading.Lock(), "pret": False, "valeur": None}
+    if entree["pret"]:
+        return entree["valeur"]
+    with entree["verrou"]:
+        if not entree["pret"]:
+            entree["valeur"] = fabrique()
+            entree["pret"] = True
+    return entree["valeur"]
+
+# 🗄️ Cache persistant SQLite (hors dépôt : .gitignore, conservé d'un jour à l'autre par actions/cache dans le workflow)
+CACHE_DIR = os.getenv("ANALYSE_CACHE_DIR", "cache")
+# Les stats d'un match terminé ne changent plus, mais on ne garde que celles des saisons récentes (H2H)
+CACHE_STATS_MAX_JOURS = int(os.getenv("CACHE_STATS_MAX_JOURS", "400"))
+CACHE_DB = os.path.join(CACHE_DIR, "analyse_cache.sqlite3")
+_VERROU_CACHE_DB = threading.Lock()
+_connexion_cache_db = None
+
+def get_cache_db():
+    """Ouvre (une fois) la base SQLite du cache persistant et crée les tables si besoin."""
+    global _connexion_cache_db
+    if _connexion_cache_db is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        connexion = sqlite3.connect(CACHE_DB, check_same_thread=False)
+        connexion.execute(
+            "CREATE TABLE IF NOT EXISTS match_stats ("
+            "game_id TEXT PRIMARY KEY, stats TEXT NOT NULL, date_ajout TEXT NOT NULL)"
+        )
+        connexion.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "cle TEXT PRIMARY KEY, reponse TEXT NOT NULL, cree_le REAL NOT NULL, dernier_acces REAL NOT NULL)"
+        )
+        connexion.commit()
+        entretenir_cache_db(connexion)
+        _connexion_cache_db = connexion
+    return _connexion_cache_db
+
+def entretenir_cache_db(connexion):
+    """Purge les entrées trop anciennes puis compacte le fichier (VACUUM), une fois par exécution."""
+    try:
+        limite = (datetime.now() - timedelta(days=CACHE_STATS_MAX_JOURS)).strftime('%Y-%m-%d %H:%M:%S')
+        supprimees = connexion.execute("DELETE FROM match_stats WHERE date_ajout < ?", (limite,)).rowcount
+        purger_cache_llm(connexion)
+        connexion.commit()
+        connexion.execute("VACUUM")
+        if supprimees:
+            print(f"🧹 Cache SQLite : {supprimees} entrée(s) de stats expirée(s) supprimée(s)")
+    except Exception as e:
+        print(f"⚠️ Entretien du cache SQLite impossible : {e}")
+
+def lire_stats_match_cache(game_id):
+    """Retourne les stats d'un match terminé déjà en cache, ou None si le game_id est inconnu."""
+    try:
+        with _VERROU_CACHE_DB:
+            ligne = get_cache_db().execute(
+                "SELECT stats FROM match_stats WHERE game_id = ?", (str(game_id),)
+            ).fetchone()
+        return json.loads(ligne[0]) if ligne else None
+    except Exception as e:
+        print(f"⚠️ Lecture du cache des stats impossible pour {game_id} : {e}")
+        return None
+
+def enregistrer_stats_match_cache(game_id, stats):
+    """Mémorise les stats d'un match terminé (elles ne changent plus)."""
+    try:
+        with _VERROU_CACHE_DB:
+            connexion = get_cache_db()
+            connexion.execute(
+                "INSERT OR REPLACE INTO match_stats (game_id, stats, date_ajout) VALUES (?, ?, ?)",
+                (str(game_id), json.dumps(stats, ensure_ascii=False), datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            )
+            connexion.commit()
+    except Exception as e:
+        print(f"⚠️ Écriture du cache des stats impossible pour {game_id} : {e}")
+
+# 📚 Registres (équipes ESPN, mapping des noms, ligues) : fichier de données versionné, chargé à la demande
+REGISTRES_CACHE = {}
+VERSION_REGISTRES = 1
+REGEX_ID_EQUIPE_ESPN = re.compile(r"/id/(\d+)/")
+
+def registres():
+    """Contenu de FICHIER_REGISTRES, lu une seule fois par exécution (au premier besoin, pas à l'import)."""
+    def _charger():
+        with open(FICHIER_REGISTRES, "r", encoding="utf-8") as f:
+            contenu = json.load(f)
+        if contenu.get("version") != VERSION_REGISTRES:
+            print(f"⚠️ Version des registres inattendue dans {FICHIER_REGISTRES} : {contenu.get('version')} (attendue : {VERSION_REGISTRES})")
+        print(f"📚 Registres chargés : {len(contenu.get('teams_urls', {}))} équipe(s), "
+              f"{sum(len(ligues) for ligues in contenu.get('classement_ligue_mapping', {}).values())} ligue(s)")
+        return contenu
+    return obtenir_ou_calculer(REGISTRES_CACHE, "brut", _charger)
+
+def equipes_espn():
+    """
+    Index des équipes ESPN : {nom ESPN: {"id": identifiant ESPN, "results": url, ...}}.
+    L'identifiant est extrait une fois au chargement au lieu d'à chaque scrape_team_data.
+    """
+    def _construire():
+        index = {}
+        for nom, urls in registres().get("teams_urls", {}).items():
+            index[nom] = dict(urls, id=extract_team_id_from_url(urls.get("results")))
+        return index
+    return obtenir_ou_calculer(REGISTRES_CACHE, "equipes", _construire)
+
+def mapping_noms_equipes():
+    """Mapping des noms API-Football vers les noms ESPN."""
+    return registres().get("team_name_mapping", {})
+
+def ligues_autorisees():
+    """Identifiants API-Football des ligues analysées."""
+    return obtenir_ou_calculer(REGISTRES_CACHE, "autorisees", lambda: frozenset(registres().get("allowed_league_ids", [])))
+
+def index_ligues():
+    """
+    Index des ligues : {"par_nom": {(pays, ligue): infos}, "par_id": {id API-Football: infos}}
+    avec infos = {"pays", "ligue", "url", "odds_id", "data_json"}. par_id est appris des réponses de l'API.
+    """
+    def _construire():
+        par_nom = {}
+        for pays, ligues in registres().get("classement_ligue_mapping", {}).items():
+            for ligue, infos in ligues.items():
+                par_nom[(pays, ligue)] = {
+                    "pays": pays,
+                    "ligue": ligue,
+                    "url": infos.get("url"),
+                    "odds_id": infos.get("odds_id", "none"),
+                    "data_json": infos.get("data_json", "none"),
+                }
+        return {"par_nom": par_nom, "par_id": {}}
+    return obtenir_ou_calculer(REGISTRES_CACHE, "ligues", _construire)
+
+def apprendre_ligue(league_id, country, league):
+    """Associe l'identifiant API-Football d'une ligue à ses infos (pays et nom tels que renvoyés par l'API)."""
+    index = index_ligues()
+    infos = index["par_nom"].get((country, league))
+    if league_id is not None and infos and league_id not in index["par_id"]:
+        index["par_id"][league_id] = infos
+    return infos
+
+def info_ligue(country, league, league_id=None):
+    """Infos de classement/cotes/H2H d'une ligue : par identifiant API-Football si connu, sinon par pays et nom."""
+    index = index_ligues()
+    return index["par_id"].get(league_id) or index["par_nom"].get((country, league))
 
-PREDICTIONS = []
 FAILED_TEAMS = set()
 IGNORED_ZERO_FORM_TEAMS = []
 
@@ -2182,17 +290,17 @@ def get_match_stats(game_id):
     """
     Récupère les statistiques détaillées d'un match ESPN via son game_id.
     Retourne un dict { "Possession": (home, away), ... }
+    Les matchs terminés sont servis depuis le cache persistant ; seuls les game_id inconnus sont téléchargés.
     """
+    stats_cache = lire_stats_match_cache(game_id)
+    if stats_cache is not None:
+        print(f"🗄️ Stats du match {game_id} servies depuis le cache : {len(stats_cache)} statistiques")
+        return stats_cache
+
     url = f"https://africa.espn.com/football/match/_/gameId/{game_id}"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/117.0.0.0 Safari/537.36",
-        "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7"
-    }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = http_get_page(url)
         response.raise_for_status()
         soup = BeautifulSoup(response.text, "html.parser")
 
@@ -2212,47 +320,645 @@ def get_match_stats(game_id):
                 stats[stat_name] = (team1_value, team2_value)
 
         print(f"📊 Stats récupérées pour match {game_id}: {len(stats)} statistiques trouvées")
+        if stats:
+            enregistrer_stats_match_cache(game_id, stats)
         return stats
 
     except Exception as e:
         print(f"❌ Erreur récupération stats match {game_id} : {e}")
         return {}
 
-# 🧠 Fonction DeepSeek avec alternance automatique des clés et retry automatique (VERSION AMÉLIORÉE)
-def call_deepseek_analysis(prompt, max_retries=5):
-    global groq_key_index
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_MODEL = "openai/gpt-oss-120b"
+GROQ_TEMPERATURE = 0.5
+GROQ_SYSTEM_PROMPT = "Tu es un expert en paris sportifs. Ton rôle est de faire une analyse complète du match en fonction des données fournies, puis de proposer UNE prédiction fiable parmi : victoire domicile, victoire extérieur, +2.5 buts, -2.5 buts, BTTS oui, BTTS non, double chance (1X ou X2). Tu dois aussi donner un pourcentage de confiance (0-100%) et les 2 scores les plus probables. ATTENTION : Ne jamais prédire 'match nul' - utilise plutôt 'double chance 1X' ou 'double chance X2'. Ta mission Faire la prédiction la plus probable et précise."
+
+GROQ_SYSTEM_PROMPT_JSON = GROQ_SYSTEM_PROMPT + " Réponds UNIQUEMENT avec un objet JSON conforme au schéma fourni : prediction_principale, confiance_pourcentage (entier 0-100), scores_probables (les 2 scores les plus probables, ex: \"1-0\") et justification (ton analyse détaillée)."
+GROQ_SCHEMA_ANALYSE = {
+    "type": "object",
+    "properties": {
+        "prediction_principale": {"type": "string"},
+        "confiance_pourcentage": {"type": "integer"},
+        "scores_probables": {"type": "array", "items": {"type": "string"}},
+        "justification": {"type": "string"}
+    },
+    "required": ["prediction_principale", "confiance_pourcentage", "scores_probables", "justification"],
+    "additionalProperties": False
+}
 
-    for attempt in range(1, max_retries + 1):
-        key = groq_keys[groq_key_index % len(groq_keys)]
-        groq_key_index += 1
+def parse_duree_groq(valeur):
+    """Convertit une durée Groq ("2m59.56s", "7.66s", "120ms", "1h2m") ou un Retry-After ("12") en secondes."""
+    if not valeur:
+        return None
+    valeur = valeur.strip()
+    try:
+        return float(valeur)
+    except ValueError:
+        pass
+    total = 0.0
+    morceaux = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", valeur)
+    for nombre, unite in morceaux:
+        total += float(nombre) * {"ms": 0.001, "s": 1, "m": 60, "h": 3600}[unite]
+    return total if morceaux else None
+
+# 🔑 Pool de clés Groq : seau à jetons par clé + routage selon la marge restante et la latence
+class PoolClesGroq:
+    def __init__(self, cles, requetes_par_minute=GROQ_REQUETES_PAR_MINUTE):
+        if not requetes_par_minute > 0:
+            # Débit nul : aucun jeton ne serait jamais rechargé (et division par zéro dans acquerir)
+            raise ValueError(f"GROQ_REQUETES_PAR_MINUTE doit être strictement positif (reçu : {requetes_par_minute})")
+        self.condition = threading.Condition()
+        self.debit = requetes_par_minute / 60.0              # jetons rechargés par seconde
+        self.capacite = max(1.0, requetes_par_minute / 6.0)  # rafale autorisée par clé
+        maintenant = time.monotonic()
+        self.cles = [
+            {
+                "numero": i + 1,
+                "valeur": cle,
+                "jetons": self.capacite,
+                "derniere_recharge": maintenant,
+                "bloquee_jusqua": 0.0,
+                "limite_requetes": None,
+                "requetes_restantes": None,
+                "limite_tokens": None,
+                "tokens_restants": None,
+                "latence": None,  # moyenne mobile exponentielle (secondes)
+                "erreurs": 0
+            }
+            for i, cle in enumerate(c for c in cles if c)
+        ]
 
-        headers = {
-            "Authorization": f"Bearer {key}",
-            "Content-Type": "application/json"
-        }
+    def _recharger(self, cle, maintenant):
+        ecoule = maintenant - cle["derniere_recharge"]
+        cle["jetons"] = min(self.capacite, cle["jetons"] + ecoule * self.debit)
+        cle["derniere_recharge"] = maintenant
+
+    def _marge(self, cle):
+        """Part de capacité restante la plus contraignante (seau local, requêtes et tokens annoncés par Groq)."""
+        marges = [cle["jetons"] / self.capacite]
+        if cle["limite_requetes"] and cle["requetes_restantes"] is not None:
+            marges.append(cle["requetes_restantes"] / cle["limite_requetes"])
+        if cle["limite_tokens"] and cle["tokens_restants"] is not None:
+            marges.append(cle["tokens_restants"] / cle["limite_tokens"])
+        return min(marges)
+
+    def acquerir(self, exclure=None, attendre=True):
+        """
+        Réserve la clé disponible ayant le plus de marge (puis la latence récente la plus faible),
+        en attendant si toutes sont épuisées ou bloquées (429). Sûr en appel concurrent.
+        exclure : numéros de clés à éviter si une autre est disponible.
+        attendre=False : exclusion stricte, retourne None immédiatement si aucune autre clé n'est libre.
+        """
+        exclure = exclure or set()
+        with self.condition:
+            while True:
+                maintenant = time.monotonic()
+                candidates = []
+                for cle in self.cles:
+                    self._recharger(cle, maintenant)
+                    if cle["bloquee_jusqua"] <= maintenant and cle["jetons"] >= 1:
+                        candidates.append(cle)
+                preferees = [c for c in candidates if c["numero"] not in exclure]
+                if attendre and not preferees:
+                    preferees = candidates
+                if preferees:
+                    cle = max(preferees, key=lambda c: (round(self._marge(c), 2), -(c["latence"] or 0.0)))
+                    cle["jetons"] -= 1
+                    return cle
+                if not attendre:
+                    return None
+
+                # Attendre la prochaine clé disponible (fin de blocage ou recharge d'un jeton)
+                attentes = [
+                    max(cle["bloquee_jusqua"] - maintenant, (1 - cle["jetons"]) / self.debit, 0.05)
+                    for cle in self.cles
+                ]
+                self.condition.wait(timeout=min(attentes))
+
+    def enregistrer_reponse(self, cle, response, latence):
+        """Met à jour la clé d'après les en-têtes x-ratelimit-* / Retry-After et la latence observée."""
+        entetes = response.headers
+        with self.condition:
+            maintenant = time.monotonic()
+            for nom, champ, conversion in (
+                ("x-ratelimit-limit-requests", "limite_requetes", int),
+                ("x-ratelimit-remaining-requests", "requetes_restantes", int),
+                ("x-ratelimit-limit-tokens", "limite_tokens", int),
+                ("x-ratelimit-remaining-tokens", "tokens_restants", int),
+            ):
+                try:
+                    if entetes.get(nom) is not None:
+                        cle[champ] = conversion(entetes.get(nom))
+                except ValueError:
+                    pass
+
+            if response.status_code == 429:
+                attente = (parse_duree_groq(entetes.get("retry-after"))
+                           or parse_duree_groq(entetes.get("x-ratelimit-reset-requests"))
+                           or 10.0)
+                cle["bloquee_jusqua"] = maintenant + attente
+                cle["erreurs"] += 1
+                print(f"⏳ Clé Groq {cle['numero']} limitée (429) : pause de {attente:.1f}s")
+            else:
+                if cle["requetes_restantes"] == 0:
+                    cle["bloquee_jusqua"] = maintenant + (parse_duree_groq(entetes.get("x-ratelimit-reset-requests")) or 1.0)
+                elif cle["tokens_restants"] == 0:
+                    cle["bloquee_jusqua"] = maintenant + (parse_duree_groq(entetes.get("x-ratelimit-reset-tokens")) or 1.0)
+                if response.status_code < 400:
+                    cle["latence"] = latence if cle["latence"] is None else 0.7 * cle["latence"] + 0.3 * latence
+                    cle["erreurs"] = 0
+                else:
+                    cle["erreurs"] += 1
+                    cle["bloquee_jusqua"] = max(cle["bloquee_jusqua"], maintenant + min(2.0 * cle["erreurs"], 30.0))
+            self.condition.notify_all()
+
+    def enregistrer_erreur(self, cle):
+        """Erreur réseau sans réponse : courte mise à l'écart de la clé (recul progressif)."""
+        with self.condition:
+            cle["erreurs"] += 1
+            cle["bloquee_jusqua"] = time.monotonic() + min(2.0 * cle["erreurs"], 30.0)
+            self.condition.notify_all()
+
+POOL_GROQ = PoolClesGroq(groq_keys)
+
+# ⏱️ Latences récentes des complétions et statistiques de hedging
+LATENCES_LLM = []
+STATS_HEDGING = {
+    "requetes": 0, "hedges": 0, "hedges_gagnants": 0, "reponses_perdantes": 0, "requetes_annulees": 0,
+    "tokens_gaspilles_perdantes": 0,        # usage réel des réponses perdantes arrivées malgré tout
+    "tokens_gaspilles_annulees_estimes": 0,  # prompt + sortie reçue des requêtes annulées (estimation)
+    "tokens_gaspilles": 0                    # total des deux
+}
+_VERROU_STATS_LLM = threading.Lock()
+
+class FluxInterrompu(Exception):
+    """Flux SSE coupé en cours de génération (timeout, connexion) ; porte le texte déjà reçu."""
+    def __init__(self, message, texte_partiel):
+        super().__init__(message)
+        self.texte_partiel = texte_partiel
+
+class RequeteAnnulee(Exception):
+    """
+    Requête Groq abandonnée volontairement (hedge perdant) : ni erreur de clé, ni nouvelle tentative.
+    envoyee : la requête est partie (prompt facturé) ; texte_partiel : sortie déjà générée et reçue.
+    """
+    def __init__(self, message, envoyee=True, texte_partiel=""):
+        super().__init__(message)
+        self.envoyee = envoyee
+        self.texte_partiel = texte_partiel
+
+class AnnulationRequete:
+    """
+    Jeton d'annulation d'une requête Groq : annuler() ferme la réponse en cours de lecture,
+    ce qui coupe la connexion et arrête la génération côté Groq (le flux SSE vérifie aussi le drapeau).
+    """
+
+    def __init__(self):
+        self.verrou = threading.Lock()
+        self.annulee = False
+        self.response = None
+
+    def enregistrer(self, response):
+        """Associe la réponse reçue ; la ferme aussitôt si l'annulation est déjà demandée."""
+        with self.verrou:
+            self.response = response
+            annulee = self.annulee
+        if annulee:
+            response.close()
+            raise RequeteAnnulee("requête annulée")
+
+    def annuler(self):
+        with self.verrou:
+            self.annulee = True
+            response = self.response
+        if response is not None:
+            response.close()
+
+def _lire_flux_groq(response, sur_fragment=None, echeance=None, annulation=None):
+    """
+    Assemble une complétion SSE (lignes "data: {...}" jusqu'à "data: [DONE]").
+    sur_fragment(texte_cumule) est appelé à chaque fragment contenant un saut de ligne.
+    Retourne (contenu, usage) ; lève FluxInterrompu si le flux est coupé ou dépasse l'échéance,
+    RequeteAnnulee si annulation est déclenchée pendant la lecture.
+    """
+    morceaux = []
+    usage = {}
+    try:
+        for ligne in response.iter_lines():
+            if annulation and annulation.annulee:
+                break
+            if echeance and time.monotonic() > echeance:
+                raise TimeoutError(f"génération au-delà de {LLM_HTTP_TIMEOUT}s")
+            ligne = ligne.decode("utf-8") if isinstance(ligne, bytes) else ligne
+            if not ligne.startswith("data:"):
+                continue
+            charge = ligne[5:].strip()
+            if charge == "[DONE]":
+                break
+            evenement = json.loads(charge)
+            usage = evenement.get("usage") or (evenement.get("x_groq") or {}).get("usage") or usage
+            choix = evenement.get("choices") or [{}]
+            fragment = (choix[0].get("delta") or {}).get("content")
+            if fragment:
+                morceaux.append(fragment)
+                if sur_fragment and "\n" in fragment:
+                    sur_fragment("".join(morceaux))
+    except Exception as e:
+        if annulation and annulation.annulee:
+            raise RequeteAnnulee("flux fermé après annulation", texte_partiel="".join(morceaux)) from e
+        raise FluxInterrompu(str(e), "".join(morceaux).strip()) from e
+    if annulation and annulation.annulee:
+        raise RequeteAnnulee("flux abandonné après annulation", texte_partiel="".join(morceaux))
+    return "".join(morceaux).strip(), usage
+
+def _envoyer_requete_groq(data, cle, sur_fragment=None, annulation=None):
+    """
+    Envoie une complétion sur une clé du pool. Retourne (contenu, usage) ; lève une exception en cas d'échec.
+    Si data["stream"], la réponse est lue en flux SSE et sur_fragment reçoit le texte au fil de l'eau.
+    annulation (AnnulationRequete) permet d'abandonner la requête depuis un autre thread.
+    """
+    if annulation and annulation.annulee:
+        raise RequeteAnnulee("requête annulée avant envoi", envoyee=False)
+    headers = {
+        "Authorization": f"Bearer {cle['valeur']}",
+        "Content-Type": "application/json"
+    }
+    streaming = bool(data.get("stream"))
+    print(f"🧠 Requête Groq avec clé {cle['numero']}{' (streaming)' if streaming else ''}...")
+    debut = time.monotonic()
+    try:
+        response = http_post(GROQ_URL, headers=headers, json=data, timeout=LLM_HTTP_TIMEOUT, stream=streaming)
+    except Exception:
+        POOL_GROQ.enregistrer_erreur(cle)
+        raise
+    latence = time.monotonic() - debut
+    POOL_GROQ.enregistrer_reponse(cle, response, latence)
+    if annulation and streaming:
+        # Sans streaming la réponse est déjà complète : elle est comptée comme perdante avec son usage réel
+        annulation.enregistrer(response)
+    # Réponse fermée même sur 429/5xx : en streaming le corps n'est pas lu et la connexion resterait prise au pool
+    with response:
+        response.raise_for_status()
+        if streaming:
+            try:
+                contenu, usage = _lire_flux_groq(response, sur_fragment, echeance=debut + LLM_HTTP_TIMEOUT, annulation=annulation)
+            except FluxInterrompu:
+                POOL_GROQ.enregistrer_erreur(cle)
+                raise
+            latence = time.monotonic() - debut
+        else:
+            corps = response.json()
+            contenu, usage = corps["choices"][0]["message"]["content"].strip(), corps.get("usage", {})
+    with _VERROU_STATS_LLM:
+        LATENCES_LLM.append(latence)
+        del LATENCES_LLM[:-200]
+    return contenu, usage
+
+def delai_hedging():
+    """Délai avant d'envoyer le doublon : percentile LLM_HEDGING_PERCENTILE des latences récentes."""
+    with _VERROU_STATS_LLM:
+        latences = list(LATENCES_LLM)
+    if len(latences) < 10:
+        return LLM_HEDGING_DELAI_DEFAUT
+    return float(np.percentile(latences, LLM_HEDGING_PERCENTILE))
+
+def estimer_tokens_requete(data):
+    """Tokens d'entrée estimés d'une requête Groq (messages système et utilisateur, même estimation que les prompts)."""
+    return sum(estimer_tokens(str(message.get("content") or "")) for message in data.get("messages", []))
+
+def _comptabiliser_perdant(resultats, tokens_prompt):
+    """
+    Attend la fin de la requête perdante d'un hedge et compte le travail facturé pour rien :
+    usage réel si elle est arrivée malgré tout, sinon estimation (prompt + fragments reçus avant l'annulation).
+    """
+    _, _, valeur, erreur = resultats.get()
+    with _VERROU_STATS_LLM:
+        if erreur is None:
+            tokens = int(valeur[1].get("total_tokens", 0) or 0)
+            STATS_HEDGING["reponses_perdantes"] += 1
+            STATS_HEDGING["tokens_gaspilles_perdantes"] += tokens
+        elif isinstance(erreur, RequeteAnnulee):
+            tokens = (tokens_prompt + estimer_tokens(erreur.texte_partiel)) if erreur.envoyee else 0
+            STATS_HEDGING["requetes_annulees"] += 1
+            STATS_HEDGING["tokens_gaspilles_annulees_estimes"] += tokens
+        else:
+            return
+        STATS_HEDGING["tokens_gaspilles"] += tokens
+
+def requete_groq_hedgee(data, sur_fragment=None):
+    """
+    Envoie la complétion et, si elle n'a pas répondu après delai_hedging(), un doublon sur une autre clé.
+    La première réponse complète gagne ; l'autre est annulée (connexion fermée, lecture du flux arrêtée).
+    Sans streaming, une réponse déjà en route ne peut plus être interrompue : ses tokens sont comptés.
+    """
+    resultats = queue.Queue()
+    annulations = []
+
+    def lancer(cle, role):
+        annulation = AnnulationRequete()
+        annulations.append(annulation)
+
+        def cible():
+            try:
+                resultats.put((role, cle, _envoyer_requete_groq(data, cle, sur_fragment, annulation), None))
+            except Exception as e:
+                resultats.put((role, cle, None, e))
+        threading.Thread(target=cible, daemon=True).start()
+
+    with _VERROU_STATS_LLM:
+        STATS_HEDGING["requetes"] += 1
+    cle = POOL_GROQ.acquerir()
+    lancer(cle, "principale")
+    en_cours = 1
+
+    try:
+        premier = resultats.get(timeout=delai_hedging())
+    except queue.Empty:
+        premier = None
+        cle_hedge = POOL_GROQ.acquerir(exclure={cle["numero"]}, attendre=False)
+        if cle_hedge:
+            print(f"🪁 Réponse lente sur la clé {cle['numero']} : doublon envoyé sur la clé {cle_hedge['numero']}")
+            with _VERROU_STATS_LLM:
+                STATS_HEDGING["hedges"] += 1
+            lancer(cle_hedge, "hedge")
+            en_cours += 1
+
+    erreur = None
+    while en_cours:
+        role, _, valeur, exc = premier if premier else resultats.get()
+        premier = None
+        en_cours -= 1
+        if exc is None:
+            if en_cours:
+                for annulation in annulations:
+                    annulation.annuler()  # la requête gagnante est déjà lue : seule la perdante est coupée
+                threading.Thread(
+                    target=_comptabiliser_perdant, args=(resultats, estimer_tokens_requete(data)), daemon=True
+                ).start()
+            if role == "hedge":
+                with _VERROU_STATS_LLM:
+                    STATS_HEDGING["hedges_gagnants"] += 1
+            return valeur
+        erreur = exc
+    raise erreur
+
+def rapport_hedging():
+    """Taux de hedging, tokens gaspillés et percentiles de latence, pour arbitrer gain p99 / coût."""
+    with _VERROU_STATS_LLM:
+        stats = dict(STATS_HEDGING)
+        latences = list(LATENCES_LLM)
+    stats["taux_hedging"] = round(stats["hedges"] / stats["requetes"], 3) if stats["requetes"] else 0.0
+    if latences:
+        for p in (50, 90, 99):
+            stats[f"latence_p{p}_s"] = round(float(np.percentile(latences, p)), 2)
+    return stats
+
+# 💾 Cache persistant des réponses LLM (table SQLite indexée par empreinte de la requête)
+def cle_cache_llm(data):
+    """Empreinte SHA-256 du contenu de la requête (modèle, messages, température, format), hors options de transport."""
+    contenu = {k: v for k, v in data.items() if k not in ("stream",)}
+    return hashlib.sha256(json.dumps(contenu, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+def lire_cache_llm(cle):
+    """Retourne la réponse LLM en cache si elle existe et n'a pas expiré (TTL), sinon None."""
+    try:
+        with _VERROU_CACHE_DB:
+            connexion = get_cache_db()
+            ligne = connexion.execute(
+                "SELECT reponse FROM llm_cache WHERE cle = ? AND cree_le >= ?",
+                (cle, time.time() - LLM_CACHE_TTL_HEURES * 3600)
+            ).fetchone()
+            if ligne:
+                connexion.execute("UPDATE llm_cache SET dernier_acces = ? WHERE cle = ?", (time.time(), cle))
+                connexion.commit()
+        return ligne[0] if ligne else None
+    except Exception as e:
+        print(f"⚠️ Lecture du cache LLM impossible : {e}")
+        return None
+
+def purger_cache_llm(connexion):
+    """
+    Supprime les réponses LLM expirées (TTL) puis borne le cache en nombre d'entrées et en taille cumulée
+    (LLM_CACHE_MAX_MO), en évinçant les moins récemment utilisées. Appelée à l'ouverture et à chaque écriture.
+    """
+    connexion.execute("DELETE FROM llm_cache WHERE cree_le < ?", (time.time() - LLM_CACHE_TTL_HEURES * 3600,))
+    connexion.execute(
+        "DELETE FROM llm_cache WHERE cle NOT IN "
+        "(SELECT cle FROM llm_cache ORDER BY dernier_acces DESC LIMIT ?)",
+        (LLM_CACHE_MAX_ENTREES,)
+    )
+    connexion.execute(
+        "DELETE FROM llm_cache WHERE cle IN (SELECT cle FROM ("
+        "SELECT cle, SUM(LENGTH(CAST(reponse AS BLOB))) OVER (ORDER BY dernier_acces DESC, cle) AS cumul FROM llm_cache"
+        ") WHERE cumul > ?)",
+        (int(LLM_CACHE_MAX_MO * 1024 * 1024),)
+    )
+
+def enregistrer_cache_llm(cle, reponse):
+    """Mémorise une réponse LLM réussie, purge les entrées expirées et borne la taille (éviction LRU)."""
+    try:
+        with _VERROU_CACHE_DB:
+            connexion = get_cache_db()
+            maintenant = time.time()
+            connexion.execute(
+                "INSERT OR REPLACE INTO llm_cache (cle, reponse, cree_le, dernier_acces) VALUES (?, ?, ?, ?)",
+                (cle, reponse, maintenant, maintenant)
+            )
+            purger_cache_llm(connexion)
+            connexion.commit()
+    except Exception as e:
+        print(f"⚠️ Écriture du cache LLM impossible : {e}")
+
+# ⚡ Noyau de l'analyse (publié dès sa réception en streaming)
+CHAMPS_NOYAU_IA = ("prediction_principale", "confiance_pourcentage", "scores_probables")
+
+def noyau_analyse(texte):
+    """Champs du noyau extraits du texte, ou None s'il en manque un."""
+    champs = extraire_champs_analyse(texte)
+    return champs if all(champs[champ] is not None for champ in CHAMPS_NOYAU_IA) else None
+
+class SuiviNoyauFlux:
+    """
+    Callback de flux : appelle sur_noyau(champs) une seule fois, dès que les lignes du noyau sont complètes.
+    Partagé par la requête, son doublon de hedging et les nouvelles tentatives : le premier noyau reçu
+    peut venir d'une requête perdante, d'où confirmer(texte_final) qui republie si le noyau final diffère.
+    """
+
+    def __init__(self, sur_noyau=None):
+        self.sur_noyau = sur_noyau
+        self.termine = False
+        self.publie = None
+        self.verrou = threading.Lock()
+
+    def __call__(self, texte):
+        if self.termine:
+            return
+        fin = texte.rfind("\n")
+        champs = noyau_analyse(texte[:fin]) if fin >= 0 else None
+        if champs is None:
+            return
+        with self.verrou:
+            if self.termine:
+                return
+            self.termine = True
+            self.publie = champs
+        print(f"⚡ Noyau reçu avant la fin de la génération : {champs['prediction_principale']} ({champs['confiance_pourcentage']}%)")
+        if self.sur_noyau:
+            self.sur_noyau(champs)
+
+    def clore(self):
+        """Plus aucune publication (réponse finale obtenue, ou doublon de hedging abandonné)."""
+        with self.verrou:
+            self.termine = True
+
+    def confirmer(self, texte):
+        """Clôt le suivi ; si un noyau a été publié et que celui du texte retenu diffère, republie ce dernier."""
+        self.clore()
+        champs = noyau_analyse(texte)
+        if self.publie is None or champs is None:
+            return
+        if all(champs[champ] == self.publie[champ] for champ in CHAMPS_NOYAU_IA):
+            return
+        print(f"🔁 Noyau publié issu d'une autre requête (hedging ou tentative interrompue) : republié ({champs['prediction_principale']})")
+        self.publie = champs
+        if self.sur_noyau:
+            self.sur_noyau(champs)
+
+# 📣 Noyaux publiés en cours d'exécution (prédiction-YYYY-MM-DD-precoce.json)
+PREDICTIONS_PRECOCES = {}
+_VERROU_PRECOCES = threading.Lock()
+_VERROU_PUSH_PRECOCE = threading.Lock()
+DERNIER_PUSH_PRECOCE = {"instant": 0.0}
+
+def publier_prediction_precoce(prediction_obj, champs, date_str=None):
+    """
+    Enregistre le noyau (prédiction, confiance, scores) d'un match dès sa réception dans le flux
+    et réécrit prédiction-YYYY-MM-DD-precoce.json (date de l'exécution, même format "matches" que
+    l'index résumé : index.html l'affiche tant que l'index du jour n'existe pas), sans attendre
+    la fin de la JUSTIFICATION. Avec PUBLICATION_PRECOCE_GIT, le fichier est aussi poussé.
+    """
+    date_str = date_str or datetime.now().strftime('%Y-%m-%d')
+    chemin = f"prédiction-{date_str}-precoce.json"
+    entree = {
+        "HomeTeam": prediction_obj.get("HomeTeam"),
+        "AwayTeam": prediction_obj.get("AwayTeam"),
+        "date": prediction_obj.get("date"),
+        "league": prediction_obj.get("league"),
+        "logo_home": prediction_obj.get("logo_home"),
+        "logo_away": prediction_obj.get("logo_away"),
+        **{champ: champs[champ] for champ in CHAMPS_NOYAU_IA},
+        "publie_a": datetime.now().isoformat(timespec="seconds")
+    }
+    try:
+        with _VERROU_PRECOCES:
+            PREDICTIONS_PRECOCES[f"{entree['HomeTeam']} vs {entree['AwayTeam']}"] = entree
+            temporaire = chemin + ".tmp"
+            with open(temporaire, "w", encoding="utf-8") as f:
+                json.dump({
+                    "date": date_str,
+                    "precoce": True,
+                    "count": len(PREDICTIONS_PRECOCES),
+                    "matches": list(PREDICTIONS_PRECOCES.values())
+                }, f, ensure_ascii=False, indent=2)
+            os.replace(temporaire, chemin)
+        print(f"📣 Prédiction publiée dans {chemin} : {entree['HomeTeam']} vs {entree['AwayTeam']}")
+    except OSError as e:
+        print(f"⚠️ Publication anticipée impossible : {e}")
+        return
+    pousser_prediction_precoce(chemin)
+
+def pousser_prediction_precoce(chemin):
+    """Pousse le fichier anticipé au plus une fois par PUBLICATION_PRECOCE_INTERVALLE, sans bloquer les autres workers."""
+    if not PUBLICATION_PRECOCE_GIT or time.time() - DERNIER_PUSH_PRECOCE["instant"] < PUBLICATION_PRECOCE_INTERVALLE:
+        return
+    if not _VERROU_PUSH_PRECOCE.acquire(blocking=False):
+        return  # push déjà en cours : le suivant reprendra le fichier à jour
+    try:
+        # Le fichier est remplacé atomiquement (os.replace) : git add lit toujours une version complète
+        DERNIER_PUSH_PRECOCE["instant"] = time.time()
+        git_commit_and_push(chemin, message=f"Prédictions anticipées {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    finally:
+        _VERROU_PUSH_PRECOCE.release()
+
+def retirer_prediction_precoce(date_str):
+    """
+    Supprime prédiction-YYYY-MM-DD-precoce.json une fois le fichier du jour écrit et, s'il était suivi
+    par git (poussé en cours d'exécution), indexe sa suppression : le prochain commit le retire du dépôt.
+    """
+    chemin = f"prédiction-{date_str}-precoce.json"
+    if not os.path.exists(chemin):
+        return
+    try:
+        os.remove(chemin)
+    except OSError as e:
+        print(f"⚠️ Fichier anticipé non supprimé : {e}")
+        return
+    subprocess.run(["git", "rm", "--cached", "--quiet", "--ignore-unmatch", "--", chemin], capture_output=True)
+    print(f"🧹 Fichier anticipé retiré : {chemin}")
 
-        data = {
-            "model": "openai/gpt-oss-120b",
-            "messages": [
-                {"role": "system", "content": "Tu es un expert en paris sportifs. Ton rôle est de faire une analyse complète du match en fonction des données fournies, puis de proposer UNE prédiction fiable parmi : victoire domicile, victoire extérieur, +2.5 buts, -2.5 buts, BTTS oui, BTTS non, double chance (1X ou X2). Tu dois aussi donner un pourcentage de confiance (0-100%) et les 2 scores les plus probables. ATTENTION : Ne jamais prédire 'match nul' - utilise plutôt 'double chance 1X' ou 'double chance X2'. Ta mission Faire la prédiction la plus probable et précise."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.5
+# 🧠 Fonction DeepSeek avec pool de clés Groq (rate-limit, 429, latence), hedging optionnel et retry automatique (VERSION AMÉLIORÉE)
+def call_deepseek_analysis(prompt, max_retries=5, sortie_json=None, sur_noyau=None):
+    """
+    Analyse IA via Groq. sortie_json=True (défaut : LLM_SORTIE_JSON) impose une réponse JSON
+    conforme à GROQ_SCHEMA_ANALYSE ; le contenu brut est retourné (voir appliquer_analyse_ia).
+    En streaming (LLM_STREAMING, texte uniquement), sur_noyau(champs) est appelé dès que prédiction,
+    confiance et scores sont reçus (puis de nouveau si le noyau de la réponse retenue diffère) ;
+    si le flux est coupé après eux, l'analyse partielle est conservée.
+    """
+    sortie_json = LLM_SORTIE_JSON if sortie_json is None else sortie_json
+    if not POOL_GROQ.cles:
+        error_msg = "❌ Échec définitif : aucune clé Groq configurée."
+        print(error_msg)
+        return error_msg
+
+    data = {
+        "model": GROQ_MODEL,
+        "messages": [
+            {"role": "system", "content": GROQ_SYSTEM_PROMPT_JSON if sortie_json else GROQ_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": GROQ_TEMPERATURE
+    }
+    if sortie_json:
+        data["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {"name": "analyse_match", "schema": GROQ_SCHEMA_ANALYSE}
         }
 
+    streaming = LLM_STREAMING and not sortie_json
+    if streaming:
+        data["stream"] = True
+
+    cle_cache = cle_cache_llm(data)
+    if LLM_CACHE:
+        reponse_cache = lire_cache_llm(cle_cache)
+        if reponse_cache is not None:
+            print("🗄️ Analyse IA servie depuis le cache (prompt identique déjà analysé)")
+            return reponse_cache
+
+    suivi = SuiviNoyauFlux(sur_noyau) if streaming else None
+    for attempt in range(1, max_retries + 1):
         try:
-            print(f"🧠 Tentative {attempt}/{max_retries} avec clé {(groq_key_index - 1) % len(groq_keys) + 1}...")
-            response = requests.post("https://api.groq.com/openai/v1/chat/completions", headers=headers, json=data)
-            response.raise_for_status()
-            result = response.json()["choices"][0]["message"]["content"].strip()
+            print(f"🧠 Tentative {attempt}/{max_retries}...")
+            if LLM_HEDGING:
+                result, _ = requete_groq_hedgee(data, suivi)
+            else:
+                result, _ = _envoyer_requete_groq(data, POOL_GROQ.acquerir(), suivi)
+            if suivi:
+                suivi.confirmer(result)
             print(f"✅ Analyse IA réussie à la tentative {attempt}")
+            if LLM_CACHE:
+                enregistrer_cache_llm(cle_cache, result)
             return result
         except Exception as e:
+            if isinstance(e, FluxInterrompu) and noyau_analyse(e.texte_partiel):
+                # Noyau déjà reçu : on garde l'analyse partielle plutôt que de tout regénérer (non mise en cache)
+                suivi.confirmer(e.texte_partiel)
+                print(f"⚠️ Flux interrompu après le noyau de l'analyse ({e}) : analyse partielle conservée")
+                return f"{e.texte_partiel}\n\n⚠️ JUSTIFICATION interrompue : {e}"
             print(f"❌ Erreur DeepSeek (tentative {attempt}/{max_retries}) : {str(e)}")
             if attempt < max_retries:
-                print("🔄 Nouvel essai dans 2 secondes...")
-                import time
-                time.sleep(2)  # Petite pause avant retry
+                print("🔄 Nouvel essai sur la clé la plus disponible...")
             else:
                 error_msg = f"❌ Échec définitif après {max_retries} tentatives. Dernière erreur : {str(e)}"
                 print(error_msg)
@@ -2295,14 +1001,13 @@ def ajuster_lambda_h2h(lambda_home, lambda_away, h2h_data):
     print(f"🆚 Ajustement H2H: λ_home {lambda_home:.2f} → {lambda_home:.2f}, λ_away {lambda_away:.2f} → {lambda_away:.2f}")
     return lambda_home, lambda_away
 
-def simulation_match_montecarlo(stats_home, stats_away, h2h_data=None, n=20000):
+SEUILS_OVER_UNDER = [0.5, 1.5, 2.5, 3.5, 4.5, 5.5]
+
+def calculer_lambdas(stats_home, stats_away, h2h_data=None):
     """
-    Simulation Monte-Carlo avancée : combine modèle Poisson + calibrage international + H2H.
-    Basée uniquement sur les statistiques (sans IA ni cotes).
-    Retourne les probabilités 1X2, double chance, over/under, résultat+total.
+    Calcule les moyennes de buts attendues (λ) des deux équipes :
+    statistiques des équipes + calibrage international + ajustement H2H.
     """
-    print(f"🎲 Démarrage simulation Monte-Carlo avec {n} itérations...")
-    
     # ⚽ Moyennes de buts internationales (pondérées FIFA/UEFA)
     base_home_avg = 1.52
     base_away_avg = 1.18
@@ -2321,89 +1026,354 @@ def simulation_match_montecarlo(stats_home, stats_away, h2h_data=None, n=20000):
     if h2h_data:
         lambda_home, lambda_away = ajuster_lambda_h2h(lambda_home, lambda_away, h2h_data)
 
-    # 🧮 Simulations Monte-Carlo réelles
-    buts_home = np.random.poisson(lambda_home, n)
-    buts_away = np.random.poisson(lambda_away, n)
-    totals = buts_home + buts_away
-
-    # --- Comptages 1X2 ---
-    v1 = np.sum(buts_home > buts_away)
-    x = np.sum(buts_home == buts_away)
-    v2 = np.sum(buts_home < buts_away)
+    return lambda_home, lambda_away
 
-    res_1x2 = {
-        "V1": round(v1/n*100, 2),
-        "X": round(x/n*100, 2),
-        "V2": round(v2/n*100, 2)
-    }
+def poisson_pmf(lambdas, k_max):
+    """
+    Probabilités P(X=k), k = 0..k_max, pour un vecteur de λ (calcul en log, sans scipy).
+    Retourne un tableau (nombre de λ, k_max + 1).
+    """
+    lambdas = np.asarray(lambdas, dtype=float)[:, None]
+    k = np.arange(k_max + 1)[None, :]
+    log_factorielles = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, k_max + 1)))))[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pmf = np.exp(k * np.log(lambdas) - lambdas - log_factorielles)
+    # λ = 0 : toute la masse sur 0 but
+    return np.where(lambdas > 0, pmf, (k == 0).astype(float))
+
+def matrices_scores_poisson(lambdas_home, lambdas_away):
+    """
+    Matrices jointes exactes P[f, i, j] = P(buts domicile = i) * P(buts extérieur = j)
+    pour deux Poisson indépendantes par match f, tronquées là où la queue devient négligeable (< 1e-12).
+    """
+    lam_max = max(float(np.max(lambdas_home)), float(np.max(lambdas_away)), 0.0)
+    k_max = int(lam_max + 12 * math.sqrt(lam_max) + 12)
+    pmf_home = poisson_pmf(lambdas_home, k_max)
+    pmf_away = poisson_pmf(lambdas_away, k_max)
+    return pmf_home[:, :, None] * pmf_away[:, None, :]
 
-    # --- Double chance ---
-    res_double = {
-        "1X": round((v1+x)/n*100, 2),
-        "12": round((v1+v2)/n*100, 2),
-        "X2": round((x+v2)/n*100, 2)
-    }
+def probabilites_depuis_matrices(matrices, totaux, nb_scores=10):
+    """
+    Dérive en une passe vectorisée tous les marchés (1X2, double chance, over/under, BTTS,
+    résultat+total, scores exacts, buts moyens) de matrices de scores [match, buts domicile, buts extérieur].
+    Les matrices contiennent des comptages (total = nombre de simulations) ou des probabilités (total = 1).
+    Masses des marchés : un seul produit matrices × masques pour tout le lot ;
+    scores exacts : argpartition sur les matrices aplaties (nb_matchs, taille²), sans tri complet par match.
+    Retourne une liste de dictionnaires, un par match.
+    """
+    nb_matchs, taille, _ = matrices.shape
+    buts_home = np.arange(taille)[:, None]
+    buts_away = np.arange(taille)[None, :]
+    totals = buts_home + buts_away
 
-    # --- Over/Under pour différents seuils ---
-    seuils = [0.5, 1.5, 2.5, 3.5, 4.5, 5.5]
-    over_under = {}
-    for s in seuils:
-        over_under[f"plus_de_{s}"] = round(np.sum(totals > s)/n*100, 2)
-        over_under[f"moins_de_{s}"] = round(np.sum(totals <= s)/n*100, 2)
-
-    # --- BTTS (Both Teams To Score) ---
-    btts_oui = np.sum((buts_home > 0) & (buts_away > 0))
-    btts_non = n - btts_oui
-    btts = {
-        "oui": round(btts_oui/n*100, 2),
-        "non": round(btts_non/n*100, 2)
+    # --- Un masque (ou poids) par marché, réduits ensemble : masses[f, m] ---
+    marches = {
+        "V1": buts_home > buts_away,
+        "X": buts_home == buts_away,
+        "V2": buts_home < buts_away,
+        "1X": buts_home >= buts_away,
+        "12": buts_home != buts_away,
+        "X2": buts_home <= buts_away,
+        "btts_oui": (buts_home > 0) & (buts_away > 0),
+        "btts_non": (buts_home == 0) | (buts_away == 0),
+        "buts_home": np.broadcast_to(buts_home, (taille, taille)),
+        "buts_away": np.broadcast_to(buts_away, (taille, taille)),
+        "buts_total": totals
     }
+    for s in SEUILS_OVER_UNDER:
+        marches[f"plus_de_{s}"] = totals > s
+        marches[f"moins_de_{s}"] = totals <= s
+        marches[f"V1et+{s}"] = (buts_home > buts_away) & (totals > s)
+        marches[f"1Xet+{s}"] = (buts_home >= buts_away) & (totals > s)
+        marches[f"V2et+{s}"] = (buts_home < buts_away) & (totals > s)
+    cles = list(marches)
+    masques = np.stack([np.asarray(marches[cle], dtype=matrices.dtype) for cle in cles])
+    aplaties = matrices.reshape(nb_matchs, taille * taille)
+    masses = aplaties @ masques.reshape(len(cles), taille * taille).T
+    totaux = np.asarray(totaux, dtype=float)
+    # Arrondis vectorisés (np.round, comme l'arrondi des scalaires numpy des versions par match)
+    pourcentages = np.round(masses / totaux[:, None] * 100, 2).tolist()
+    moyennes = np.round(masses / totaux[:, None], 2).tolist()
+    colonne = {cle: i for i, cle in enumerate(cles)}
+
+    # --- Scores exacts : k meilleures cases de chaque match, puis tri de ces k cases seulement ---
+    k = min(nb_scores, taille * taille)
+    meilleures = np.argpartition(-aplaties, k - 1, axis=1)[:, :k]
+    valeurs = np.take_along_axis(aplaties, meilleures, axis=1)
+    # Ordre : probabilité décroissante, puis domicile puis extérieur croissants (départage déterministe)
+    ordre = np.lexsort((meilleures, -valeurs), axis=1)
+    meilleures = np.take_along_axis(meilleures, ordre, axis=1)
+    valeurs = np.take_along_axis(valeurs, ordre, axis=1)
+    non_nulles = (valeurs > 0).tolist()
+    valeurs_pct = np.round(valeurs / totaux[:, None] * 100, 2).tolist()
+    meilleures = meilleures.tolist()
+
+    resultats = []
+    for f in range(nb_matchs):
+        p = {cle: pourcentages[f][i] for cle, i in colonne.items()}
+        scores_probables = {
+            "%d-%d" % divmod(case, taille): valeur
+            for case, valeur, non_nulle in zip(meilleures[f], valeurs_pct[f], non_nulles[f]) if non_nulle
+        }
+        resultats.append({
+            "1x2": {"V1": p["V1"], "X": p["X"], "V2": p["V2"]},
+            "double_chance": {"1X": p["1X"], "12": p["12"], "X2": p["X2"]},
+            "over_under": {
+                cle: p[cle] for s in SEUILS_OVER_UNDER for cle in (f"plus_de_{s}", f"moins_de_{s}")
+            },
+            "btts": {"oui": p["btts_oui"], "non": p["btts_non"]},
+            "resultat_total": {
+                cle: p[cle] for s in SEUILS_OVER_UNDER for cle in (f"V1et+{s}", f"1Xet+{s}", f"V2et+{s}")
+            },
+            "scores_probables": scores_probables,
+            "buts_moyens_simules": {
+                "home": moyennes[f][colonne["buts_home"]],
+                "away": moyennes[f][colonne["buts_away"]],
+                "total": moyennes[f][colonne["buts_total"]]
+            }
+        })
+    return resultats
+
+def cle_fixture(*elements):
+    """Identifiant entier stable d'un match (ex: date, domicile, extérieur), indépendant du PYTHONHASHSEED."""
+    empreinte = hashlib.sha256("|".join(str(e) for e in elements).encode("utf-8")).digest()
+    return int.from_bytes(empreinte[:8], "big")
+
+def generateur_fixture(fixture_id, seed=None):
+    """
+    numpy.random.Generator propre à un match, dérivé de la graine d'exécution et de l'id du match.
+    Les flux sont indépendants : le résultat d'un match ne dépend ni de l'ordre de traitement,
+    ni du lot, ni du thread qui le calcule.
+    """
+    seed = MONTE_CARLO_SEED if seed is None else seed
+    return np.random.default_rng(np.random.SeedSequence(entropy=seed, spawn_key=(int(fixture_id),)))
 
-    # --- Probabilités conditionnelles Résultat + Total ---
-    res_total_combo = {}
-    for s in seuils:
-        cond_v1 = np.sum((buts_home > buts_away) & (totals > s)) / n * 100
-        cond_1x = np.sum(((buts_home >= buts_away) | (buts_home == buts_away)) & (totals > s)) / n * 100
-        cond_v2 = np.sum((buts_home < buts_away) & (totals > s)) / n * 100
-        res_total_combo[f"V1et+{s}"] = round(cond_v1, 2)
-        res_total_combo[f"1Xet+{s}"] = round(cond_1x, 2)
-        res_total_combo[f"V2et+{s}"] = round(cond_v2, 2)
-
-    # --- Scores exacts les plus probables ---
-    unique_scores, counts = np.unique(list(zip(buts_home, buts_away)), axis=0, return_counts=True)
-    top_scores_idx = np.argsort(counts)[-10:][::-1] if len(counts) > 0 else np.array([], dtype=int)
-    # (Remarque: la ligne ci‑dessous utilise une variante robuste)
-    top_scores_idx = np.argsort(counts)[-10:][::-1] if len(counts) > 0 else np.array([], dtype=int)
-    scores_probables = {}
-    for idx in top_scores_idx:
-        score = tuple(unique_scores[idx])
-        prob = round(counts[idx]/n*100, 2)
-        scores_probables[f"{score[0]}-{score[1]}"] = prob
-
-    print(f"✅ Simulation terminée: {n} matchs simulés")
-    print(f"🎯 Résultats: V1={res_1x2['V1']}%, X={res_1x2['X']}%, V2={res_1x2['V2']}%")
-    print(f"⚽ Plus de 2.5 buts: {over_under['plus_de_2.5']}%")
-    print(f"🥅 BTTS: {btts['oui']}%")
+def histogrammes_scores(buts_home, buts_away):
+    """
+    Histogramme entier des scores simulés, par match : H[f, i, j] = nombre de tirages i-j.
+    Un seul bincount sur l'index encodé (match * K + domicile) * K + extérieur,
+    au lieu de matérialiser des tuples Python et de les trier.
+    """
+    nb_matchs = buts_home.shape[0]
+    taille = int(max(buts_home.max(), buts_away.max())) + 1
+    codes = (np.arange(nb_matchs)[:, None] * taille + buts_home) * taille + buts_away
+    comptages = np.bincount(codes.ravel(), minlength=nb_matchs * taille * taille)
+    return comptages.reshape(nb_matchs, taille, taille)
+
+def suite_van_der_corput(taille, base, depart=0):
+    """Termes depart+1 .. depart+taille de la suite de van der Corput (une coordonnée de Halton)."""
+    indices = np.arange(depart + 1, depart + taille + 1)
+    suite = np.zeros(taille)
+    facteur = 1.0 / base
+    while np.any(indices > 0):
+        suite += (indices % base) * facteur
+        indices //= base
+        facteur /= base
+    return suite
+
+def creer_echantillonneur(rng, lambda_home, lambda_away, echantillonnage="standard"):
+    """
+    Retourne tirer(taille) -> (buts_home, buts_away) pour un match.
+    - standard : tirages de Poisson classiques ;
+    - antithetique : paires (u, 1-u) passées par l'inverse de la fonction de répartition de Poisson ;
+    - quasi : suite de Halton 2-D (bases 2 et 3) avec décalage aléatoire (Cranley-Patterson),
+      puis inverse de la fonction de répartition.
+    Les deux modes à variance réduite atteignent la précision du mode standard avec moins de tirages.
+    """
+    if echantillonnage == "standard":
+        return lambda taille: (rng.poisson(lambda_home, taille), rng.poisson(lambda_away, taille))
+
+    lam_max = max(lambda_home, lambda_away, 0.0)
+    k_max = int(lam_max + 12 * math.sqrt(lam_max) + 12)
+    repartition = np.cumsum(poisson_pmf([lambda_home, lambda_away], k_max), axis=1)
+
+    def inverse(u, cote):
+        return np.minimum(np.searchsorted(repartition[cote], u), k_max)
+
+    if echantillonnage == "antithetique":
+        def tirer(taille):
+            u = rng.random((2, (taille + 1) // 2))
+            u = np.concatenate((u, 1.0 - u), axis=1)[:, :taille]
+            return inverse(u[0], 0), inverse(u[1], 1)
+        return tirer
+
+    if echantillonnage == "quasi":
+        decalage = rng.random(2)
+        position = [0]
+
+        def tirer(taille):
+            depart = position[0]
+            position[0] += taille
+            u_home = (suite_van_der_corput(taille, 2, depart) + decalage[0]) % 1.0
+            u_away = (suite_van_der_corput(taille, 3, depart) + decalage[1]) % 1.0
+            return inverse(u_home, 0), inverse(u_away, 1)
+        return tirer
+
+    raise ValueError(f"Échantillonnage Monte-Carlo inconnu : {echantillonnage}")
+
+def quantile_student_975(ddl):
+    """Quantile 97,5 % de la loi de Student à ddl degrés de liberté (développement de Cornish-Fisher)."""
+    z = 1.959964
+    return z + (z ** 3 + z) / (4 * ddl) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * ddl ** 2)
+
+def tirages_adaptatifs(tirer, n_max, precision_cible, taille_lot=MONTE_CARLO_TAILLE_LOT, lots_min=MONTE_CARLO_LOTS_MIN):
+    """
+    Simule par lots de taille_lot (via tirer, voir creer_echantillonneur) jusqu'à ce que la demi-largeur
+    de l'IC à 95 % des marchés principaux (V1, X, V2, plus de 2.5 buts, BTTS) passe sous precision_cible
+    (en points de %), ou jusqu'à n_max tirages.
+    La demi-largeur est estimée par moyennes de lots : dispersion des fréquences de chaque lot, divisée par
+    la racine du nombre de lots. Elle mesure l'erreur réelle du mode d'échantillonnage (antithétique et quasi
+    s'arrêtent donc plus tôt que standard) ; l'arrêt n'est envisagé qu'après lots_min lots.
+    Retourne (buts_home, buts_away, precision_atteinte).
+    """
+    lots_home, lots_away, frequences = [], [], []
+    nb_tirages = 0
+    precision = float("inf")
+    while nb_tirages < n_max:
+        taille = min(taille_lot, n_max - nb_tirages)
+        buts_home, buts_away = tirer(taille)
+        lots_home.append(buts_home)
+        lots_away.append(buts_away)
+        nb_tirages += taille
+
+        frequences.append([
+            np.mean(buts_home > buts_away),
+            np.mean(buts_home == buts_away),
+            np.mean(buts_home < buts_away),
+            np.mean(buts_home + buts_away > 2.5),
+            np.mean((buts_home > 0) & (buts_away > 0))
+        ])
+        nb_lots = len(frequences)
+        if nb_lots >= 2:
+            ecarts = np.std(frequences, axis=0, ddof=1)
+            precision = float(quantile_student_975(nb_lots - 1) * ecarts.max() / math.sqrt(nb_lots) * 100)
+        else:
+            # Un seul lot (n_max < taille_lot) : pas de dispersion mesurable, IC binomial en repli
+            p = np.array(frequences[0])
+            precision = float(1.96 * np.sqrt(p * (1 - p) / nb_tirages).max() * 100)
+        if nb_lots >= lots_min and precision <= precision_cible:
+            break
+
+    return np.concatenate(lots_home), np.concatenate(lots_away), precision
+
+def simulation_lot_montecarlo(
+    lambdas_home, lambdas_away, n=MONTE_CARLO_ITERATIONS, methode=None, ajustements_h2h=None,
+    fixture_ids=None, seed=None, adaptatif=False, precision_cible=MONTE_CARLO_PRECISION,
+    echantillonnage=None
+):
+    """
+    Prix de tous les matchs d'un lot hors ligne (backfill, recalcul d'un historique, benchmark), sans affichage par match.
+    L'exécution quotidienne, elle, traite chaque match dès que ses données sont collectées (lot d'un match) :
+    tirages vectorisés par match, réduits aussitôt en histogramme de scores, puis probabilités calculées en une passe.
+    fixture_ids (défaut : position dans le lot) et seed (défaut : MONTE_CARLO_SEED) déterminent
+    le flux aléatoire de chaque match, d'où des résultats reproductibles bit à bit.
+    adaptatif=True : n devient un maximum et chaque match s'arrête dès que precision_cible est atteinte.
+    echantillonnage (défaut : MONTE_CARLO_ECHANTILLONNAGE) choisit standard, antithetique ou quasi.
+    Retourne pour chaque match le même dictionnaire que simulation_match_montecarlo.
+    """
+    methode = methode or SIMULATION_METHODE
+    echantillonnage = echantillonnage or MONTE_CARLO_ECHANTILLONNAGE
+    lambdas_home = np.asarray(lambdas_home, dtype=float)
+    lambdas_away = np.asarray(lambdas_away, dtype=float)
+    nb_matchs = len(lambdas_home)
+    if ajustements_h2h is None:
+        ajustements_h2h = [False] * nb_matchs
+    if fixture_ids is None:
+        fixture_ids = range(nb_matchs)
+    if nb_matchs == 0:
+        return []
 
-    return {
-        "parametres_simulation": {
-            "iterations": n,
-            "lambda_home": round(lambda_home, 3),
-            "lambda_away": round(lambda_away, 3),
-            "ajustement_h2h": bool(h2h_data and len(h2h_data) > 0)
-        },
-        "1x2": res_1x2,
-        "double_chance": res_double,
-        "over_under": over_under,
-        "btts": btts,
-        "resultat_total": res_total_combo,
-        "scores_probables": scores_probables,
-        "buts_moyens_simules": {
-            "home": round(np.mean(buts_home), 2),
-            "away": round(np.mean(buts_away), 2),
-            "total": round(np.mean(totals), 2)
+    precisions = None
+    if methode == "exact":
+        matrices = matrices_scores_poisson(lambdas_home, lambdas_away)
+        totaux = np.ones(nb_matchs)
+        iterations = [None] * nb_matchs
+    else:
+        # Un flux indépendant par match ; l'histogramme 2-D des scores est construit dès les tirages du match
+        # (mémoire O(n) au lieu de deux matrices (nb_matchs, n) pour un backfill), puis complété à la même taille
+        histogrammes, totaux = [], []
+        precisions = [] if adaptatif else None
+        for f, fixture_id in enumerate(fixture_ids):
+            tirer = creer_echantillonneur(
+                generateur_fixture(fixture_id, seed), lambdas_home[f], lambdas_away[f], echantillonnage
+            )
+            if adaptatif:
+                # n devient un maximum : nombre de tirages propre à chaque match
+                buts_home, buts_away, precision = tirages_adaptatifs(tirer, n, precision_cible)
+                precisions.append(precision)
+            else:
+                buts_home, buts_away = tirer(n)
+            histogrammes.append(histogrammes_scores(buts_home[None, :], buts_away[None, :])[0])
+            totaux.append(len(buts_home))
+        taille = max(h.shape[0] for h in histogrammes)
+        matrices = np.zeros((nb_matchs, taille, taille), dtype=np.int64)
+        for f, histogramme in enumerate(histogrammes):
+            matrices[f, :histogramme.shape[0], :histogramme.shape[1]] = histogramme
+        totaux = np.array(totaux)
+        iterations = [int(t) for t in totaux]
+
+    resultats = []
+    for f, probabilites in enumerate(probabilites_depuis_matrices(matrices, totaux)):
+        parametres = {
+            "methode": methode,
+            "iterations": iterations[f],
+            "lambda_home": round(float(lambdas_home[f]), 3),
+            "lambda_away": round(float(lambdas_away[f]), 3),
+            "ajustement_h2h": bool(ajustements_h2h[f])
         }
-    }
+        if methode != "exact":
+            parametres["echantillonnage"] = echantillonnage
+        if precisions is not None:
+            parametres["mode_iterations"] = "adaptatif"
+            parametres["iterations_max"] = n
+            parametres["precision_cible"] = precision_cible
+            parametres["precision_atteinte"] = round(precisions[f], 3)
+        resultats.append({"parametres_simulation": parametres, **probabilites})
+    return resultats
+
+def simulation_match_montecarlo(
+    stats_home, stats_away, h2h_data=None, n=MONTE_CARLO_ITERATIONS, methode=None, fixture_id=0, adaptatif=None,
+    echantillonnage=None
+):
+    """
+    Simulation Monte-Carlo avancée : combine modèle Poisson + calibrage international + H2H.
+    Basée uniquement sur les statistiques (sans IA ni cotes).
+    Retourne les probabilités 1X2, double chance, over/under, résultat+total.
+    methode="exact" (ou SIMULATION_METHODE=exact) remplace l'échantillonnage par la matrice
+    de scores Poisson exacte : mêmes clés, sans bruit d'échantillonnage.
+    fixture_id (voir cle_fixture) sélectionne le flux aléatoire du match : mêmes entrées, mêmes Probabilites.
+    adaptatif=True (ou MONTE_CARLO_ADAPTATIF=1) simule par lots et s'arrête dès que l'IC à 95 %
+    des marchés principaux est plus étroit que MONTE_CARLO_PRECISION (n devient un maximum).
+    echantillonnage="antithetique" ou "quasi" (ou MONTE_CARLO_ECHANTILLONNAGE) active la réduction de variance.
+    """
+    methode = methode or SIMULATION_METHODE
+    adaptatif = MONTE_CARLO_ADAPTATIF if adaptatif is None else adaptatif
+    if methode == "exact":
+        print("🎲 Calcul exact des probabilités (matrice de scores Poisson)...")
+    elif adaptatif:
+        print(f"🎲 Démarrage simulation Monte-Carlo adaptative (max {n} itérations, précision visée ±{MONTE_CARLO_PRECISION} pts)...")
+    else:
+        print(f"🎲 Démarrage simulation Monte-Carlo avec {n} itérations...")
+
+    lambda_home, lambda_away = calculer_lambdas(stats_home, stats_away, h2h_data)
+
+    resultats = simulation_lot_montecarlo(
+        [lambda_home], [lambda_away], n=n, methode=methode,
+        ajustements_h2h=[bool(h2h_data and len(h2h_data) > 0)], fixture_ids=[fixture_id],
+        adaptatif=adaptatif, echantillonnage=echantillonnage
+    )[0]
+
+    if methode == "exact":
+        print("✅ Calcul exact terminé")
+    else:
+        print(f"✅ Simulation terminée: {resultats['parametres_simulation']['iterations']} matchs simulés")
+        if adaptatif:
+            print(f"📏 Précision atteinte (IC 95 %) : ±{resultats['parametres_simulation']['precision_atteinte']} pts")
+    print(f"🎯 Résultats: V1={resultats['1x2']['V1']}%, X={resultats['1x2']['X']}%, V2={resultats['1x2']['V2']}%")
+    print(f"⚽ Plus de 2.5 buts: {resultats['over_under']['plus_de_2.5']}%")
+    print(f"🥅 BTTS: {resultats['btts']['oui']}%")
+
+    return resultats
 
 # 🔮 Générateur de prompt détaillé (VERSION SANS MONTE-CARLO)
 def generate_detailed_prompt(prediction_obj):
@@ -2589,24 +1559,342 @@ MISSION :
    - "Double chance 1X" (domicile ou nul)
    - "Double chance X2" (nul ou extérieur)
 
-9. ✨ NOUVEAUTÉS OBLIGATOIRES :
-   - POURCENTAGE DE CONFIANCE (0-100%) pour ta prédiction principale
-   - LES 2 SCORES LES PLUS PROBABLES (ex: "1-0 ou 2-1")
+9. ✨ NOUVEAUTÉS OBLIGATOIRES :
+   - POURCENTAGE DE CONFIANCE (0-100%) pour ta prédiction principale
+   - LES 2 SCORES LES PLUS PROBABLES (ex: "1-0 ou 2-1")
+
+⚠️ IMPORTANT : 
+- Ne JAMAIS prédire "Match nul" - utilise "Double chance 1X" ou "Double chance X2" à la place.
+
+Justifie ta prédiction avec toutes les données statistiques fournies, en tenant compte particulièrement des matchs récents détaillés avec leurs statistiques complètes, du contexte du classement, des confrontations directes avec leurs stats détaillées.
+
+FORMAT DE RÉPONSE OBLIGATOIRE :
+- PRÉDICTION PRINCIPALE : [ta prédiction]
+- CONFIANCE : [X]%
+- SCORES PROBABLES : [Score1] ou [Score2]
+- JUSTIFICATION : [ton analyse détaillée]
+"""
+    return prompt
+
+def estimer_tokens(texte):
+    """Estimation du nombre de tokens d'un texte (≈ 3.5 caractères par token pour du français)."""
+    return math.ceil(len(texte) / 3.5)
+
+# Statistiques de match jugées utiles pour le prompt compact (les autres sont ignorées)
+STATS_PROMPT_COMPACT = [("Possession", "poss"), ("Shots on Goal", "tirs_cadrés"), ("Corner Kicks", "corners")]
+
+def _ligne_match_compacte(date_match, team1, team2, score, stats):
+    """Une ligne de tableau : date|match|score|poss|tirs_cadrés|corners (sans URL ni identifiants)."""
+    colonnes = [str(date_match), f"{team1}-{team2}", str(score).replace(" ", "")]
+    for stat_name, _ in STATS_PROMPT_COMPACT:
+        valeurs = (stats or {}).get(stat_name)
+        colonnes.append(f"{valeurs[0]}-{valeurs[1]}".replace("%", "") if valeurs else "-")
+    return "|".join(colonnes)
+
+def generate_compact_prompt(prediction_obj, budget_tokens=PROMPT_BUDGET_TOKENS):
+    """
+    Prompt compact : mêmes informations clés que generate_detailed_prompt sous forme de tableaux denses,
+    sans URL ni stats peu utiles. Les blocs optionnels (matchs récents, classement, H2H) sont réduits
+    progressivement jusqu'à tenir dans budget_tokens. Retourne (prompt, estimation_tokens).
+    """
+    home = prediction_obj["HomeTeam"]
+    away = prediction_obj["AwayTeam"]
+    stats_home = prediction_obj["stats_home"]
+    stats_away = prediction_obj["stats_away"]
+    odds = prediction_obj.get("odds") or {}
+    pos_home = prediction_obj.get("classement_home")
+    pos_away = prediction_obj.get("classement_away")
+
+    def ligne_equipe(role, nom, position, points, stats, serie_cle, lieu):
+        return (
+            f"{role} {nom}: {position or '-'}e/{points if points is not None else '-'}pts"
+            f" | {stats['moyenne_marques']:.2f}/{stats['moyenne_encaisses']:.2f}"
+            f" | {''.join(stats['form_6'])}({stats.get('total_points_6', 0)})"
+            f" | {''.join(stats['form_10'])}({stats.get('total_points_10', 0)})"
+            f" | {''.join(stats.get(serie_cle, [])) or '-'}"
+            f" | {stats.get(f'buts_{lieu}_marques', 0)}-{stats.get(f'buts_{lieu}_encaisses', 0)}"
+        )
+
+    entete = [
+        f"MATCH {prediction_obj['date']} | {prediction_obj['league']}",
+        f"{home} (DOM) vs {away} (EXT)",
+        "ÉQUIPES (classement | buts moy. marqués/encaissés | forme 6 (pts) | forme 10 (pts) | série | buts marqués-encaissés dom./ext.)",
+        ligne_equipe("DOM", home, pos_home, prediction_obj.get("points_classement_home"), stats_home, "serie_domicile", "dom"),
+        ligne_equipe("EXT", away, pos_away, prediction_obj.get("points_classement_away"), stats_away, "serie_exterieur", "ext"),
+    ]
+    if odds:
+        cotes = " ".join(f"{k}={v}" for k, v in odds.get("h2h", {}).items())
+        totaux = " ".join(f"{k}={v}" for k, v in odds.get("totals", {}).items())
+        entete.append(f"COTES {odds.get('bookmaker', 'N/A')}: 1X2 {cotes or '-'} | Total 2.5 {totaux or '-'}")
+    else:
+        entete.append("COTES: aucune")
+
+    consignes = [
+        "MISSION : analyse comparative (forme, domicile/extérieur, classement, H2H, cotes) puis UNE prédiction parmi :",
+        f"Victoire domicile ({home}) | Victoire extérieur ({away}) | Plus de 2.5 buts | Moins de 2.5 buts | "
+        "BTTS oui | BTTS non | Double chance 1X | Double chance X2. Ne JAMAIS prédire \"Match nul\".",
+        "FORMAT DE RÉPONSE OBLIGATOIRE :",
+        "- PRÉDICTION PRINCIPALE : [ta prédiction]",
+        "- CONFIANCE : [X]%",
+        "- SCORES PROBABLES : [Score1] ou [Score2]",
+        "- JUSTIFICATION : [ton analyse détaillée]",
+    ]
+
+    def bloc_matchs(nom, matchs, nombre):
+        lignes = [f"MATCHS RÉCENTS {nom} (date|match|score|poss|tirs_cadrés|corners)"]
+        for match in matchs[:nombre]:
+            if isinstance(match, dict) and "score" in match:
+                lignes.append(_ligne_match_compacte(
+                    match.get("date", "-"), match.get("home_team", "-"), match.get("away_team", "-"),
+                    match["score"], match.get("stats")
+                ))
+        return lignes if len(lignes) > 1 else []
+
+    def bloc_classement(mode):
+        if mode == "aucun":
+            return []
+        classement = prediction_obj.get("classement_complet") or []
+        if mode == "voisinage":
+            positions = [p for p in (pos_home, pos_away) if p]
+            classement = [t for t in classement if any(abs(t.get("position", 0) - p) <= 2 for p in positions)]
+        if not classement:
+            return []
+        return ["CLASSEMENT (pos.équipe:pts) " + " ".join(
+            f"{t.get('position')}.{t.get('team')}:{t.get('points')}" for t in classement
+        )]
+
+    def bloc_h2h(nombre):
+        confrontations = (prediction_obj.get("confrontations_saison_derniere") or [])[:nombre]
+        if not confrontations:
+            return []
+        return ["H2H SAISON DERNIÈRE (date|match|score|poss|tirs_cadrés|corners)"] + [
+            _ligne_match_compacte(m.get("date", "-"), m.get("team1", "-"), m.get("team2", "-"), m.get("score", "-"), m.get("stats"))
+            for m in confrontations
+        ]
+
+    # Du plus riche au plus sobre : (matchs récents par équipe, classement, confrontations H2H)
+    niveaux = [(10, "complet", 10), (10, "voisinage", 10), (6, "voisinage", 5), (3, "voisinage", 3), (3, "aucun", 2), (0, "aucun", 0)]
+    for nb_matchs, mode_classement, nb_h2h in niveaux:
+        lignes = (
+            entete
+            + bloc_matchs(home, prediction_obj.get("last_matches_home", []), nb_matchs)
+            + bloc_matchs(away, prediction_obj.get("last_matches_away", []), nb_matchs)
+            + bloc_classement(mode_classement)
+            + bloc_h2h(nb_h2h)
+            + consignes
+        )
+        prompt = "\n".join(lignes)
+        estimation = estimer_tokens(prompt)
+        if estimation <= budget_tokens:
+            break
+    return prompt, estimation
+
+def construire_prompt(prediction_obj):
+    """Prompt selon PROMPT_MODE ("detaille" ou "compact"). Retourne (prompt, estimation_tokens)."""
+    if PROMPT_MODE == "compact":
+        return generate_compact_prompt(prediction_obj)
+    prompt = generate_detailed_prompt(prediction_obj)
+    return prompt, estimer_tokens(prompt)
+
+def decoder_analyse_json(contenu):
+    """
+    Décode en une fois une réponse IA structurée (JSON, éventuellement entourée de ```json).
+    Retourne {prediction_principale, confiance_pourcentage, scores_probables, justification} ou None.
+    """
+    if not isinstance(contenu, str) or contenu.startswith("❌"):
+        return None
+    texte = contenu.strip()
+    if texte.startswith("```"):
+        texte = texte.strip("`").strip()
+        if texte.lower().startswith("json"):
+            texte = texte[4:].strip()
+    if not texte.startswith("{"):
+        return None
+    try:
+        brut = json.loads(texte)
+    except ValueError:
+        return None
+    if not isinstance(brut, dict):
+        return None
 
-⚠️ IMPORTANT : 
-- Ne JAMAIS prédire "Match nul" - utilise "Double chance 1X" ou "Double chance X2" à la place.
+    confiance = brut.get("confiance_pourcentage")
+    try:
+        confiance = int(str(confiance).rstrip("%").strip())
+        if not 0 <= confiance <= 100:
+            confiance = None
+    except (TypeError, ValueError):
+        confiance = None
+    scores = brut.get("scores_probables")
+    if isinstance(scores, list):
+        scores = " ou ".join(str(score).strip() for score in scores if str(score).strip())
+    prediction = brut.get("prediction_principale")
 
-Justifie ta prédiction avec toutes les données statistiques fournies, en tenant compte particulièrement des matchs récents détaillés avec leurs statistiques complètes, du contexte du classement, des confrontations directes avec leurs stats détaillées.
+    return {
+        "prediction_principale": str(prediction).strip() if prediction else None,
+        "confiance_pourcentage": confiance,
+        "scores_probables": str(scores).strip() if scores else None,
+        "justification": str(brut.get("justification") or "").strip()
+    }
 
-FORMAT DE RÉPONSE OBLIGATOIRE :
-- PRÉDICTION PRINCIPALE : [ta prédiction]
-- CONFIANCE : [X]%
-- SCORES PROBABLES : [Score1] ou [Score2]
-- JUSTIFICATION : [ton analyse détaillée]
-"""
-    return prompt
+def formater_analyse_json(champs):
+    """Texte lisible (format de réponse habituel) reconstruit à partir d'une réponse JSON décodée."""
+    confiance = champs["confiance_pourcentage"]
+    return (
+        f"- PRÉDICTION PRINCIPALE : {champs['prediction_principale'] or 'N/A'}\n"
+        f"- CONFIANCE : {confiance if confiance is not None else 'N/A'}%\n"
+        f"- SCORES PROBABLES : {champs['scores_probables'] or 'N/A'}\n"
+        f"- JUSTIFICATION : {champs['justification']}"
+    )
+
+# 🔎 Moteur d'extraction en une passe de l'analyse IA (SUPPORT DES DEUX FORMATS)
+# Chaque alternative = (champ, rang, motif avec un groupe "valeur") ; rang faible = prioritaire
+# (format ** avant format simple), comme l'ordre des anciens patterns. re.IGNORECASE couvre la casse.
+MOTIFS_EXTRACTION_IA = [
+    ("confiance_pourcentage", 0, r'\*\*CONFIANCE\*\*\s*:\s*(?P<valeur>\d+)\s*%'),
+    ("confiance_pourcentage", 1, r'CONFIANCE\s*:\s*(?P<valeur>\d+)\s*%'),
+    ("confiance_pourcentage", 2, r'(?P<valeur>\d+)%\s*de\s*confiance'),
+    ("confiance_pourcentage", 3, r'confiance\s*de\s*(?P<valeur>\d+)%'),
+    ("prediction_principale", 0, r'\*\*PRÉDICTION PRINCIPALE\*\*\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("prediction_principale", 1, r'\*\*PREDICTION PRINCIPALE\*\*\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("prediction_principale", 2, r'PRÉDICTION PRINCIPALE\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("prediction_principale", 3, r'PREDICTION PRINCIPALE\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("corners_prevu", 0, r'\*\*CORNERS PRÉVUS\*\*\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("corners_prevu", 1, r'\*\*CORNERS PREVUS\*\*\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("corners_prevu", 2, r'CORNERS PRÉVUS\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("corners_prevu", 3, r'CORNERS PREVUS\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("tirs_cadres_prevu", 0, r'\*\*TIRS CADRÉS PRÉVUS\*\*\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("tirs_cadres_prevu", 1, r'\*\*TIRS CADRES PREVUS\*\*\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("tirs_cadres_prevu", 2, r'TIRS CADRÉS PRÉVUS\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("tirs_cadres_prevu", 3, r'TIRS CADRES PREVUS\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("scores_probables", 0, r'\*\*SCORES PROBABLES\*\*\s*:\s*(?P<valeur>[^\n\r]+)'),
+    ("scores_probables", 1, r'SCORES PROBABLES\s*:\s*(?P<valeur>[^\n\r]+)'),
+]
+CHAMPS_EXTRACTION_IA = ("confiance_pourcentage", "prediction_principale", "corners_prevu", "tirs_cadres_prevu", "scores_probables")
+
+# Étiquette (en minuscules) -> (champ, variante). Rang : variante en format **,
+# variante + nombre de variantes en format simple (mêmes rangs que MOTIFS_EXTRACTION_IA).
+ETIQUETTES_EXTRACTION_IA = {
+    "confiance": ("confiance_pourcentage", 0),
+    "prédiction principale": ("prediction_principale", 0),
+    "prediction principale": ("prediction_principale", 1),
+    "corners prévus": ("corners_prevu", 0),
+    "corners prevus": ("corners_prevu", 1),
+    "tirs cadrés prévus": ("tirs_cadres_prevu", 0),
+    "tirs cadres prevus": ("tirs_cadres_prevu", 1),
+    "scores probables": ("scores_probables", 0),
+}
+VARIANTES_EXTRACTION_IA = {
+    champ: sum(1 for c, _ in ETIQUETTES_EXTRACTION_IA.values() if c == champ)
+    for champ in CHAMPS_EXTRACTION_IA
+}
+# Un seul parcours du texte passé une fois en minuscules (re.IGNORECASE empêche la recherche rapide
+# par préfixe littéral), puis lecture de la valeur par des regex ancrées juste après l'étiquette.
+REGEX_ETIQUETTES_IA = re.compile("|".join(re.escape(etiquette) for etiquette in ETIQUETTES_EXTRACTION_IA))
+SUITE_ETOILES_TEXTE = re.compile(r'\*\*\s*:\s*([^\n\r]+)')
+SUITE_SIMPLE_TEXTE = re.compile(r'\s*:\s*([^\n\r]+)')
+SUITE_ETOILES_CONFIANCE = re.compile(r'\*\*\s*:\s*(\d+)\s*%')
+SUITE_SIMPLE_CONFIANCE = re.compile(r'\s*:\s*(\d+)\s*%')
+SUITE_DE_CONFIANCE = re.compile(r'\s*de\s*(\d+)%')
+AVANT_DE_CONFIANCE = re.compile(r'(\d+)%\s*de\s*$')
+FENETRE_AVANT_CONFIANCE = 40
+
+# 📋 Rapport des champs manquants (par champ, sur les analyses IA réussies)
+STATS_EXTRACTION_IA = {champ: {"trouves": 0, "manques": 0} for champ in CHAMPS_EXTRACTION_IA}
+STATS_EXTRACTION_IA["analyses_en_echec"] = 0
+
+def _valeur_extraction(champ, brute):
+    """Valeur nettoyée d'un champ extrait, ou None si invalide (confiance hors 0-100)."""
+    if champ != "confiance_pourcentage":
+        return brute.strip()
+    try:
+        pourcentage = int(brute)
+    except ValueError:
+        return None
+    return pourcentage if 0 <= pourcentage <= 100 else None
+
+def _candidats_etiquette(texte_min, debut, fin, champ, variante):
+    """(rang, span de la valeur) lisibles autour d'une étiquette trouvée en position debut:fin."""
+    etoiles = texte_min[max(0, debut - 2):debut] == "**"
+    if champ == "confiance_pourcentage":
+        suites = [(SUITE_ETOILES_CONFIANCE, 0)] if etoiles else []
+        suites += [(SUITE_SIMPLE_CONFIANCE, 1), (SUITE_DE_CONFIANCE, 3)]
+    else:
+        suites = [(SUITE_ETOILES_TEXTE, variante)] if etoiles else []
+        suites.append((SUITE_SIMPLE_TEXTE, variante + VARIANTES_EXTRACTION_IA[champ]))
 
-# ✅ FONCTION AMÉLIORÉE : Extraction des données de l'analyse IA (SUPPORT DES DEUX FORMATS)
+    candidats = []
+    for regex, rang in suites:
+        match = regex.match(texte_min, fin)
+        if match:
+            candidats.append((rang, match.span(1)))
+            break
+    if champ == "confiance_pourcentage":
+        # "XX% de confiance" : la valeur précède l'étiquette
+        match = AVANT_DE_CONFIANCE.search(texte_min, max(0, debut - FENETRE_AVANT_CONFIANCE), debut)
+        if match:
+            candidats.append((2, match.span(1)))
+    return candidats
+
+def extraire_champs_analyse(analyse_ia):
+    """
+    Extrait tous les champs de l'analyse IA en un seul parcours du texte.
+    Retourne {champ: valeur ou None} pour chaque champ de CHAMPS_EXTRACTION_IA.
+    """
+    if not analyse_ia or not isinstance(analyse_ia, str) or analyse_ia.startswith("❌"):
+        return dict.fromkeys(CHAMPS_EXTRACTION_IA)
+    texte_min = analyse_ia.lower()
+    if len(texte_min) != len(analyse_ia):
+        # Minuscules de longueur différente (caractères rares) : positions non réutilisables
+        return _extraire_champs_par_champ(analyse_ia)
+
+    # Première occurrence de chaque rang (le texte est parcouru dans l'ordre)
+    premieres = {}
+    for match in REGEX_ETIQUETTES_IA.finditer(texte_min):
+        champ, variante = ETIQUETTES_EXTRACTION_IA[match.group()]
+        rangs = premieres.setdefault(champ, {})
+        for rang, (debut, fin) in _candidats_etiquette(texte_min, match.start(), match.end(), champ, variante):
+            rangs.setdefault(rang, analyse_ia[debut:fin])
+
+    champs = dict.fromkeys(CHAMPS_EXTRACTION_IA)
+    for champ, rangs in premieres.items():
+        for rang in sorted(rangs):
+            valeur = _valeur_extraction(champ, rangs[rang])
+            if valeur is not None:
+                champs[champ] = valeur
+                break
+    return champs
+
+def _extraire_champs_par_champ(analyse_ia):
+    """Référence du benchmark : un re.search par motif et par champ (ancienne méthode)."""
+    champs = dict.fromkeys(CHAMPS_EXTRACTION_IA)
+    if not analyse_ia or not isinstance(analyse_ia, str) or analyse_ia.startswith("❌"):
+        return champs
+    for champ in CHAMPS_EXTRACTION_IA:
+        motifs = sorted((rang, motif) for nom, rang, motif in MOTIFS_EXTRACTION_IA if nom == champ)
+        for _, motif in motifs:
+            match = re.search(motif, analyse_ia, re.IGNORECASE)
+            if match:
+                valeur = _valeur_extraction(champ, match.group("valeur"))
+                if valeur is not None:
+                    champs[champ] = valeur
+                    break
+    return champs
+
+def comptabiliser_extraction(champs, en_echec=False):
+    """Met à jour le rapport des champs manquants."""
+    with _VERROU_STATS_LLM:
+        if en_echec:
+            STATS_EXTRACTION_IA["analyses_en_echec"] += 1
+            return
+        for champ in CHAMPS_EXTRACTION_IA:
+            STATS_EXTRACTION_IA[champ]["trouves" if champs.get(champ) is not None else "manques"] += 1
+
+def rapport_extraction():
+    """Copie du rapport des champs manquants de l'exécution."""
+    with _VERROU_STATS_LLM:
+        return json.loads(json.dumps(STATS_EXTRACTION_IA))
+
+# ✅ Extracteurs unitaires conservés (délèguent au moteur en une passe)
 def extract_confidence_percentage(analyse_ia):
     """
     Extrait le pourcentage de confiance de l'analyse IA
@@ -2615,256 +1903,237 @@ def extract_confidence_percentage(analyse_ia):
     2. Format avec ** : **CONFIANCE** : XX %
     Retourne le pourcentage en tant que nombre entier ou None si non trouvé
     """
-    if not analyse_ia or isinstance(analyse_ia, str) and analyse_ia.startswith("❌"):
-        return None
-    
-    # Patterns pour le format avec ** (nouveau format)
-    patterns_with_stars = [
-        r'\*\*CONFIANCE\*\*\s*:\s*(\d+)\s*%',
-        r'\*\*Confiance\*\*\s*:\s*(\d+)\s*%',
-        r'\*\*confiance\*\*\s*:\s*(\d+)\s*%',
-        r'\*\*CONFIANCE\*\*\s*:\s*(\d+)\s*\%',
-    ]
-    
-    # Patterns pour le format simple (ancien format)
-    patterns_simple = [
-        r'CONFIANCE\s*:\s*(\d+)%',
-        r'Confiance\s*:\s*(\d+)%',
-        r'confiance\s*:\s*(\d+)%',
-        r'CONFIANCE\s*:\s*(\d+)\s*%',
-        r'(\d+)%\s*de\s*confiance',
-        r'confiance\s*de\s*(\d+)%'
-    ]
-    
-    # Essayer d'abord les patterns avec **
-    for pattern in patterns_with_stars:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            try:
-                percentage = int(match.group(1))
-                if 0 <= percentage <= 100:
-                    print(f"📊 Pourcentage de confiance extrait (format **) : {percentage}%")
-                    return percentage
-            except ValueError:
-                continue
-    
-    # Puis essayer les patterns simples
-    for pattern in patterns_simple:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            try:
-                percentage = int(match.group(1))
-                if 0 <= percentage <= 100:
-                    print(f"📊 Pourcentage de confiance extrait (format simple) : {percentage}%")
-                    return percentage
-            except ValueError:
-                continue
-    
-    print("⚠️ Pourcentage de confiance non trouvé dans l'analyse IA")
-    return None
+    return extraire_champs_analyse(analyse_ia)["confiance_pourcentage"]
 
-# ✅ NOUVELLES FONCTIONS D'EXTRACTION POUR LES AUTRES ÉLÉMENTS
 def extract_prediction_principale(analyse_ia):
-    """
-    Extrait la prédiction principale de l'analyse IA
-    Support des deux formats
-    """
-    if not analyse_ia or isinstance(analyse_ia, str) and analyse_ia.startswith("❌"):
-        return None
-    
-    # Patterns pour le format avec **
-    patterns_with_stars = [
-        r'\*\*PRÉDICTION PRINCIPALE\*\*\s*:\s*([^\n\r]+)',
-        r'\*\*Prédiction principale\*\*\s*:\s*([^\n\r]+)',
-        r'\*\*PREDICTION PRINCIPALE\*\*\s*:\s*([^\n\r]+)',
-    ]
-    
-    # Patterns pour le format simple
-    patterns_simple = [
-        r'PRÉDICTION PRINCIPALE\s*:\s*([^\n\r]+)',
-        r'Prédiction principale\s*:\s*([^\n\r]+)',
-        r'PREDICTION PRINCIPALE\s*:\s*([^\n\r]+)',
-    ]
-    
-    # Essayer d'abord les patterns avec **
-    for pattern in patterns_with_stars:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            prediction = match.group(1).strip()
-            print(f"🎯 Prédiction principale extraite (format **) : {prediction}")
-            return prediction
-    
-    # Puis essayer les patterns simples
-    for pattern in patterns_simple:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            prediction = match.group(1).strip()
-            print(f"🎯 Prédiction principale extraite (format simple) : {prediction}")
-            return prediction
-    
-    print("⚠️ Prédiction principale non trouvée dans l'analyse IA")
-    return None
+    """Extrait la prédiction principale de l'analyse IA (deux formats)."""
+    return extraire_champs_analyse(analyse_ia)["prediction_principale"]
 
 def extract_corners_prevu(analyse_ia):
+    """Extrait la prédiction de corners de l'analyse IA (deux formats)."""
+    return extraire_champs_analyse(analyse_ia)["corners_prevu"]
+
+def extract_tirs_cadres_prevu(analyse_ia):
+    """Extrait la prédiction de tirs cadrés de l'analyse IA (deux formats)."""
+    return extraire_champs_analyse(analyse_ia)["tirs_cadres_prevu"]
+
+def extract_scores_probables(analyse_ia):
+    """Extrait les scores probables de l'analyse IA (deux formats)."""
+    return extraire_champs_analyse(analyse_ia)["scores_probables"]
+
+# 🔤 Résolution unifiée des noms d'équipes (API-Football, ESPN, classements, cotes, H2H)
+LETTRES_SANS_DECOMPOSITION = str.maketrans({"ø": "o", "æ": "ae", "œ": "oe", "ł": "l", "đ": "d", "ð": "d", "ı": "i", "þ": "th"})
+# Mots qui n'identifient pas un club : "Brentford FC" et "Brentford" désignent la même équipe
+MOTS_GENERIQUES_NOMS = {"fc", "afc", "cf", "sc", "ac", "football", "the"}
+# Marqueurs d'équipe réserve, féminine ou de jeunes : "Real Madrid Castilla" ou "Barcelona B" ne sont pas l'équipe première
+MARQUEURS_EQUIPE_NOMS = {
+    "b", "c", "ii", "iii", "w", "women", "womens", "ladies", "feminin", "feminine", "femenino", "femminile", "frauen",
+    "fem", "reserve", "reserves", "castilla", "atletic", "jong", "youth", "juniors", "academy"
+}
+REGEX_MARQUEUR_AGE = re.compile(r"(?:u|sub)\d{2}")
+_FORMES_NOMS = {}
+_TRIGRAMMES_NOMS = {}
+
+def normaliser_nom_equipe(nom):
+    """Forme canonique d'un nom : accents retirés, casse repliée, ponctuation remplacée par des espaces (mise en cache)."""
+    forme = _FORMES_NOMS.get(nom)
+    if forme is None:
+        decompose = unicodedata.normalize("NFKD", str(nom or "").casefold().translate(LETTRES_SANS_DECOMPOSITION))
+        sans_accents = "".join(c for c in decompose if not unicodedata.combining(c))
+        forme = " ".join(re.sub(r"[^0-9a-z]+", " ", sans_accents).split())
+        _FORMES_NOMS[nom] = forme
+    return forme
+
+def trigrammes_nom(forme):
+    """Trigrammes d'une forme canonique (bordée d'espaces pour pondérer les débuts et fins de mots)."""
+    trigrammes = _TRIGRAMMES_NOMS.get(forme)
+    if trigrammes is None:
+        bordee = f"  {forme} "
+        trigrammes = frozenset(bordee[i:i + 3] for i in range(len(bordee) - 2))
+        _TRIGRAMMES_NOMS[forme] = trigrammes
+    return trigrammes
+
+def marqueurs_equipe(forme):
+    """Marqueurs réserve / féminine / jeunes d'une forme canonique (ex. {"b"}, {"u21"}, {"w"})."""
+    return frozenset(mot for mot in forme.split() if mot in MARQUEURS_EQUIPE_NOMS or REGEX_MARQUEUR_AGE.fullmatch(mot))
+
+def similarite_noms(forme_a, forme_b):
     """
-    Extrait la prédiction de corners de l'analyse IA
-    Support des deux formats
+    Similarité de Dice sur les trigrammes. Un nom qui commence le nom long compte pour 0.9 s'il
+    a au moins deux mots ("Paris Saint Germain" / "Paris Saint Germain FC") ou si les mots en plus
+    sont génériques ("Brentford" / "Brentford FC") : "Chile" ne doit pas donner "Universidad De Chile".
+    Deux noms aux marqueurs d'équipe différents ("Benfica" / "Benfica B") ne se ressemblent jamais.
+    """
+    if not forme_a or not forme_b:
+        return 0.0
+    if forme_a == forme_b:
+        return 1.0
+    if marqueurs_equipe(forme_a) != marqueurs_equipe(forme_b):
+        return 0.0
+    tri_a, tri_b = trigrammes_nom(forme_a), trigrammes_nom(forme_b)
+    score = 2 * len(tri_a & tri_b) / (len(tri_a) + len(tri_b))
+    court, long = sorted((forme_a.split(), forme_b.split()), key=len)
+    if long[:len(court)] == court and (len(court) >= 2 or set(long[len(court):]) <= MOTS_GENERIQUES_NOMS):
+        score = max(score, 0.9)
+    return score
+
+class IndexNoms:
+    """
+    Index de noms d'équipes : forme canonique -> nom d'origine (recherche O(1)),
+    et trigramme -> formes pour le repli flou sans parcourir toute la liste.
     """
-    if not analyse_ia or isinstance(analyse_ia, str) and analyse_ia.startswith("❌"):
-        return None
-    
-    # Patterns pour le format avec **
-    patterns_with_stars = [
-        r'\*\*CORNERS PRÉVUS\*\*\s*:\s*([^\n\r]+)',
-        r'\*\*Corners prévus\*\*\s*:\s*([^\n\r]+)',
-        r'\*\*CORNERS PREVUS\*\*\s*:\s*([^\n\r]+)',
-    ]
-    
-    # Patterns pour le format simple
-    patterns_simple = [
-        r'CORNERS PRÉVUS\s*:\s*([^\n\r]+)',
-        r'Corners prévus\s*:\s*([^\n\r]+)',
-        r'CORNERS PREVUS\s*:\s*([^\n\r]+)',
-    ]
-    
-    # Essayer d'abord les patterns avec **
-    for pattern in patterns_with_stars:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            corners = match.group(1).strip()
-            print(f"📐 Corners prévus extraits (format **) : {corners}")
-            return corners
-    
-    # Puis essayer les patterns simples
-    for pattern in patterns_simple:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            corners = match.group(1).strip()
-            print(f"📐 Corners prévus extraits (format simple) : {corners}")
-            return corners
-    
-    print("⚠️ Corners prévus non trouvés dans l'analyse IA")
-    return None
 
-def extract_tirs_cadres_prevu(analyse_ia):
+    def __init__(self, noms=()):
+        self.noms = {}
+        self.par_trigramme = {}
+        self.resolutions = {}
+        for nom in noms:
+            self.ajouter(nom)
+
+    def ajouter(self, nom):
+        forme = normaliser_nom_equipe(nom)
+        if not forme or forme in self.noms:
+            return
+        self.noms[forme] = nom
+        for trigramme in trigrammes_nom(forme):
+            self.par_trigramme.setdefault(trigramme, set()).add(forme)
+
+    def resoudre(self, nom):
+        """Nom d'origine correspondant à nom (exact après normalisation, sinon flou non ambigu), ou None."""
+        forme = normaliser_nom_equipe(nom)
+        if forme in self.noms:
+            return self.noms[forme]
+        if forme not in self.resolutions:
+            candidats = set()
+            for trigramme in trigrammes_nom(forme):
+                candidats |= self.par_trigramme.get(trigramme, set())
+            scores = sorted((similarite_noms(forme, candidat), candidat) for candidat in candidats)
+            resolu = None
+            if scores and scores[-1][0] >= SEUIL_SIMILARITE_NOMS:
+                # Deux candidats trop proches (ex. "Manchester" -> United ou City) : on préfère ne pas deviner
+                if len(scores) == 1 or scores[-1][0] - scores[-2][0] >= MARGE_SIMILARITE_NOMS:
+                    resolu = self.noms[scores[-1][1]]
+            self.resolutions[forme] = resolu
+        return self.resolutions[forme]
+
+# 🗃️ Index de noms construits une fois par exécution (équipes ESPN des registres, mapping API -> ESPN)
+INDEX_NOMS_CACHE = {}
+
+def index_noms_espn():
+    return obtenir_ou_calculer(INDEX_NOMS_CACHE, "espn", lambda: IndexNoms(equipes_espn()))
+
+def mapping_noms_normalise():
+    """Mapping des noms indexé par forme canonique (le mapping s'applique malgré accents et casse)."""
+    return obtenir_ou_calculer(
+        INDEX_NOMS_CACHE, "mapping",
+        lambda: {normaliser_nom_equipe(api): espn for api, espn in mapping_noms_equipes().items()}
+    )
+
+def nom_mappe(nom):
+    """Nom après le mapping des noms (clé exacte, puis forme canonique)."""
+    mapping = mapping_noms_equipes()
+    if nom in mapping:
+        return mapping[nom]
+    return mapping_noms_normalise().get(normaliser_nom_equipe(nom), nom)
+
+def resoudre_nom_espn(nom):
+    """Nom ESPN d'une équipe des registres (nom API-Football ou ESPN), ou None si aucune correspondance sûre."""
+    mappe = nom_mappe(nom)
+    if mappe in equipes_espn():
+        return mappe
+    return index_noms_espn().resoudre(mappe)
+
+def cle_equipe(nom):
+    """Forme canonique comparable entre sources (mapping appliqué)."""
+    return normaliser_nom_equipe(nom_mappe(nom))
+
+def cote_equipe(team_name, team1, team2):
     """
-    Extrait la prédiction de tirs cadrés de l'analyse IA
-    Support des deux formats
+    "home" si team_name désigne team1, "away" si elle désigne team2, None sinon.
+    Égalité des formes canoniques d'abord, puis la plus similaire des deux si elle l'est nettement.
     """
-    if not analyse_ia or isinstance(analyse_ia, str) and analyse_ia.startswith("❌"):
-        return None
-    
-    # Patterns pour le format avec **
-    patterns_with_stars = [
-        r'\*\*TIRS CADRÉS PRÉVUS\*\*\s*:\s*([^\n\r]+)',
-        r'\*\*Tirs cadrés prévus\*\*\s*:\s*([^\n\r]+)',
-        r'\*\*TIRS CADRES PREVUS\*\*\s*:\s*([^\n\r]+)',
-    ]
-    
-    # Patterns pour le format simple
-    patterns_simple = [
-        r'TIRS CADRÉS PRÉVUS\s*:\s*([^\n\r]+)',
-        r'Tirs cadrés prévus\s*:\s*([^\n\r]+)',
-        r'TIRS CADRES PREVUS\s*:\s*([^\n\r]+)',
-    ]
-    
-    # Essayer d'abord les patterns avec **
-    for pattern in patterns_with_stars:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            tirs = match.group(1).strip()
-            print(f"🎯 Tirs cadrés prévus extraits (format **) : {tirs}")
-            return tirs
-    
-    # Puis essayer les patterns simples
-    for pattern in patterns_simple:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            tirs = match.group(1).strip()
-            print(f"🎯 Tirs cadrés prévus extraits (format simple) : {tirs}")
-            return tirs
-    
-    print("⚠️ Tirs cadrés prévus non trouvés dans l'analyse IA")
+    cle, cle1, cle2 = cle_equipe(team_name), cle_equipe(team1), cle_equipe(team2)
+    if cle == cle1:
+        return "home"
+    if cle == cle2:
+        return "away"
+    score1, score2 = similarite_noms(cle, cle1), similarite_noms(cle, cle2)
+    if max(score1, score2) >= SEUIL_SIMILARITE_NOMS and abs(score1 - score2) >= MARGE_SIMILARITE_NOMS:
+        return "home" if score1 > score2 else "away"
     return None
 
-def extract_scores_probables(analyse_ia):
+# 🗃️ Cotes déjà téléchargées pendant l'exécution, indexées par sport_odds_id
+COTES_CACHE = {}
+# ❌ Erreur du dernier téléchargement raté des cotes, par sport_odds_id (HTTP ou exception)
+ERREURS_COTES = {}
+
+def normaliser_paire(team_a, team_b):
+    """Clé non ordonnée d'une paire d'équipes (formes canoniques, sans sens domicile/extérieur)."""
+    return frozenset((normaliser_nom_equipe(team_a), normaliser_nom_equipe(team_b)))
+
+def get_cotes_ligue(sport_odds_id):
     """
-    Extrait les scores probables de l'analyse IA
-    Support des deux formats
+    Télécharge une seule fois par exécution le payload /odds d'une ligue (facturé à la requête)
+    et l'indexe par paire d'équipes normalisée ({"matchs": {paire: match}, "noms": IndexNoms}).
+    Retourne None si l'appel a échoué (l'erreur est notée dans ERREURS_COTES).
     """
-    if not analyse_ia or isinstance(analyse_ia, str) and analyse_ia.startswith("❌"):
-        return None
-    
-    # Patterns pour le format avec **
-    patterns_with_stars = [
-        r'\*\*SCORES PROBABLES\*\*\s*:\s*([^\n\r]+)',
-        r'\*\*Scores probables\*\*\s*:\s*([^\n\r]+)',
-        r'\*\*SCORES PROBABLES\*\*\s*:\s*([^\n\r]+)',
-    ]
-    
-    # Patterns pour le format simple
-    patterns_simple = [
-        r'SCORES PROBABLES\s*:\s*([^\n\r]+)',
-        r'Scores probables\s*:\s*([^\n\r]+)',
-        r'SCORES PROBABLES\s*:\s*([^\n\r]+)',
-    ]
-    
-    # Essayer d'abord les patterns avec **
-    for pattern in patterns_with_stars:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            scores = match.group(1).strip()
-            print(f"⚽ Scores probables extraits (format **) : {scores}")
-            return scores
-    
-    # Puis essayer les patterns simples
-    for pattern in patterns_simple:
-        match = re.search(pattern, analyse_ia, re.IGNORECASE)
-        if match:
-            scores = match.group(1).strip()
-            print(f"⚽ Scores probables extraits (format simple) : {scores}")
-            return scores
-    
-    print("⚠️ Scores probables non trouvés dans l'analyse IA")
-    return None
+    def _charger():
+        url = f"https://api.the-odds-api.com/v4/sports/{sport_odds_id}/odds"
+        params = {
+            "apiKey": ODDS_API_KEY,
+            "regions": REGION,
+            "markets": MARKETS,
+            "oddsFormat": "decimal"
+        }
+        try:
+            response = http_get(url, params=params)
+            if response.status_code != 200:
+                print(f"❌ Erreur API Odds : {response.status_code}")
+                ERREURS_COTES[sport_odds_id] = f"HTTP {response.status_code}"
+                return None
+
+            index = {}
+            noms = IndexNoms()
+            for match in response.json():
+                index.setdefault(normaliser_paire(match['home_team'], match['away_team']), match)
+                noms.ajouter(match['home_team'])
+                noms.ajouter(match['away_team'])
+            print(f"💰 {len(index)} match(s) avec cotes chargés pour {sport_odds_id}")
+            return {"matchs": index, "noms": noms}
+        except Exception as e:
+            print(f"❌ Erreur lors de la récupération des cotes : {e}")
+            ERREURS_COTES[sport_odds_id] = str(e)
+            return None
+
+    return obtenir_ou_calculer(COTES_CACHE, sport_odds_id, _charger)
 
 def get_odds_for_match(sport_odds_id, home_team_api, away_team_api, home_team_espn, away_team_espn):
     if sport_odds_id == "none":
         print(f"⚠️ Pas d'odds_id disponible pour ce championnat")
         return None
 
-    url = f"https://api.the-odds-api.com/v4/sports/{sport_odds_id}/odds"
-    params = {
-        "apiKey": ODDS_API_KEY,
-        "regions": REGION,
-        "markets": MARKETS,
-        "oddsFormat": "decimal"
-    }
+    cotes_ligue = get_cotes_ligue(sport_odds_id)
+    if cotes_ligue is None:
+        return None
+    matches_index = cotes_ligue["matchs"]
 
     try:
-        response = requests.get(url, params=params)
-        if response.status_code != 200:
-            print(f"❌ Erreur API Odds : {response.status_code}")
-            return None
-
-        matches = response.json()
-
-        target_match = None
-        for match in matches:
-            home_odds = match['home_team']
-            away_odds = match['away_team']
-
-            if ((home_odds.lower() == home_team_api.lower() or away_odds.lower() == home_team_api.lower()) and 
-                (home_odds.lower() == away_team_api.lower() or away_odds.lower() == away_team_api.lower())):
-                target_match = match
-                print(f"✅ Match trouvé avec noms API : {home_odds} vs {away_odds}")
-                break
-
-            if ((home_odds.lower() == home_team_espn.lower() or away_odds.lower() == home_team_espn.lower()) and 
-                (home_odds.lower() == away_team_espn.lower() or away_odds.lower() == away_team_espn.lower())):
-                target_match = match
-                print(f"✅ Match trouvé avec noms ESPN : {home_odds} vs {away_odds}")
-                break
+        target_match = matches_index.get(normaliser_paire(home_team_api, away_team_api))
+        if target_match:
+            print(f"✅ Match trouvé avec noms API : {target_match['home_team']} vs {target_match['away_team']}")
+        else:
+            target_match = matches_index.get(normaliser_paire(home_team_espn, away_team_espn))
+            if target_match:
+                print(f"✅ Match trouvé avec noms ESPN : {target_match['home_team']} vs {target_match['away_team']}")
+        if not target_match:
+            # Repli flou : noms du bookmaker les plus proches (ESPN puis API)
+            noms = cotes_ligue["noms"]
+            home_odds = noms.resoudre(home_team_espn) or noms.resoudre(home_team_api)
+            away_odds = noms.resoudre(away_team_espn) or noms.resoudre(away_team_api)
+            if home_odds and away_odds:
+                target_match = matches_index.get(normaliser_paire(home_odds, away_odds))
+                if target_match:
+                    print(f"✅ Match trouvé par similarité des noms : {target_match['home_team']} vs {target_match['away_team']}")
 
         if not target_match:
             print(f"❌ Match non trouvé dans les cotes : {home_team_api} vs {away_team_api}")
@@ -2911,13 +2180,14 @@ def get_odds_for_match(sport_odds_id, home_team_api, away_team_api, home_team_es
 class ClassementScraper:
     def __init__(self, url):
         self.url = url
-        self.headers = {'User-Agent': 'Mozilla/5.0'}
         self.teams_positions = {}
+        self.index_noms = IndexNoms()
         self.full_standings = []  # Nouveau : stockage du classement complet
+        self.erreur = None  # Erreur HTTP ou de scraping ; None si la page a été lue (même sans classement)
 
     def scrape_table(self):
         try:
-            response = requests.get(self.url, headers=self.headers)
+            response = http_get_page(self.url)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -2944,7 +2214,8 @@ class ClassementScraper:
             print(f"🏆 Classement extrait de {self.url}:")
             for i, (team, pts) in enumerate(teams_data, start=1):
                 if team and pts is not None:
-                    self.teams_positions[team.lower()] = (i, team, pts)
+                    self.teams_positions[normaliser_nom_equipe(team)] = (i, team, pts)
+                    self.index_noms.ajouter(team)
                     self.full_standings.append({
                         "position": i,
                         "team": team,
@@ -2954,28 +2225,52 @@ class ClassementScraper:
 
         except Exception as e:
             print(f"❌ Erreur scraping classement : {e}")
+            self.erreur = str(e)
 
     def get_position(self, team_query):
         # Utiliser le mapping pour convertir le nom API vers le nom ESPN
-        mapped_team_name = team_name_mapping.get(team_query, team_query)
+        mapped_team_name = nom_mappe(team_query)
         
-        # Recherche exacte d'abord
-        if mapped_team_name.lower() in self.teams_positions:
-            return self.teams_positions[mapped_team_name.lower()]
+        # Recherche exacte d'abord (forme canonique : accents et casse ignorés)
+        forme = normaliser_nom_equipe(mapped_team_name)
+        if forme in self.teams_positions:
+            return self.teams_positions[forme]
         
-        # Recherche partielle ensuite
-        for key, (position, full_name, points) in self.teams_positions.items():
-            if mapped_team_name.lower() in key or key in mapped_team_name.lower():
-                return position, full_name, points
+        # Recherche approchée ensuite (inclusion ou trigrammes, via l'index)
+        trouve = self.index_noms.resoudre(mapped_team_name)
+        if trouve:
+            return self.teams_positions[normaliser_nom_equipe(trouve)]
         return None, None, None
 
     def get_full_standings(self):
         """Retourne le classement complet"""
         return self.full_standings
 
+# 🗃️ Classements déjà téléchargés pendant l'exécution, indexés par URL ESPN
+CLASSEMENTS_CACHE = {}
+
+CLASSEMENT_DELAI_NOUVEL_ESSAI = 2.0  # secondes avant de retenter un classement vide ou en erreur
+
+def get_classement_scraper(url):
+    """
+    Retourne le ClassementScraper d'une ligue, téléchargé et parsé une seule fois par exécution.
+    Un classement vide (erreur ESPN passagère) est retenté une fois avant d'être mémorisé ;
+    seul un classement en erreur (scraper.erreur) compte ensuite comme échec de la source.
+    """
+    def _scraper():
+        scraper = ClassementScraper(url)
+        scraper.scrape_table()
+        if not scraper.get_full_standings():
+            print(f"🔁 Classement vide pour {url} : nouvel essai dans {CLASSEMENT_DELAI_NOUVEL_ESSAI:.0f}s")
+            time.sleep(CLASSEMENT_DELAI_NOUVEL_ESSAI)
+            scraper = ClassementScraper(url)
+            scraper.scrape_table()
+        return scraper
+    return obtenir_ou_calculer(CLASSEMENTS_CACHE, url, _scraper)
+
 # 🧠 Fonction utilitaire get_team_classement_position (modifiée pour retourner le classement complet)
-def get_team_classement_position(country, league, team_name):
-    league_info = classement_ligue_mapping.get(country, {}).get(league)
+def get_team_classement_position(country, league, team_name, league_id=None):
+    league_info = info_ligue(country, league, league_id)
     if not league_info:
         print(f"⚠️ Informations de ligue introuvables pour {country} - {league}")
         return None, None, None, []
@@ -2984,11 +2279,10 @@ def get_team_classement_position(country, league, team_name):
     odds_id = league_info["odds_id"]
     
     print(f"🔍 Recherche classement pour {team_name} dans {country} - {league} (odds_id: {odds_id})")
-    scraper = ClassementScraper(url)
-    scraper.scrape_table()
+    scraper = get_classement_scraper(url)
     
     # Utiliser le mapping pour convertir le nom API vers le nom ESPN
-    mapped_team_name = team_name_mapping.get(team_name, team_name)
+    mapped_team_name = nom_mappe(team_name)
     position, full_name, points = scraper.get_position(mapped_team_name)
     full_standings = scraper.get_full_standings()
     
@@ -3000,7 +2294,7 @@ def get_team_classement_position(country, league, team_name):
     return position, full_name, points, full_standings
 
 def get_espn_name(api_team_name):
-    mapped = team_name_mapping.get(api_team_name, api_team_name)
+    mapped = resoudre_nom_espn(api_team_name) or nom_mappe(api_team_name)
     if mapped != api_team_name:
         print(f"🔄 Mapping appliqué: '{api_team_name}' → '{mapped}'")
     return mapped
@@ -3017,85 +2311,125 @@ def format_date_fr(date_str, time_str):
     except Exception as e:
         return f"{date_str} à {time_str}:00 UTC"
 
-# 🆚 Fonction pour récupérer les confrontations directes de la saison passée avec STATISTIQUES DÉTAILLÉES - MODIFIÉE
-def get_h2h_confrontations(home_team_espn, away_team_espn):
+# 🗃️ Index H2H construit une fois par exécution à partir des fichiers data_json
+H2H_BASE_RAW_URL = "https://raw.githubusercontent.com/Jonnhy2255/Pronosoftbot/main/"
+H2H_INDEX_CACHE = {}
+
+def _telecharger_saison_h2h(data_json):
+    """Télécharge un fichier de saison data_json depuis GitHub Raw (liste vide en cas d'échec)."""
+    raw_url = H2H_BASE_RAW_URL + data_json
+    try:
+        print(f"🔍 Téléchargement des données H2H depuis {raw_url}")
+        resp = http_get(raw_url, timeout=15)
+        if resp.status_code != 200:
+            print(f"⚠️ Échec téléchargement {data_json} : HTTP {resp.status_code}")
+            return []
+        return resp.json()
+    except Exception as e:
+        print(f"❌ Erreur lors de la récupération/lecture de {raw_url} : {e}")
+        return []
+
+def get_h2h_index():
     """
-    Récupère les confrontations directes de la saison passée depuis les fichiers JSON
-    définis dans classement_ligue_mapping avec récupération des statistiques détaillées via gameId.
-    Les JSON sont récupérés depuis le dépôt GitHub Raw :
-    https://raw.githubusercontent.com/Jonnhy2255/Pronosoftbot/main/<data_json>
+    Construit (une seule fois par exécution) l'index des confrontations directes :
+    { frozenset({team1, team2}): { championnat: [match, ...] } }
+    Chaque fichier data_json n'est téléchargé qu'une fois, en parallèle.
     """
-    confrontations = []
-    base_raw_url = "https://raw.githubusercontent.com/Jonnhy2255/Pronosoftbot/main/"
-
-    # Parcourir tous les pays et ligues dans classement_ligue_mapping
-    for country, leagues in classement_ligue_mapping.items():
-        for league_name, league_info in leagues.items():
+    def _construire():
+        sources = []
+        for league_info in index_ligues()["par_nom"].values():
             data_json = league_info.get("data_json", "none")
-            
             # Ignorer si pas de fichier JSON défini
             if data_json == "none" or not data_json:
                 continue
-
-            raw_url = base_raw_url + data_json
-            try:
-                print(f"🔍 Tentative de récupération H2H depuis {raw_url} ({league_name})")
-                resp = requests.get(raw_url, timeout=15)
-                if resp.status_code != 200:
-                    print(f"⚠️ Échec téléchargement {data_json} : HTTP {resp.status_code}")
+            sources.append((league_info["ligue"], data_json))
+
+        fichiers = list(dict.fromkeys(data_json for _, data_json in sources))
+        with ThreadPoolExecutor(max_workers=max(4, MAX_WORKERS)) as pool:
+            contenus = dict(zip(fichiers, pool.map(_telecharger_saison_h2h, fichiers)))
+
+        index = {}
+        total = 0
+        for league_name, data_json in sources:
+            for match in contenus.get(data_json) or []:
+                team1 = match.get("team1", "")
+                team2 = match.get("team2", "")
+                if not team1 or not team2:
                     continue
+                paire = normaliser_paire(team1, team2)
+                index.setdefault(paire, {}).setdefault(league_name, []).append(match)
+                total += 1
+        print(f"🆚 Index H2H construit : {total} match(s), {len(index)} paire(s), {len(fichiers)} fichier(s)")
+        return index
+
+    return obtenir_ou_calculer(H2H_INDEX_CACHE, "index", _construire)
+
+def index_noms_h2h():
+    """IndexNoms des équipes présentes dans les fichiers H2H (repli flou de get_h2h_confrontations)."""
+    def _construire():
+        noms = IndexNoms()
+        for matchs_par_ligue in get_h2h_index().values():
+            for matchs in matchs_par_ligue.values():
+                for match in matchs:
+                    noms.ajouter(match["team1"])
+                    noms.ajouter(match["team2"])
+        return noms
+    return obtenir_ou_calculer(H2H_INDEX_CACHE, "noms", _construire)
+
+# 🆚 Fonction pour récupérer les confrontations directes de la saison passée avec STATISTIQUES DÉTAILLÉES - MODIFIÉE
+def get_h2h_confrontations(home_team_espn, away_team_espn):
+    """
+    Récupère les confrontations directes de la saison passée depuis l'index H2H
+    (fichiers JSON data_json des registres de ligues, téléchargés une fois par exécution
+    depuis https://raw.githubusercontent.com/Jonnhy2255/Pronosoftbot/main/<data_json>)
+    avec récupération des statistiques détaillées via gameId.
+    """
+    confrontations = []
+    index = get_h2h_index()
+    matchs_par_ligue = index.get(normaliser_paire(home_team_espn, away_team_espn))
+    if matchs_par_ligue is None:
+        # Repli flou : noms des fichiers H2H les plus proches
+        noms = index_noms_h2h()
+        home_h2h, away_h2h = noms.resoudre(home_team_espn), noms.resoudre(away_team_espn)
+        matchs_par_ligue = index.get(normaliser_paire(home_h2h, away_h2h), {}) if home_h2h and away_h2h else {}
+
+    for league_name, matchs in matchs_par_ligue.items():
+        for match_source in matchs:
+            match = dict(match_source)  # copie : l'index est partagé entre les matchs du jour
+            match["source"] = league_name  # Ajouter la source du championnat
+
+            # ✅ NOUVEAU : Récupérer les statistiques détaillées si gameId disponible
+            game_id = match.get("gameId", "N/A")
+            if game_id and game_id != "N/A":
+                try:
+                    print(f"🔍 Récupération des stats H2H pour le match {game_id}...")
+                    h2h_stats = get_match_stats(game_id)
+                    match["stats"] = h2h_stats
+                    if h2h_stats:
+                        print(f"📊 {len(h2h_stats)} statistiques H2H récupérées pour {match.get('team1')} vs {match.get('team2')}")
+                except Exception as e:
+                    print(f"⚠️ Erreur récupération stats pour gameId {game_id} : {e}")
+                    match["stats"] = {}
+            else:
+                match["stats"] = {}
+
+            confrontations.append(match)
+        print(f"🆚 {len(matchs)} confrontation(s) trouvée(s) dans {league_name}")
 
-                data = resp.json()
-                
-                matchs_trouvés = 0
-                # Parcourir tous les matchs dans le fichier JSON
-                for match in data:
-                    team1 = match.get("team1", "")
-                    team2 = match.get("team2", "")
-                    
-                    # Vérifier si les deux équipes correspondent (dans un sens ou l'autre)
-                    if ((team1 == home_team_espn and team2 == away_team_espn) or 
-                        (team1 == away_team_espn and team2 == home_team_espn)):
-                        
-                        match["source"] = league_name  # Ajouter la source du championnat
-                        
-                        # ✅ NOUVEAU : Récupérer les statistiques détaillées si gameId disponible
-                        game_id = match.get("gameId", "N/A")
-                        if game_id and game_id != "N/A":
-                            try:
-                                print(f"🔍 Récupération des stats H2H pour le match {game_id}...")
-                                h2h_stats = get_match_stats(game_id)
-                                match["stats"] = h2h_stats
-                                if h2h_stats:
-                                    print(f"📊 {len(h2h_stats)} statistiques H2H récupérées pour {team1} vs {team2}")
-                            except Exception as e:
-                                print(f"⚠️ Erreur récupération stats pour gameId {game_id} : {e}")
-                                match["stats"] = {}
-                        else:
-                            match["stats"] = {}
-                        
-                        confrontations.append(match)
-                        matchs_trouvés += 1
-                
-                if matchs_trouvés > 0:
-                    print(f"🆚 {matchs_trouvés} confrontation(s) trouvée(s) dans {league_name}")
-            except Exception as e:
-                print(f"❌ Erreur lors de la récupération/lecture de {raw_url} ({league_name}) : {e}")
-    
     print(f"🆚 Total : {len(confrontations)} confrontation(s) directe(s) trouvée(s) pour {home_team_espn} vs {away_team_espn}")
     return confrontations
 
-def get_today_matches_filtered():
+def get_today_matches_filtered(reprise=False):
     today = datetime.now().strftime('%Y-%m-%d')
     url = "https://v3.football.api-sports.io/fixtures"
     params = {
         "date": today,
         "timezone": "Africa/Abidjan"
     }
-    allowed_league_ids = [72, 265, 281, 218, 113, 129, 250, 252, 299, 283, 43, 239, 61, 144, 39, 88, 94, 140, 197, 203, 98, 383, 207, 169, 235, 262, 307, 71, 253, 78, 135]
-    résultats = []
+    allowed_league_ids = ligues_autorisees()
+    fixtures = []
     try:
-        response = requests.get(url, headers=api_headers, params=params)
+        response = http_get(url, headers=api_headers, params=params)
         response.raise_for_status()
         data = response.json()
         print("🐛 DEBUG - Statut HTTP:", response.status_code)
@@ -3120,56 +2454,94 @@ def get_today_matches_filtered():
 
             if league_id in allowed_league_ids:
                 print(f"🏆 [{country}] {league} : {home_api} vs {away_api} à {time}")
-                # Utiliser le mapping pour les noms ESPN
-                home_espn = get_espn_name(home_api)
-                away_espn = get_espn_name(away_api)
-                
-                if home_espn in teams_urls and away_espn in teams_urls:
-                    print(f"\n🔎 Analyse automatique pour : {home_espn} & {away_espn}")
-                    team1_stats = process_team(home_api, return_data=True)
-                    team2_stats = process_team(away_api, return_data=True)
-                    if team1_stats: team1_stats['nom'] = home_espn
-                    if team2_stats: team2_stats['nom'] = away_espn
-                    compare_teams_basic_stats(
-                        team1_stats, team2_stats, home_api, away_api, date, time, league, country,
-                        logo_home=logo_home, logo_away=logo_away, résultats=résultats
-                    )
-                else:
-                    if home_espn in teams_urls:
-                        process_team(home_api)
-                    else:
-                        FAILED_TEAMS.add(home_api)
-                    if away_espn in teams_urls:
-                        process_team(away_api)
-                    else:
-                        FAILED_TEAMS.add(away_api)
-        
-        # ✅ CORRECTION 1 : Récupérer le chemin retourné par sauvegarder_stats_brutes_json
-        if résultats:
-            chemin = sauvegarder_stats_brutes_json(résultats, today)  # ✅ Récupérer le chemin
+                apprendre_ligue(league_id, country, league)
+                fixtures.append({
+                    "fixture_id": match['fixture'].get('id'),
+                    "league_id": league_id,
+                    "league": league,
+                    "country": country,
+                    "home_api": home_api,
+                    "away_api": away_api,
+                    "logo_home": logo_home,
+                    "logo_away": logo_away,
+                    "date": date,
+                    "time": time
+                })
+
+        # 🚦 Analyse des matchs : séquentielle ou via un pool de workers borné,
+        # chaque prédiction est écrite dans le flux NDJSON dès que son match est terminé
+        print(f"\n🚦 {len(fixtures)} match(s) à analyser (parallélisme : {MAX_WORKERS}{', reprise' if reprise else ''})")
+        nettoyer_runs(today)
+        chemin_flux = initialiser_flux_predictions(today, vider=not reprise)
+        taches = list(enumerate(fixtures))
+        if MAX_WORKERS > 1 and len(fixtures) > 1:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+                consignees = list(pool.map(lambda tache: analyser_et_consigner(tache, today, reprise), taches))
+        else:
+            consignees = [analyser_et_consigner(tache, today, reprise) for tache in taches]
+        print(f"🧾 {sum(consignees)} prédiction(s) consignée(s) dans {chemin_flux}")
+
+        # ✅ CORRECTION 1 : Récupérer le chemin du fichier du jour, produit depuis le flux
+        chemin = finaliser_depuis_flux(today, fixture_ids=[fixture.get("fixture_id") for fixture in fixtures])
+        if chemin:
             git_commit_and_push(chemin)  # ✅ Utiliser le bon chemin
         
         if FAILED_TEAMS:
             save_failed_teams_json(FAILED_TEAMS, today)
         if IGNORED_ZERO_FORM_TEAMS:
             save_ignored_teams_json(IGNORED_ZERO_FORM_TEAMS, today)
+        if LLM_HEDGING:
+            print(f"🪁 Bilan hedging LLM : {json.dumps(rapport_hedging(), ensure_ascii=False)}")
+        print(f"🔎 Bilan extraction IA : {json.dumps(rapport_extraction(), ensure_ascii=False)}")
     except Exception as e:
         print(f"❌ Erreur lors de la récupération des matchs : {e}")
 
+def analyser_fixture(fixture, avec_ia=True):
+    """
+    Analyse complète d'un match du jour (stats ESPN, classement, cotes, H2H, IA).
+    Retourne le prediction_obj (id attribué plus tard) ou None si le match est ignoré.
+    Utilisée telle quelle en mode séquentiel et depuis le pool de workers.
+    avec_ia=False s'arrête après l'étape données (voir executer_etape_ia).
+    """
+    home_api = fixture["home_api"]
+    away_api = fixture["away_api"]
+    # Utiliser le mapping pour les noms ESPN
+    home_espn = get_espn_name(home_api)
+    away_espn = get_espn_name(away_api)
+
+    equipes = equipes_espn()
+    if home_espn in equipes and away_espn in equipes:
+        print(f"\n🔎 Analyse automatique pour : {home_espn} & {away_espn}")
+        team1_stats = process_team(home_api, return_data=True)
+        team2_stats = process_team(away_api, return_data=True)
+        if team1_stats: team1_stats['nom'] = home_espn
+        if team2_stats: team2_stats['nom'] = away_espn
+        return analyser_confrontation(
+            team1_stats, team2_stats, home_api, away_api, fixture["date"], fixture["time"],
+            fixture["league"], fixture["country"],
+            logo_home=fixture["logo_home"], logo_away=fixture["logo_away"], avec_ia=avec_ia,
+            league_id=fixture.get("league_id")
+        )
+
+    # Adversaire introuvable : pas de téléchargement ESPN inutile pour l'équipe connue (match non analysable)
+    for api_name, espn_name in ((home_api, home_espn), (away_api, away_espn)):
+        if espn_name not in equipes:
+            print(f"❌ Équipe introuvable dans les registres : {api_name}")
+            FAILED_TEAMS.add(api_name)
+    return None
+
 def get_match_result_for_team(team_name, score, team1, team2):
     try:
         home_score, away_score = map(int, score.split(' - '))
     except Exception:
         return None
     
-    # Utiliser le mapping pour comparer correctement
-    mapped_team_name = team_name_mapping.get(team_name, team_name)
-    mapped_team1 = team_name_mapping.get(team1, team1)
-    mapped_team2 = team_name_mapping.get(team2, team2)
+    # Résolution unifiée des noms (mapping, accents, casse, similarité)
+    cote = cote_equipe(team_name, team1, team2)
     
-    if mapped_team_name == mapped_team1:
+    if cote == "home":
         return 'W' if home_score > away_score else 'D' if home_score == away_score else 'L'
-    elif mapped_team_name == mapped_team2:
+    elif cote == "away":
         return 'W' if away_score > home_score else 'D' if away_score == home_score else 'L'
     return None
 
@@ -3179,14 +2551,12 @@ def extract_goals(team_name, score, team1, team2):
     except Exception:
         return None, None, None
     
-    # Utiliser le mapping pour comparer correctement
-    mapped_team_name = team_name_mapping.get(team_name, team_name)
-    mapped_team1 = team_name_mapping.get(team1, team1)
-    mapped_team2 = team_name_mapping.get(team2, team2)
+    # Résolution unifiée des noms (mapping, accents, casse, similarité)
+    cote = cote_equipe(team_name, team1, team2)
     
-    if mapped_team_name == mapped_team1:
+    if cote == "home":
         return home_score, away_score, True
-    elif mapped_team_name == mapped_team2:
+    elif cote == "away":
         return away_score, home_score, False
     return None, None, None
 
@@ -3195,16 +2565,14 @@ def get_form_points(recent_form):
     total = sum(points_map.get(r, 0) for r in recent_form)
     return total
 
-import re as _re_module  # (déjà importé "re" dans Analyse.py, garder l'import existant en haut du fichier)
-
 def extract_team_id_from_url(url):
     """
-    Extrait l'ID d'équipe ESPN depuis l'URL stockée dans teams_urls.
+    Extrait l'ID d'équipe ESPN depuis une URL des registres (fait une fois par équipe, voir equipes_espn).
     Ex: https://www.espn.com/football/team/results/_/id/103/ac-milan -> "103"
     """
     if not url:
         return None
-    match = _re_module.search(r"/id/(\d+)/", url)
+    match = REGEX_ID_EQUIPE_ESPN.search(url)
     return match.group(1) if match else None
 
 
@@ -3215,12 +2583,8 @@ def fetch_espn_team_events(team_id, limit=10):
     Retourne une liste d'objets match au même format que l'ancien scraping.
     """
     url = f"https://site.web.api.espn.com/apis/site/v2/sports/soccer/all/teams/{team_id}/schedule"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36"
-    }
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, timeout=15)
         response.raise_for_status()
         data = response.json()
     except Exception as e:
@@ -3291,8 +2655,8 @@ def scrape_team_data(team_name, action):
     scraping BeautifulSoup basé sur les classes CSS Table__TR, matchTeams, etc.)
     """
     espn_team_name = get_espn_name(team_name)
-    url = teams_urls.get(espn_team_name, {}).get(action)
-    team_id = extract_team_id_from_url(url)
+    equipe = equipes_espn().get(espn_team_name, {})
+    team_id = equipe.get("id") if equipe.get(action) else None
 
     if not team_id:
         print(f"URL/ID non trouvé pour {espn_team_name} et action {action}.")
@@ -3324,9 +2688,7 @@ def scrape_team_data(team_name, action):
             if len(form_6) < 6:
                 form_6.append(result)
 
-            mapped_team1 = team_name_mapping.get(team1, team1)
-            mapped_espn_name = team_name_mapping.get(espn_team_name, espn_team_name)
-            is_home = (mapped_team1 == mapped_espn_name)
+            is_home = cote_equipe(espn_team_name, team1, team2) == "home"
             if is_home:
                 serie_domicile.append(result)
             else:
@@ -3375,13 +2737,192 @@ def scrape_team_data(team_name, action):
         "total_points": total_points_6
     }
 
-def compare_teams_basic_stats(
+def analyser_et_consigner(tache, date_str, reprise=False):
+    """
+    Analyse le match (ordre, fixture) en deux étapes, données puis IA, avec un point de contrôle après chacune,
+    et écrit sa prédiction dans le flux. En reprise, un match terminé est relu tel quel, un match ignoré
+    (équipe inconnue, forme vide) n'est pas refait et un match dont seule l'IA a échoué ne refait que l'étape IA.
+    Retourne True si une prédiction a été écrite.
+    """
+    ordre, fixture = tache
+    match = f"{fixture['home_api']} vs {fixture['away_api']}"
+    point = lire_point_controle(date_str, fixture) if reprise else None
+    etapes = point["etapes"] if point else {}
+    if etapes.get("donnees") == "incomplet":
+        echecs = etapes.get("sources_en_echec", {})
+        print(f"🔁 Reprise : données de {match} incomplètes ({', '.join(f'{source} : {erreur}' for source, erreur in echecs.items())}), match refait")
+        etapes = {}
+
+    if etapes.get("donnees") == "ignore":
+        print(f"⏭️ Reprise : {match} ignoré lors de l'exécution précédente, non refait")
+        return False
+    if etapes.get("ia") == "ok":
+        print(f"⏭️ Reprise : {match} déjà terminé, relu depuis le point de contrôle")
+        prediction_obj = point["prediction"]
+    else:
+        if etapes.get("donnees") == "ok":
+            print(f"♻️ Reprise : données de {match} déjà collectées, seule l'analyse IA est refaite")
+            prediction_obj = point["prediction"]
+            etapes = {"donnees": "ok"}
+        else:
+            prediction_obj = analyser_fixture(fixture, avec_ia=False)
+            if not prediction_obj:
+                # Équipe inconnue ou forme inexploitable : point de contrôle terminal, pas de nouveau scraping en reprise
+                enregistrer_point_controle(date_str, fixture, None, {"donnees": "ignore"})
+                return False
+            echecs = sources_en_echec(fixture)
+            etapes = {"donnees": "incomplet", "sources_en_echec": echecs} if echecs else {"donnees": "ok"}
+            enregistrer_point_controle(date_str, fixture, prediction_obj, etapes)
+        executer_etape_ia(prediction_obj, date_str)
+        etapes["ia"] = "echec" if analyse_en_echec(prediction_obj.get("analyse_ia")) else "ok"
+        enregistrer_point_controle(date_str, fixture, prediction_obj, etapes)
+
+    consigner_prediction(chemin_flux_predictions(date_str), ordre, prediction_obj, fixture.get("fixture_id"))
+    return True
+
+def sources_en_echec(fixture):
+    """
+    Sources de l'étape données dont le téléchargement a échoué pour ce match, avec l'erreur HTTP ou de scraping
+    ({"classement": ..., "cotes": ...}) : lues dans les caches de l'exécution, sans nouvel appel.
+    Une ligue sans classement ou sans cotes prévus, ou une réponse valide mais vide, n'est pas un échec.
+    """
+    league_info = info_ligue(fixture["country"], fixture["league"], fixture.get("league_id"))
+    if not league_info:
+        return {}
+    echecs = {}
+    if league_info.get("url"):
+        erreur = get_classement_scraper(league_info["url"]).erreur
+        if erreur:
+            echecs["classement"] = erreur
+    odds_id = league_info.get("odds_id", "none")
+    if odds_id != "none" and get_cotes_ligue(odds_id) is None:
+        echecs["cotes"] = ERREURS_COTES.get(odds_id, "échec")
+    return echecs
+
+# 📍 Points de contrôle par match : runs/YYYY-MM-DD/fixtures/<id API-Football>.json
+def chemin_point_controle(date_str, fixture):
+    identifiant = fixture.get("fixture_id") or cle_fixture(fixture["date"], fixture["home_api"], fixture["away_api"])
+    return os.path.join(DOSSIER_RUNS, date_str, "fixtures", f"{identifiant}.json")
+
+def lire_point_controle(date_str, fixture):
+    """Point de contrôle du match ({etapes, prediction}) ou None s'il n'existe pas ou est illisible."""
+    chemin = chemin_point_controle(date_str, fixture)
+    try:
+        with open(chemin, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Point de contrôle illisible {chemin} : {e}")
+        return None
+
+def enregistrer_point_controle(date_str, fixture, prediction_obj, etapes):
+    """Écrit le point de contrôle du match (remplacement atomique : jamais de fichier à moitié écrit)."""
+    chemin = chemin_point_controle(date_str, fixture)
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "w", encoding="utf-8") as f:
+        json.dump({"fixture": fixture, "etapes": etapes, "prediction": prediction_obj}, f, ensure_ascii=False)
+    os.replace(temporaire, chemin)
+
+# 🧾 Flux NDJSON : une ligne {"ordre", "fixture_id", "prediction"} par match terminé, en ajout seul
+_VERROU_FLUX = threading.Lock()
+
+def chemin_flux_predictions(date_str):
+    return os.path.join(DOSSIER_RUNS, date_str, "predictions.ndjson")
+
+def nettoyer_runs(date_str):
+    """Supprime les dossiers runs/ de plus de RUNS_JOURS_CONSERVES jours (persistés par actions/cache)."""
+    if not os.path.isdir(DOSSIER_RUNS):
+        return
+    limite = (datetime.strptime(date_str, "%Y-%m-%d") - timedelta(days=RUNS_JOURS_CONSERVES)).strftime("%Y-%m-%d")
+    for nom in os.listdir(DOSSIER_RUNS):
+        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", nom) and nom < limite:
+            shutil.rmtree(os.path.join(DOSSIER_RUNS, nom), ignore_errors=True)
+            print(f"🧹 Dossier d'exécution {nom} supprimé")
+
+def initialiser_flux_predictions(date_str, vider=True):
+    """Crée le flux NDJSON de l'exécution du jour (vidé, sauf en reprise) et retourne son chemin."""
+    chemin = chemin_flux_predictions(date_str)
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    open(chemin, "w" if vider else "a", encoding="utf-8").close()
+    return chemin
+
+def consigner_prediction(chemin, ordre, prediction_obj, fixture_id=None):
+    """Ajoute la prédiction au flux et force l'écriture sur disque : un crash ne perd que le match en cours."""
+    ligne = json.dumps(
+        {"ordre": ordre, "fixture_id": fixture_id, "prediction": prediction_obj},
+        ensure_ascii=False, separators=(",", ":")
+    )
+    with _VERROU_FLUX:
+        with open(chemin, "a", encoding="utf-8") as f:
+            f.write(ligne + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+def lire_entrees_flux(chemin):
+    """
+    Entrées {"ordre", "fixture_id", "prediction"} du flux dans l'ordre des matchs. Dernière ligne retenue par
+    match (fixture_id, à défaut ordre) : une reprise réécrit ses matchs avec l'ordre courant. Ligne tronquée ignorée.
+    """
+    par_match = {}
+    with open(chemin, "r", encoding="utf-8") as f:
+        for numero, ligne in enumerate(f, 1):
+            if not ligne.strip():
+                continue
+            try:
+                entree = json.loads(ligne)
+            except ValueError:
+                print(f"⚠️ Ligne {numero} du flux {chemin} illisible (écriture interrompue ?) : ignorée")
+                continue
+            par_match[entree.get("fixture_id") or f"ordre-{entree['ordre']}"] = entree
+    return sorted(par_match.values(), key=lambda entree: entree["ordre"])
+
+def finaliser_depuis_flux(date_str, fixture_ids=None):
+    """
+    Produit le fichier du jour à partir du flux NDJSON, ids attribués dans l'ordre de l'API
+    (identiques quel que soit le parallélisme). Retourne son chemin, ou None si le flux est vide.
+    fixture_ids (matchs de l'exécution courante) écarte les entrées d'une exécution précédente dont le match
+    n'est plus proposé par l'API (reporté, filtré) ; sans lui (--finaliser-flux), tout le flux est retenu.
+    """
+    chemin_flux = chemin_flux_predictions(date_str)
+    if not os.path.exists(chemin_flux):
+        print(f"⚠️ Aucun flux de prédictions pour le {date_str} ({chemin_flux})")
+        return None
+    entrees = lire_entrees_flux(chemin_flux)
+    if fixture_ids is not None:
+        fixture_ids = set(fixture_ids)
+        for entree in entrees:
+            if entree.get("fixture_id") not in fixture_ids:
+                prediction_obj = entree["prediction"]
+                print(f"🗑️ {prediction_obj.get('HomeTeam')} vs {prediction_obj.get('AwayTeam')} absent des matchs du jour : retiré du fichier")
+        entrees = [entree for entree in entrees if entree.get("fixture_id") in fixture_ids]
+    résultats = []
+    for entree in entrees:
+        enregistrer_prediction(entree["prediction"], résultats)
+    if not résultats:
+        return None
+    chemin = sauvegarder_stats_brutes_json(résultats, date_str)
+    retirer_prediction_precoce(date_str)
+    return chemin
+
+def enregistrer_prediction(prediction_obj, résultats):
+    """Attribue l'id définitif (rang dans les résultats du fichier du jour) et ajoute la prédiction aux résultats."""
+    prediction_obj["id"] = len(résultats) + 1
+    résultats.append(prediction_obj)
+
+def analyser_confrontation(
     t1, t2, name1, name2, match_date="N/A", match_time="N/A",
-    league="N/A", country="N/A", logo_home=None, logo_away=None, résultats=None
+    league="N/A", country="N/A", logo_home=None, logo_away=None, avec_ia=True, league_id=None
 ):
+    """
+    Construit le prediction_obj complet d'un match (classement, cotes, H2H, Monte-Carlo, IA).
+    L'id n'est pas attribué ici : il l'est par enregistrer_prediction, à la finalisation.
+    avec_ia=False retourne le prediction_obj avant l'étape IA (points de contrôle, reprise).
+    """
     if not t1 or not t2:
         print("⚠️ Données insuffisantes pour la comparaison.")
-        return
+        return None
 
     # Vérifier si une équipe a une forme récente totalement vide (0 point)
     points1 = get_form_points(t1.get('form_6', []))
@@ -3390,15 +2931,15 @@ def compare_teams_basic_stats(
     if points1 == 0:
         print(f"🚫 {name1} a une forme totalement vide (0 point), match ignoré.")
         IGNORED_ZERO_FORM_TEAMS.append(name1)
-        return
+        return None
     if points2 == 0:
         print(f"🚫 {name2} a une forme totalement vide (0 point), match ignoré.")
         IGNORED_ZERO_FORM_TEAMS.append(name2)
-        return
+        return None
 
     # 🏆 Récupération classement des équipes - utiliser le mapping (modifié pour récupérer le classement complet)
-    pos_home, nom_classement_home, pts_home, full_standings_home = get_team_classement_position(country, league, name1)
-    pos_away, nom_classement_away, pts_away, full_standings_away = get_team_classement_position(country, league, name2)
+    pos_home, nom_classement_home, pts_home, full_standings_home = get_team_classement_position(country, league, name1, league_id)
+    pos_away, nom_classement_away, pts_away, full_standings_away = get_team_classement_position(country, league, name2, league_id)
 
     if pos_home:
         print(f"📌 Classement de {nom_classement_home} : {pos_home}ᵉ avec {pts_home} points")
@@ -3410,7 +2951,7 @@ def compare_teams_basic_stats(
     home_espn = get_espn_name(name1)
     away_espn = get_espn_name(name2)
     
-    league_info = classement_ligue_mapping.get(country, {}).get(league)
+    league_info = info_ligue(country, league, league_id)
     odds_id = league_info.get("odds_id", "none") if league_info else "none"
     
     odds_data = get_odds_for_match(odds_id, name1, name2, home_espn, away_espn)
@@ -3434,7 +2975,7 @@ def compare_teams_basic_stats(
 
     # ✅ CRÉATION DE L'OBJET AVEC NOUVELLE STRUCTURE DES MATCHS + STATS DÉTAILLÉES
     prediction_obj = {
-        "id": len(PREDICTIONS) + 1,
+        "id": None,  # attribué dans l'ordre des matchs par enregistrer_prediction
         "HomeTeam": name1,
         "AwayTeam": name2,
         "date": format_date_fr(match_date, match_time),
@@ -3505,7 +3046,8 @@ def compare_teams_basic_stats(
         prediction_obj["stats_home"], 
         prediction_obj["stats_away"],
         h2h_data=confrontations_h2h,
-        n=20000
+        n=MONTE_CARLO_ITERATIONS,
+        fixture_id=cle_fixture(match_date, name1, name2)
     )
 
     print("\n🎯 PROBABILITÉS STATISTIQUES (Monte-Carlo + base mondiale + H2H)")
@@ -3514,17 +3056,58 @@ def compare_teams_basic_stats(
     # Ajouter au JSON final (reste disponible dans les données mais PAS dans le prompt IA)
     prediction_obj["Probabilites"] = probabilites_mc
 
+    if not avec_ia:
+        return prediction_obj
+    return executer_etape_ia(prediction_obj)
+
+def executer_etape_ia(prediction_obj, date_str=None, publication_precoce=True):
+    """
+    Étape IA d'un match : prompt, appel Groq (publication anticipée du noyau) et champs extraits.
+    date_str : date de l'exécution (fichier du jour), pour nommer le fichier anticipé.
+    publication_precoce=False : pas de fichier anticipé (relance d'un fichier déjà finalisé).
+    """
     # 🔮 Génération d'analyse IA avec DeepSeek (AVEC RETRY AUTOMATIQUE + STATS DÉTAILLÉES + NOUVELLES FONCTIONNALITÉS SANS MONTE-CARLO DANS LE PROMPT)
     print(f"\n🧠 Lancement de l'analyse IA DeepSeek avec retry automatique + stats détaillées + H2H enrichi + confiance + scores (sans Monte-Carlo dans le prompt)...")
-    prompt = generate_detailed_prompt(prediction_obj)
-    analyse_ia = call_deepseek_analysis(prompt, max_retries=5)  # ✅ 5 tentatives max
+    prompt, tokens_prompt = construire_prompt(prediction_obj)
+    print(f"🧾 Prompt {PROMPT_MODE} : ~{tokens_prompt} tokens estimés")
+    analyse_ia = call_deepseek_analysis(
+        prompt, max_retries=5,  # ✅ 5 tentatives max
+        sur_noyau=(lambda champs: publier_prediction_precoce(prediction_obj, champs, date_str)) if publication_precoce else None
+    )
+
+    prediction_obj["prompt_tokens_estimes"] = tokens_prompt  # ✅ Suivi du coût d'entrée par match
+    appliquer_analyse_ia(prediction_obj, analyse_ia)
+
+    print("\n📚 Note : Statistiques brutes avec cotes + analyse IA DeepSeek avec retry + matchs complets avec stats détaillées + classement complet + H2H enrichi avec stats + confiance + scores + extraction améliorée des deux formats + PROBABILITÉS MONTE-CARLO INTÉGRÉES (non incluses dans le prompt IA).")
 
-    # ✅ NOUVELLES EXTRACTIONS AMÉLIORÉES AVEC SUPPORT DES DEUX FORMATS
-    confiance_pourcentage = extract_confidence_percentage(analyse_ia)
-    prediction_principale = extract_prediction_principale(analyse_ia)
-    corners_prevu = extract_corners_prevu(analyse_ia)  # Gardé dans la structure mais IA ne prédit plus
-    tirs_cadres_prevu = extract_tirs_cadres_prevu(analyse_ia)  # Gardé dans la structure mais IA ne prédit plus
-    scores_probables = extract_scores_probables(analyse_ia)
+    return prediction_obj
+
+def analyse_en_echec(analyse_ia):
+    """Vrai si l'analyse IA est un message d'échec (toutes les tentatives Groq ont échoué)."""
+    return not isinstance(analyse_ia, str) or analyse_ia.startswith("❌")
+
+def appliquer_analyse_ia(prediction_obj, analyse_ia):
+    """
+    Renseigne analyse_ia et les champs extraits (confiance, prédiction, scores...) du prediction_obj.
+    Une réponse JSON structurée fournit directement les champs (analyse_ia est alors reformatée en texte
+    lisible, pour affichage seulement) ; les extracteurs regex ne servent qu'aux réponses texte.
+    """
+    champs_json = decoder_analyse_json(analyse_ia)
+    if champs_json:
+        # 🧩 Réponse structurée : champs lus dans le JSON, un champ absent reste None
+        print("🧩 Réponse IA structurée (JSON) décodée")
+        champs = {champ: champs_json.get(champ) for champ in CHAMPS_EXTRACTION_IA}
+        analyse_ia = formater_analyse_json(champs_json)
+    else:
+        # 🔎 Réponse texte : extraction en une passe (SUPPORT DES DEUX FORMATS)
+        champs = extraire_champs_analyse(analyse_ia)
+    comptabiliser_extraction(champs, en_echec=analyse_en_echec(analyse_ia))
+
+    confiance_pourcentage = champs["confiance_pourcentage"]
+    prediction_principale = champs["prediction_principale"]
+    corners_prevu = champs["corners_prevu"]  # Gardé dans la structure mais IA ne prédit plus
+    tirs_cadres_prevu = champs["tirs_cadres_prevu"]  # Gardé dans la structure mais IA ne prédit plus
+    scores_probables = champs["scores_probables"]
 
     prediction_obj["analyse_ia"] = analyse_ia
     prediction_obj["confiance_pourcentage"] = confiance_pourcentage  # ✅ Champ dédié
@@ -3555,11 +3138,8 @@ def compare_teams_basic_stats(
     if scores_probables:
         print(f"⚽ Scores probables extraits : {scores_probables}")
 
-    PREDICTIONS.append(prediction_obj)
-    if résultats is not None:
-        résultats.append(prediction_obj)
+    return prediction_obj
 
-    print("\n📚 Note : Statistiques brutes avec cotes + analyse IA DeepSeek avec retry + matchs complets avec stats détaillées + classement complet + H2H enrichi avec stats + confiance + scores + extraction améliorée des deux formats + PROBABILITÉS MONTE-CARLO INTÉGRÉES (non incluses dans le prompt IA).")
 
 def process_team(team_name, return_data=False):
     print(f"\n🧠 Analyse pour l'équipe : {get_espn_name(team_name)}")
@@ -3567,6 +3147,15 @@ def process_team(team_name, return_data=False):
     print("\n" + "-" * 60 + "\n")
     return data if return_data else None
 
+def description_simulations():
+    """Réglage Monte-Carlo de l'exécution, en clair (ex: "20 000 simulations"), pour les métadonnées."""
+    if SIMULATION_METHODE == "exact":
+        return "calcul Poisson exact, sans simulation"
+    iterations = f"{MONTE_CARLO_ITERATIONS:,}".replace(",", " ")
+    if MONTE_CARLO_ADAPTATIF:
+        return f"jusqu'à {iterations} simulations, précision ±{MONTE_CARLO_PRECISION} pts"
+    return f"{iterations} simulations"
+
 # ✅ MODIFIÉ : Fonction de sauvegarde avec NOUVEAU nom de fichier simple
 def sauvegarder_stats_brutes_json(predictions_simples, date_str):
     total_predictions = len(predictions_simples)
@@ -3584,15 +3173,21 @@ def sauvegarder_stats_brutes_json(predictions_simples, date_str):
             "note": "Collecte des statistiques brutes complètes : moyennes, formes récentes (6 et 10 matchs), séries domicile/extérieur, classements avec points + cotes des bookmakers + analyse IA DeepSeek ENRICHIE avec matchs détaillés (nouvelle structure objet avec game_id, date, home_team, away_team, score, status, competition + STATS DÉTAILLÉES ESPN) + classement complet + confrontations directes H2H élargies AVEC STATS DÉTAILLÉES + pourcentage confiance EXTRAIT AUTOMATIQUEMENT + 2 scores probables + retry automatique IA + suppression 'match nul' + EXTRACTION AMÉLIORÉE support des 2 formats (**FORMAT** et FORMAT simple) + PROBABILITÉS MONTE-CARLO autonomes (calculées mais NON incluses dans le prompt IA)",
             "ia_model": "deepseek-r1-distill-llama-70b",
             "groq_keys_count": len(groq_keys),
+            "hedging_llm": rapport_hedging() if LLM_HEDGING else None,
+            "extraction_ia": rapport_extraction(),
             "monte_carlo": {
                 "enabled": True,
-                "iterations": 20000,
+                "methode": SIMULATION_METHODE,
+                "iterations": MONTE_CARLO_ITERATIONS,
+                "iterations_adaptatives": MONTE_CARLO_ADAPTATIF,
+                "echantillonnage": MONTE_CARLO_ECHANTILLONNAGE,
+                "precision_cible_ic95": MONTE_CARLO_PRECISION if MONTE_CARLO_ADAPTATIF else None,
                 "calibrage": "moyennes_internationales + statistiques_équipes + ajustement_h2h",
                 "probabilites_calculees": ["1x2", "double_chance", "over_under", "btts", "resultat_total", "scores_probables"],
                 "inclus_dans_prompt_ia": False
             },
             "nouveautes_v8_3_modifiees": [
-                "🎲 Module de probabilités Monte-Carlo intégré (20 000 simulations)",
+                f"🎲 Module de probabilités Monte-Carlo intégré ({description_simulations()})",
                 "🔢 Calibrage avec moyennes internationales FIFA/UEFA",
                 "🆚 Ajustement automatique selon les confrontations H2H",
                 "📊 Probabilités 1X2, Double Chance, Over/Under (0.5→5.5), BTTS",
@@ -3616,9 +3211,73 @@ def sauvegarder_stats_brutes_json(predictions_simples, date_str):
         json.dump(data_complete, f, ensure_ascii=False, indent=2)
     print(f"✅ Statistiques brutes complètes avec cotes et analyse IA enrichie sauvegardées dans : {nom_fichier}")
     print(f"📊 Total: {total_predictions} analyses complètes avec cotes + IA DeepSeek enrichie + retry + H2H enrichi avec stats + nouvelles fonctionnalités + extraction améliorée 2 formats + PROBABILITÉS MONTE-CARLO (hors prompt IA)")
+
+    if SORTIES_ALLEGEES:
+        try:
+            sauvegarder_sorties_allegees(predictions_simples, date_str)
+        except OSError as e:
+            print(f"⚠️ Sorties allégées non écrites : {e}")
     
     return nom_fichier
 
+# 📦 Index résumé (cartes de la PWA) + détails par match, en JSON compact et précompressé
+CHAMPS_RESUME = (
+    "id", "HomeTeam", "AwayTeam", "date", "league", "country_fr", "logo_home", "logo_away",
+    "prediction_principale", "confiance_pourcentage", "scores_probables"
+)
+PROBABILITES_RESUME = ("1x2", "double_chance", "over_under", "btts", "scores_probables")
+
+def ecrire_json_compact(chemin, donnees):
+    """Écrit donnees en JSON compact et sa variante .gz (mtime fixe : pas de diff si rien ne change). Retourne les tailles."""
+    contenu = json.dumps(donnees, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    compresse = gzip.compress(contenu, compresslevel=9, mtime=0)
+    dossier = os.path.dirname(chemin)
+    if dossier:
+        os.makedirs(dossier, exist_ok=True)
+    with open(chemin, "wb") as f:
+        f.write(contenu)
+    with open(chemin + ".gz", "wb") as f:
+        f.write(compresse)
+    return len(contenu), len(compresse)
+
+def resume_prediction(prediction, chemin_detail):
+    """Entrée de l'index : équipes, horaire, prédiction, confiance et probabilités clés, plus le chemin du détail."""
+    resume = {champ: prediction.get(champ) for champ in CHAMPS_RESUME}
+    probabilites = prediction.get("Probabilites") or {}
+    resume["Probabilites"] = {cle: probabilites[cle] for cle in PROBABILITES_RESUME if cle in probabilites}
+    resume["detail"] = chemin_detail
+    return resume
+
+def sauvegarder_sorties_allegees(predictions_simples, date_str):
+    """
+    Écrit prédiction-YYYY-MM-DD-index.json (résumé de chaque match) et DOSSIER_DETAILS/YYYY-MM-DD/<id>.json
+    (détail complet d'un match), chacun avec sa variante .json.gz, à côté du fichier complet du jour.
+    """
+    dossier = f"{DOSSIER_DETAILS}/{date_str}"
+    if os.path.isdir(dossier):
+        # Détails d'une exécution précédente du même jour (ids réattribués)
+        for nom in os.listdir(dossier):
+            if nom.endswith((".json", ".json.gz")):
+                os.remove(os.path.join(dossier, nom))
+
+    resumes = []
+    taille_details = 0
+    for prediction in predictions_simples:
+        chemin_detail = f"{dossier}/{prediction['id']}.json"
+        taille_details += ecrire_json_compact(chemin_detail, prediction)[0]
+        resumes.append(resume_prediction(prediction, chemin_detail))
+
+    nom_index = f"prédiction-{date_str}-index.json"
+    taille, taille_gz = ecrire_json_compact(nom_index, {
+        "date": date_str,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "count": len(resumes),
+        "matches": resumes
+    })
+    print(f"📦 Index résumé sauvegardé dans : {nom_index} ({taille / 1024:.1f} Ko, {taille_gz / 1024:.1f} Ko en .gz)")
+    print(f"📦 {len(resumes)} détail(s) par match dans {dossier}/ ({taille_details / 1024:.1f} Ko au total)")
+    return nom_index
+
 def save_failed_teams_json(failed_teams, date_str):
     chemin = f"teams_failed_{date_str}.json"
     data = {"teams_failed": sorted(list(failed_teams))}
@@ -3633,20 +3292,178 @@ def save_ignored_teams_json(ignored_teams, date_str):
         json.dump(data, f, ensure_ascii=False, indent=2)
     print(f"🛑 Équipes ignorées pour forme nulle sauvegardées dans : {chemin}")
 
-def git_commit_and_push(filepath):
+def git_commit_and_push(filepath, message=None):
     try:
         subprocess.run(["git", "config", "--global", "user.email", "github-actions[bot]@users.noreply.github.com"], check=True)
         subprocess.run(["git", "config", "--global", "user.name", "github-actions[bot]"], check=True)
         subprocess.run(["git", "add", filepath], check=True)
-        subprocess.run(["git", "commit", "-m", f"Update predictions {datetime.now().strftime('%Y-%m-%d')}"], check=True)
+        subprocess.run(["git", "commit", "-m", message or f"Update predictions {datetime.now().strftime('%Y-%m-%d')}"], check=True)
         subprocess.run(["git", "push"], check=True)
         print("✅ Fichier poussé avec succès sur GitHub.")
     except subprocess.CalledProcessError as e:
         print(f"❌ Erreur Git : {e}")
 
+def relancer_ia_echouees(chemin):
+    """
+    Recharge un fichier prédiction-YYYY-MM-DD-analyse-ia.json, refait uniquement l'étape IA des matchs dont
+    l'analyse est en échec (prompt reconstruit depuis les données sauvegardées : aucun appel ESPN ni cotes)
+    et réécrit le fichier en place, ainsi que l'index résumé et les détails par match.
+    """
+    with open(chemin, "r", encoding="utf-8") as f:
+        data_complete = json.load(f)
+    details = data_complete.get("statistiques_brutes_avec_ia_hors_montecarlo", {}).get("details", [])
+    echouees = [p for p in details if analyse_en_echec(p.get("analyse_ia"))]
+    print(f"🔁 {len(echouees)} analyse(s) IA en échec sur {len(details)} dans {chemin}")
+    if not echouees:
+        return 0
+
+    metadata = data_complete.setdefault("metadata", {})
+    date_str = metadata.get("date_matchs")
+    if MAX_WORKERS > 1 and len(echouees) > 1:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            list(pool.map(lambda prediction_obj: executer_etape_ia(prediction_obj, date_str, publication_precoce=False), echouees))
+    else:
+        for prediction_obj in echouees:
+            executer_etape_ia(prediction_obj, date_str, publication_precoce=False)
+
+    reussies = sum(1 for p in echouees if not analyse_en_echec(p.get("analyse_ia")))
+    metadata.setdefault("relances_ia", []).append({
+        "date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "relancees": len(echouees),
+        "reussies": reussies
+    })
+
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "w", encoding="utf-8") as f:
+        json.dump(data_complete, f, ensure_ascii=False, indent=2)
+    os.replace(temporaire, chemin)
+    print(f"✅ {reussies}/{len(echouees)} analyse(s) IA rétablie(s), fichier réécrit : {chemin}")
+    if date_str:
+        mettre_a_jour_runs(date_str, echouees)
+
+    if SORTIES_ALLEGEES and date_str:
+        try:
+            sauvegarder_sorties_allegees(details, date_str)
+        except OSError as e:
+            print(f"⚠️ Sorties allégées non écrites : {e}")
+    return reussies
+
+def mettre_a_jour_runs(date_str, predictions):
+    """
+    Reporte des prédictions refaites hors exécution (--relancer-ia) dans runs/DATE/ : points de contrôle
+    (étape IA mise à jour) et flux NDJSON (nouvelle ligne, qui remplace l'ancienne à la lecture), pour
+    qu'une reprise ou un --finaliser-flux ultérieur ne ramène pas les anciennes analyses en échec.
+    Les matchs sont retrouvés par (domicile, extérieur, date).
+    """
+    def cle(prediction_obj):
+        return (prediction_obj.get("HomeTeam"), prediction_obj.get("AwayTeam"), prediction_obj.get("date"))
+
+    par_cle = {cle(p): dict(p, id=None) for p in predictions}  # l'id est réattribué à la finalisation
+    points = 0
+    dossier = os.path.join(DOSSIER_RUNS, date_str, "fixtures")
+    if os.path.isdir(dossier):
+        for nom in sorted(os.listdir(dossier)):
+            if not nom.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(dossier, nom), "r", encoding="utf-8") as f:
+                    point = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Point de contrôle illisible {nom} : {e}")
+                continue
+            prediction_obj = par_cle.get(cle(point.get("prediction") or {}))  # None : match ignoré
+            if prediction_obj is not None:
+                etapes = dict(point.get("etapes", {}))
+                etapes["ia"] = "echec" if analyse_en_echec(prediction_obj.get("analyse_ia")) else "ok"
+                enregistrer_point_controle(date_str, point["fixture"], prediction_obj, etapes)
+                points += 1
+
+    lignes = 0
+    chemin_flux = chemin_flux_predictions(date_str)
+    if os.path.exists(chemin_flux):
+        for entree in lire_entrees_flux(chemin_flux):
+            prediction_obj = par_cle.get(cle(entree["prediction"]))
+            if prediction_obj is not None:
+                consigner_prediction(chemin_flux, entree["ordre"], prediction_obj, entree.get("fixture_id"))
+                lignes += 1
+    if points or lignes:
+        print(f"📍 runs/{date_str} mis à jour : {points} point(s) de contrôle, {lignes} ligne(s) de flux")
+
+def fichiers_predictions():
+    """Fichiers prédiction-*-analyse-ia.json présents dans le dossier courant, triés par date."""
+    return sorted(
+        nom for nom in os.listdir(".")
+        if nom.startswith("prédiction-") and nom.endswith("-analyse-ia.json")
+    )
+
+def benchmark_extraction(fichiers=None, repetitions=20):
+    """
+    Compare l'extraction en une passe à l'extraction champ par champ sur les analyse_ia
+    déjà sauvegardées : temps, accélération, concordance des résultats et champs manquants.
+    """
+    textes = []
+    for fichier in fichiers or fichiers_predictions():
+        try:
+            with open(fichier, "r", encoding="utf-8") as f:
+                details = json.load(f).get("statistiques_brutes_avec_ia_hors_montecarlo", {}).get("details", [])
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Fichier ignoré {fichier} : {e}")
+            continue
+        textes.extend(d["analyse_ia"] for d in details if isinstance(d.get("analyse_ia"), str))
+
+    if not textes:
+        print("⚠️ Aucune analyse IA sauvegardée à mesurer")
+        return None
+
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        reference = [_extraire_champs_par_champ(texte) for texte in textes]
+    duree_reference = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        resultats = [extraire_champs_analyse(texte) for texte in textes]
+    duree_une_passe = time.perf_counter() - debut
+
+    for champs, texte in zip(resultats, textes):
+        comptabiliser_extraction(champs, en_echec=texte.startswith("❌"))
+
+    rapport = {
+        "analyses": len(textes),
+        "repetitions": repetitions,
+        "champ_par_champ_ms": round(duree_reference * 1000 / repetitions, 2),
+        "une_passe_ms": round(duree_une_passe * 1000 / repetitions, 2),
+        "acceleration": round(duree_reference / duree_une_passe, 2) if duree_une_passe else None,
+        "resultats_identiques": reference == resultats,
+        "champs": rapport_extraction()
+    }
+    print(f"🔎 Benchmark extraction IA : {json.dumps(rapport, ensure_ascii=False, indent=2)}")
+    return rapport
+
 def main():
+    parser = argparse.ArgumentParser(description="Analyse des matchs du jour")
+    parser.add_argument("--benchmark-extraction", action="store_true",
+                        help="Mesure l'extraction des champs IA sur les fichiers de prédiction existants")
+    parser.add_argument("--reprendre", action="store_true",
+                        help="Reprend l'exécution du jour : matchs terminés relus, étapes manquantes ou en échec refaites")
+    parser.add_argument("--relancer-ia", metavar="FICHIER",
+                        help="Refait uniquement les analyses IA en échec d'un fichier prédiction-*.json et le réécrit")
+    parser.add_argument("--finaliser-flux", metavar="YYYY-MM-DD",
+                        help="Produit le fichier du jour depuis le flux NDJSON d'une exécution interrompue")
+    args = parser.parse_args()
+
+    if args.benchmark_extraction:
+        benchmark_extraction()
+        return
+    if args.relancer_ia:
+        relancer_ia_echouees(args.relancer_ia)
+        return
+    if args.finaliser_flux:
+        finaliser_depuis_flux(args.finaliser_flux)
+        return
+
     print("📊 Lancement de l'analyse des matchs du jour...")
-    get_today_matches_filtered()
+    get_today_matches_filtered(reprise=args.reprendre)
     print(f"\n✅ Analyse terminée !")
 
 if __name__ == "__main__":
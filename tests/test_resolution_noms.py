@@ -0,0 +1,56 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import Analyse
+
+
+@pytest.mark.parametrize("nom", [
+    "Real Madrid B",
+    "Real Madrid Castilla",
+    "Barcelona B",
+    "Barcelona Atlètic",
+    "Manchester United W",
+    "Manchester United Women",
+    "Borussia Dortmund II",
+    "Benfica B",
+    "Sporting CP B",
+    "Chelsea U21",
+    "Arsenal Women",
+    "Jong Ajax",
+])
+def test_equipes_reserves_feminines_jeunes_non_resolues(nom):
+    assert Analyse.resoudre_nom_espn(nom) is None
+
+
+@pytest.mark.parametrize("nom, attendu", [
+    ("Atletico Madrid", "Atlético Madrid"),
+    ("Paris Saint Germain", "Paris Saint-Germain"),
+    ("Borussia Monchengladbach", "Borussia Mönchengladbach"),
+    ("Brentford FC", "Brentford"),
+    ("Willem II", "Willem II"),
+])
+def test_variantes_equipe_premiere_resolues(nom, attendu):
+    assert Analyse.resoudre_nom_espn(nom) == attendu
+
+
+def test_marqueurs_identiques_restent_comparables():
+    forme_a = Analyse.normaliser_nom_equipe("Real Madrid B")
+    forme_b = Analyse.normaliser_nom_equipe("Real Madrid B FC")
+    assert Analyse.similarite_noms(forme_a, forme_b) >= Analyse.SEUIL_SIMILARITE_NOMS
+
+
+def test_cote_equipe_ne_confond_pas_la_reserve():
+    assert Analyse.cote_equipe("Benfica B", "Benfica", "Porto") is None
+    assert Analyse.cote_equipe("Benfica", "Benfica", "Porto") == "home"
+
+
+def test_aucun_club_du_registre_resolu_vers_un_autre():
+    noms = list(Analyse.equipes_espn())
+    for i, nom in enumerate(noms):
+        resolu = Analyse.IndexNoms(noms[:i] + noms[i + 1:]).resoudre(nom)
+        if resolu is not None:
+            assert Analyse.normaliser_nom_equipe(resolu) == Analyse.normaliser_nom_equipe(nom)